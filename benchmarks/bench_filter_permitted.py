@@ -0,0 +1,105 @@
+"""Compare request.filter_permitted with a request.has_permission loop.
+
+The resources are siblings below a two-level ACL lineage, and every tenth
+one has an ACL of its own denying the permission, so both the shared and
+the per-resource ACLs are consulted.
+"""
+import argparse
+import timeit
+
+from pyramid import testing
+from pyramid.authorization import (
+    ACLHelper,
+    Allow,
+    Authenticated,
+    Deny,
+    Everyone,
+)
+
+
+class Resource:
+    def __init__(self, name, parent, acl=None):
+        self.__name__ = name
+        self.__parent__ = parent
+        if acl is not None:
+            self.__acl__ = acl
+
+
+class SecurityPolicy:
+    principals = [Everyone, Authenticated, 'userid', 'group:editors']
+
+    def __init__(self):
+        self.helper = ACLHelper()
+
+    def identity(self, request):
+        return 'userid'
+
+    def authenticated_userid(self, request):
+        return 'userid'
+
+    def permits(self, request, context, permission):
+        return self.helper.permits(context, self.principals, permission)
+
+    def filter_permitted(self, request, resources, permission):
+        return self.helper.filter_permitted(
+            resources, self.principals, permission
+        )
+
+    def remember(self, request, userid, **kw):
+        return []
+
+    def forget(self, request, **kw):
+        return []
+
+
+def make_resources(count):
+    root = Resource('', None, [(Allow, Authenticated, 'view')])
+    folder = Resource('folder', root, [(Allow, 'group:editors', 'edit')])
+    return [
+        Resource(
+            'item%d' % i,
+            folder,
+            [(Deny, Everyone, 'view')] if i % 10 == 0 else None,
+        )
+        for i in range(count)
+    ]
+
+
+def best(func, number, repeat):
+    return min(timeit.repeat(func, number=number, repeat=repeat)) / number
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--resources', type=int, default=10000)
+    parser.add_argument('--number', type=int, default=10)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args(argv)
+
+    config = testing.setUp()
+    try:
+        config.set_security_policy(SecurityPolicy())
+        request = testing.DummyRequest()
+        resources = make_resources(args.resources)
+
+        def loop():
+            return [
+                resource
+                for resource in resources
+                if request.has_permission('view', resource)
+            ]
+
+        def bulk():
+            return request.filter_permitted(resources, 'view')
+
+        assert loop() == bulk()
+        print('%d sibling resources' % args.resources)
+        for label, func in (('has_permission', loop), ('filter', bulk)):
+            timing = best(func, args.number, args.repeat)
+            print('%-16s %8.2fms' % (label, timing * 1e3))
+    finally:
+        testing.tearDown()
+
+
+if __name__ == '__main__':
+    main()
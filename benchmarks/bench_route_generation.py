@@ -0,0 +1,91 @@
+"""Compare route URL generation with the generator it replaced.
+
+The compiled generator returned by _compile_route is timed against
+``legacy_generator``, a copy of the generator Pyramid 2.0 built, which
+copies and quotes every keyword argument and then applies a %-format.
+"""
+import argparse
+import timeit
+
+from pyramid.traversal import PATH_SAFE, quote_path_segment
+from pyramid.urldispatch import _compile_route, _parse_route
+from pyramid.util import is_nonstr_iter
+
+CASES = [
+    ('no markers', '/foo', {}),
+    ('two markers', '/foo/{a}/{b}', {'a': 'abc', 'b': 123}),
+    (
+        'extra keywords',
+        '/foo/{a}/{b}',
+        {'a': 'abc', 'b': 123, '_app_url': '', 'x': 1, 'y': 'two'},
+    ),
+    ('quoted value', '/foo/{a}', {'a': 'hello world/ünïcode'}),
+    ('star argument', '/foo/{a}*rest', {'a': 'abc', 'rest': ('b', 'c', 'd')}),
+]
+
+
+def legacy_generator(route):
+    parts, remainder = _parse_route(route)
+    gen = []
+    for i, part in enumerate(parts):
+        if i % 2:
+            name, reg = part
+            gen.append('%%(%s)s' % name)
+        else:
+            gen.append(quote_path_segment(part, safe='/').replace('%', '%%'))
+    if remainder:
+        gen.append('%%(%s)s' % remainder)
+    gen = ''.join(gen)
+
+    def q(v):
+        return quote_path_segment(v, safe=PATH_SAFE)
+
+    def generator(dict):
+        newdict = {}
+        for k, v in dict.items():
+            if v.__class__ is bytes:
+                v = v.decode('utf-8')
+            if k == remainder:
+                if is_nonstr_iter(v):
+                    v = '/'.join([q(x) for x in v])
+                else:
+                    if v.__class__ is not str:
+                        v = str(v)
+                    v = q(v)
+            else:
+                if v.__class__ is not str:
+                    v = str(v)
+                v = q(v)
+            newdict[k] = v
+        return gen % newdict
+
+    return generator
+
+
+def best(func, number, repeat):
+    return min(timeit.repeat(func, number=number, repeat=repeat)) / number
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--number', type=int, default=100000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args(argv)
+
+    print('%-16s %10s %10s' % ('case', 'legacy', 'compiled'))
+    for label, pattern, kw in CASES:
+        legacy = legacy_generator(pattern)
+        compiled = _compile_route(pattern)[1]
+        assert legacy(kw) == compiled(kw), pattern
+        timings = [
+            best(lambda: generate(kw), args.number, args.repeat)
+            for generate in (legacy, compiled)
+        ]
+        print(
+            '%-16s %8.2fus %8.2fus'
+            % ((label,) + tuple(t * 1e6 for t in timings))
+        )
+
+
+if __name__ == '__main__':
+    main()
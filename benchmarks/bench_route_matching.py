@@ -0,0 +1,72 @@
+"""Compare the route matcher strategies of RoutesMapper.
+
+For each strategy and route count, time matching the path of the last
+registered route (which the linear scan reaches last) and a path matching no
+route (which every route is tried against by the linear scan).  The routes
+all have replacement markers, so the literal path cache doesn't answer them.
+"""
+import argparse
+import timeit
+
+from pyramid.urldispatch import RoutesMapper
+
+
+class DummyRequest:
+    method = 'GET'
+
+    def __init__(self, path_info):
+        self.path_info = path_info
+
+
+def make_mapper(matcher, count):
+    mapper = RoutesMapper(matcher=matcher)
+    for i in range(count):
+        mapper.connect('route%d' % i, '/section%d/{id}/edit' % i)
+    return mapper
+
+
+def best(func, number, repeat):
+    return min(timeit.repeat(func, number=number, repeat=repeat)) / number
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        '--routes',
+        type=int,
+        nargs='+',
+        default=[10, 100, 1400, 5000],
+        help='route counts to measure (default: %(default)s)',
+    )
+    parser.add_argument(
+        '--matchers',
+        nargs='+',
+        default=['linear', 'tree', 'regex', 'index'],
+        help='matcher strategies to measure (default: %(default)s)',
+    )
+    parser.add_argument('--number', type=int, default=1000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args(argv)
+
+    print(
+        '%-8s %7s %12s %12s' % ('matcher', 'routes', 'last route', 'no route')
+    )
+    for count in args.routes:
+        last = DummyRequest('/section%d/123/edit' % (count - 1))
+        missing = DummyRequest('/missing/123/edit')
+        for matcher in args.matchers:
+            mapper = make_mapper(matcher, count)
+            assert mapper(last)['route'].name == 'route%d' % (count - 1)
+            assert mapper(missing)['route'] is None
+            timings = [
+                best(lambda: mapper(request), args.number, args.repeat)
+                for request in (last, missing)
+            ]
+            print(
+                '%-8s %7d %10.2fus %10.2fus'
+                % ((matcher, count) + tuple(t * 1e6 for t in timings))
+            )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,92 @@
+"""Compare walk_principals_allowed_by_permission with per-resource calls.
+
+The synthetic resource tree is built breadth first with a fixed fan-out,
+and about one resource in a hundred has an ACL of its own, granting or
+denying the permission.  The whole tree is walked once, and
+principals_allowed_by_permission is called for each of its resources.
+"""
+import argparse
+import random
+import time
+
+from pyramid.authorization import ACLHelper, Allow, Deny, Everyone
+
+
+class Resource:
+    def __init__(self, name, parent):
+        self.__name__ = name
+        self.__parent__ = parent
+        self.children = []
+
+    def values(self):
+        return self.children
+
+
+def make_tree(size, fanout, seed=0):
+    rng = random.Random(seed)
+    root = Resource('', None)
+    root.__acl__ = [(Allow, Everyone, 'view'), (Allow, 'group:admin', 'view')]
+    resources = [root]
+    parent_index = 0
+    while len(resources) < size:
+        parent = resources[parent_index]
+        for i in range(min(fanout, size - len(resources))):
+            resource = Resource('r%d' % i, parent)
+            if rng.random() < 0.01:
+                resource.__acl__ = rng.choice(
+                    [
+                        [(Allow, 'group:%d' % rng.randrange(100), 'view')],
+                        [(Deny, 'group:admin', 'view')],
+                        [(Deny, Everyone, 'view')],
+                    ]
+                )
+            parent.children.append(resource)
+            resources.append(resource)
+        parent_index += 1
+    return root, resources
+
+
+def best(func, repeat):
+    timings = []
+    for i in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--size', type=int, default=1000000)
+    parser.add_argument('--fanout', type=int, default=10)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args(argv)
+
+    helper = ACLHelper()
+    root, resources = make_tree(args.size, args.fanout)
+
+    def walk():
+        for resource, allowed in helper.walk_principals_allowed_by_permission(
+            root, 'view'
+        ):
+            pass
+
+    def each():
+        for resource in resources:
+            helper.principals_allowed_by_permission(resource, 'view')
+
+    sample = resources[:: max(1, len(resources) // 1000)]
+    walked = dict(helper.walk_principals_allowed_by_permission(root, 'view'))
+    for resource in sample:
+        assert walked[resource] == helper.principals_allowed_by_permission(
+            resource, 'view'
+        )
+    del walked
+
+    print('%d resources, fan-out %d' % (len(resources), args.fanout))
+    for label, func in (('walk', walk), ('per resource', each)):
+        print('%-14s %8.2fs' % (label, best(func, args.repeat)))
+
+
+if __name__ == '__main__':
+    main()
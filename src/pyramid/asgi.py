@@ -0,0 +1,372 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import contextvars
+import functools
+import inspect
+from io import BytesIO
+import sys
+
+from pyramid.threadlocal import RequestContext
+
+#: The WSGI environ key holding the event loop serving an ASGI request.
+LOOP_KEY = 'pyramid.asgi.loop'
+
+#: The WSGI environ key holding the executor running the synchronous code
+#: awaited by coroutines serving an ASGI request.
+EXECUTOR_KEY = 'pyramid.asgi.executor'
+
+#: The WSGI environ key holding the executor running the synchronous code
+#: awaited by coroutines run by :func:`run_awaitable`.
+HANDLER_EXECUTOR_KEY = 'pyramid.asgi.handler_executor'
+
+# whether the coroutine running in this context was run by run_awaitable,
+# i.e. a thread is blocked waiting for it
+_blocking = contextvars.ContextVar('pyramid.asgi.blocking', default=False)
+
+
+class ASGIRouter:
+    """An :term:`ASGI` application serving the :app:`Pyramid` application
+    behind ``router`` (a :class:`pyramid.router.Router`).
+
+    Each HTTP request is converted into a WSGI environ and runs through the
+    same tweens and views as when the application is served over WSGI.
+    Synchronous code, such as routing, traversal, synchronous tweens and
+    view callables, and exception views, runs in threads of ``executor``
+    (the event loop's default executor if ``None``), so it doesn't block
+    the event loop.  Coroutine tweens and view callables are awaited on the
+    event loop, so a request waiting on one doesn't hold a thread.
+
+    A request is processed in a thread from start to finish when the
+    application has a custom :term:`execution policy`, since the policy
+    is synchronous.
+
+    Synchronous code can only run a coroutine (see :func:`run_awaitable`)
+    by blocking its thread until the coroutine is done.  The synchronous
+    code awaited by such a coroutine therefore runs in a separate thread
+    pool, so that threads blocked on the event loop can't starve it.  The
+    pool is shut down by :meth:`close`, which is called when the ASGI
+    server sends the ``lifespan`` shutdown event.
+
+    The request body is read completely before the request is processed.
+    ``lifespan`` events are acknowledged; other ASGI protocols, such as
+    ``websocket``, are not supported.
+
+    Usually created by :meth:`pyramid.config.Configurator.make_asgi_app`.
+
+    .. versionadded:: 2.1
+    """
+
+    def __init__(self, router, executor=None):
+        # pyramid.router imports this module
+        from pyramid.router import default_execution_policy
+
+        self.router = router
+        self.registry = router.registry
+        self.executor = executor
+        self.handler_executor = ThreadPoolExecutor(
+            thread_name_prefix='pyramid-asgi'
+        )
+        self.default_execution_policy = (
+            router.execution_policy is default_execution_policy
+        )
+
+    async def __call__(self, scope, receive, send):
+        scope_type = scope['type']
+        if scope_type == 'http':
+            await self.handle_http(scope, receive, send)
+        elif scope_type == 'lifespan':
+            await self.handle_lifespan(scope, receive, send)
+        else:
+            raise ValueError('Unsupported ASGI scope type %r' % (scope_type,))
+
+    def close(self):
+        """Shut down the thread pool running the synchronous code awaited on
+        behalf of blocked threads.  ``executor`` is left alone."""
+        self.handler_executor.shutdown(wait=False)
+
+    async def handle_lifespan(self, scope, receive, send):
+        while True:
+            message = await receive()
+            if message['type'] == 'lifespan.startup':
+                await send({'type': 'lifespan.startup.complete'})
+            elif message['type'] == 'lifespan.shutdown':
+                self.close()
+                await send({'type': 'lifespan.shutdown.complete'})
+                return
+
+    async def handle_http(self, scope, receive, send):
+        body = []
+        more_body = True
+        while more_body:
+            message = await receive()
+            if message['type'] == 'http.disconnect':
+                return
+            body.append(message.get('body', b''))
+            more_body = message.get('more_body', False)
+
+        loop = asyncio.get_running_loop()
+        executor = self.executor
+        environ = make_environ(scope, b''.join(body))
+        environ[LOOP_KEY] = loop
+        environ[EXECUTOR_KEY] = executor
+        environ[HANDLER_EXECUTOR_KEY] = self.handler_executor
+        if self.default_execution_policy:
+            router = self.router
+            request = router.request_context(environ).request
+            response = await router.invoke_request_async(request)
+            status, headers, app_iter = _start_response(response, environ)
+        else:
+            status, headers, app_iter = await loop.run_in_executor(
+                executor, self._call_router, environ
+            )
+
+        await send(
+            {
+                'type': 'http.response.start',
+                'status': int(status.split(' ', 1)[0]),
+                'headers': [
+                    (name.lower().encode('latin-1'), value.encode('latin-1'))
+                    for name, value in headers
+                ],
+            }
+        )
+        try:
+            if isinstance(app_iter, (list, tuple)):
+                # the common case: the body is already in memory
+                for chunk in app_iter:
+                    await _send_body(send, chunk)
+            else:
+                # iterating may block, e.g. for a FileResponse
+                chunks = iter(app_iter)
+                while True:
+                    chunk = await loop.run_in_executor(
+                        executor, next, chunks, None
+                    )
+                    if chunk is None:
+                        break
+                    await _send_body(send, chunk)
+        finally:
+            close = getattr(app_iter, 'close', None)
+            if close is not None:
+                await loop.run_in_executor(executor, close)
+        await send({'type': 'http.response.body', 'body': b''})
+
+    def _call_router(self, environ):
+        return _start_response(self.router, environ)
+
+
+def _start_response(app, environ):
+    # call the WSGI application app, returning the status, headers and
+    # iterable it responds with
+    result = []
+
+    def start_response(status, headers, exc_info=None):
+        result[:] = [status, headers]
+
+    app_iter = app(environ, start_response)
+    return result[0], result[1], app_iter
+
+
+async def _send_body(send, chunk):
+    if chunk:
+        await send(
+            {'type': 'http.response.body', 'body': chunk, 'more_body': True}
+        )
+
+
+def make_environ(scope, body):
+    """Return a WSGI environ equivalent to the ASGI HTTP connection
+    ``scope``, with ``body`` (a bytestring) as its ``wsgi.input``.
+
+    The ASGI scope is available as ``environ['asgi.scope']``.
+
+    .. versionadded:: 2.1
+    """
+    # see PEP 3333 for why we encode to utf-8 then decode to latin-1
+    script_name = scope.get('root_path', '').encode('utf-8').decode('latin-1')
+    path_info = scope['path'].encode('utf-8').decode('latin-1')
+    if script_name and path_info.startswith(script_name):
+        path_info = path_info[len(script_name) :]
+    server = scope.get('server') or ('localhost', 80)
+    environ = {
+        'REQUEST_METHOD': scope['method'],
+        'SCRIPT_NAME': script_name,
+        'PATH_INFO': path_info,
+        'QUERY_STRING': scope.get('query_string', b'').decode('latin-1'),
+        'SERVER_NAME': server[0],
+        'SERVER_PORT': str(server[1]),
+        'SERVER_PROTOCOL': 'HTTP/%s' % scope.get('http_version', '1.1'),
+        'wsgi.version': (1, 0),
+        'wsgi.url_scheme': scope.get('scheme', 'http'),
+        'wsgi.input': BytesIO(body),
+        'wsgi.errors': sys.stderr,
+        'wsgi.multithread': True,
+        'wsgi.multiprocess': True,
+        'wsgi.run_once': False,
+        'asgi.scope': scope,
+    }
+    client = scope.get('client')
+    if client:
+        environ['REMOTE_ADDR'] = client[0]
+    for name, value in scope.get('headers', ()):
+        name = name.decode('latin-1')
+        if name == 'content-length':
+            key = 'CONTENT_LENGTH'
+        elif name == 'content-type':
+            key = 'CONTENT_TYPE'
+        else:
+            key = 'HTTP_' + name.upper().replace('-', '_')
+        value = value.decode('latin-1')
+        if key in environ:
+            value = environ[key] + ',' + value
+        environ[key] = value
+    # the body has been read completely, possibly from a chunked request
+    environ['CONTENT_LENGTH'] = str(len(body))
+    return environ
+
+
+def run_awaitable(request, awaitable):
+    """Run ``awaitable`` to completion and return its result, blocking the
+    calling thread.
+
+    When ``request`` is being served by an :class:`ASGIRouter`, the
+    awaitable runs on the event loop serving it; otherwise it runs on a new
+    event loop.  This is how coroutine view callables and tweens are run
+    by synchronous callers, such as
+    :meth:`pyramid.request.Request.invoke_exception_view` or a synchronous
+    tween.  Code running on the event loop can't rely on
+    :func:`pyramid.threadlocal.get_current_request` and should use the
+    request it is given instead.
+
+    A :exc:`RuntimeError` is raised when called from a thread running an
+    event loop, which would be blocked; await ``awaitable`` instead, or use
+    :func:`run_in_thread` to call the synchronous caller.
+
+    .. versionadded:: 2.1
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        pass
+    else:
+        if inspect.iscoroutine(awaitable):
+            awaitable.close()
+        raise RuntimeError(
+            'run_awaitable() cannot be called from a running event loop'
+        )
+    loop = request.environ.get(LOOP_KEY)
+    if loop is not None and loop.is_running():
+        # the task created for the coroutine copies this context
+        token = _blocking.set(True)
+        try:
+            future = asyncio.run_coroutine_threadsafe(_await(awaitable), loop)
+        finally:
+            _blocking.reset(token)
+        return future.result()
+    return asyncio.run(_await(awaitable))
+
+
+async def run_in_thread(request, func, *args):
+    """Call ``func(*args)`` in a thread with ``request`` as the current
+    request, and return its result.
+
+    When ``request`` is being served by an :class:`ASGIRouter`, the thread
+    is one of its executor, or of its separate thread pool when the calling
+    coroutine was run by :func:`run_awaitable`; otherwise it is one of the
+    event loop's default executor.
+
+    .. versionadded:: 2.1
+    """
+    loop = asyncio.get_running_loop()
+    if _blocking.get():
+        executor = request.environ.get(HANDLER_EXECUTOR_KEY)
+    else:
+        executor = request.environ.get(EXECUTOR_KEY)
+    return await loop.run_in_executor(
+        executor, _call_with_request_context, request, func, *args
+    )
+
+
+async def _await(awaitable):
+    return await awaitable
+
+
+def is_coroutine_callable(ob, attr=None):
+    """Return ``True`` if calling ``ob`` returns a coroutine.  If ``attr``
+    is not ``None``, check the ``attr`` method of ``ob`` instead.  For a
+    class, check the method which would be called on its instances.
+
+    .. versionadded:: 2.1
+    """
+    if attr is not None:
+        ob = getattr(ob, attr, None)
+    elif not inspect.isroutine(ob):
+        ob = getattr(ob, '__call__', None)
+    return inspect.iscoroutinefunction(ob)
+
+
+def synchronous_tween(handler):
+    """Wrap the coroutine tween ``handler`` so that it may be called by
+    synchronous tweens and the router."""
+
+    @functools.wraps(handler)
+    def tween(request):
+        return run_awaitable(request, handler(request))
+
+    tween._coroutine_handler = handler
+    return tween
+
+
+def awaitable_handler(handler, coroutine=None):
+    """Wrap the synchronous tween or router ``handler`` so that a coroutine
+    tween may await its result.
+
+    The wrapper calls ``handler`` directly, for synchronous tweens, unless
+    its ``_awaited`` attribute is set, which is done once the tween it is
+    given to turns out to be a coroutine tween; from then on it returns
+    ``coroutine(request)``, ``coroutine`` being the coroutine equivalent of
+    ``handler`` (see :func:`coroutine_handler`) if it is ``None``."""
+    if coroutine is None:
+        coroutine = coroutine_handler(handler)
+    handler = synchronous_handler(handler)
+
+    @functools.wraps(handler)
+    def wrapper(request):
+        if wrapper._awaited:
+            return coroutine(request)
+        return handler(request)
+
+    wrapper._awaited = False
+    wrapper._synchronous_handler = handler
+    wrapper._coroutine_handler = coroutine
+    return wrapper
+
+
+def synchronous_handler(handler):
+    """Return the synchronous tween or router handler wrapped by
+    :func:`awaitable_handler` in ``handler``, or ``handler`` itself."""
+    return getattr(handler, '_synchronous_handler', handler)
+
+
+def coroutine_handler(handler):
+    """Return a coroutine function equivalent to the tween or router
+    ``handler``: the coroutine tween wrapped by :func:`synchronous_tween` or
+    the coroutine given to :func:`awaitable_handler`, ``handler`` itself if
+    it is a coroutine function, or a coroutine function calling ``handler``
+    with :func:`run_in_thread` otherwise."""
+    coroutine = getattr(handler, '_coroutine_handler', None)
+    if coroutine is not None:
+        return coroutine
+    if is_coroutine_callable(handler):
+        return handler
+
+    @functools.wraps(handler)
+    async def threaded_handler(request):
+        return await run_in_thread(request, handler, request)
+
+    return threaded_handler
+
+
+def _call_with_request_context(request, func, *args):
+    with RequestContext(request):
+        return func(*args)
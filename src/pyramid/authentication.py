@@ -13,6 +13,7 @@ from zope.interface import implementer
 from pyramid.authorization import Authenticated, Everyone
 from pyramid.interfaces import IAuthenticationPolicy, IDebugLogger
 from pyramid.util import (
+    LRUCache,
     SimpleSerializer,
     ascii_,
     bytes_,
@@ -963,8 +964,20 @@ class AuthTktCookieHelper:
 
         The default ``hashalg`` was changed from ``md5`` to ``sha512``.
 
+    .. versionchanged:: 2.1
+
+        The contents of the valid tickets found in requests are remembered,
+        so that a ticket seen again is not parsed and its signature is not
+        verified again.  See :attr:`parsed_ticket_cache_size`.
+
     """
 
+    #: The maximum number of valid tickets whose contents are remembered,
+    #: least recently used first out.  A ticket which has expired according
+    #: to ``timeout`` is forgotten when it is seen again.  ``0`` disables
+    #: the cache.
+    parsed_ticket_cache_size = 1000
+
     parse_ticket = staticmethod(parse_ticket)  # for tests
     AuthTicket = AuthTicket  # for tests
     BadTicket = BadTicket  # for tests
@@ -1023,6 +1036,29 @@ class AuthTktCookieHelper:
         self.parent_domain = parent_domain
         self.domain = domain
         self.hashalg = hashalg
+        self._parsed_tickets = LRUCache()
+
+    def _parse_ticket(self, key):
+        # key is (cookie, remote_addr, secret, hashalg); the contents of the
+        # ticket are kept with immutable tokens, since they are handed to
+        # the application
+        parsed = self._parsed_tickets.get(key)
+        if parsed is None:
+            cookie, remote_addr, secret, hashalg = key
+            parsed = self.parse_ticket(secret, cookie, remote_addr, hashalg)
+            if self.parsed_ticket_cache_size > 0:
+                timestamp, userid, tokens, user_data = parsed
+                self._parsed_tickets.put(
+                    key,
+                    (timestamp, userid, tuple(tokens), user_data),
+                    self.parsed_ticket_cache_size,
+                )
+            return parsed
+        timestamp, userid, tokens, user_data = parsed
+        return timestamp, userid, list(tokens), user_data
+
+    def _forget_ticket(self, key):
+        self._parsed_tickets.pop(key)
 
     def _get_cookies(self, request, value, max_age=None):
         if self.domain:
@@ -1059,10 +1095,9 @@ class AuthTktCookieHelper:
         else:
             remote_addr = '0.0.0.0'
 
+        key = (cookie, remote_addr, self.secret, self.hashalg)
         try:
-            timestamp, userid, tokens, user_data = self.parse_ticket(
-                self.secret, cookie, remote_addr, self.hashalg
-            )
+            timestamp, userid, tokens, user_data = self._parse_ticket(key)
         except self.BadTicket:
             return None
 
@@ -1073,6 +1108,7 @@ class AuthTktCookieHelper:
 
         if self.timeout and ((timestamp + self.timeout) < now):
             # the auth_tkt data has expired
+            self._forget_ticket(key)
             return None
 
         userid_typename = 'userid_type:'
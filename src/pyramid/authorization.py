@@ -42,10 +42,59 @@ class ACLDenied(_ACLDenied):
     pass
 
 
+_marker = object()
+
 ALL_PERMISSIONS = AllPermissionsList()  # api
 DENY_ALL = (Deny, Everyone, ALL_PERMISSIONS)  # api
 
 
+class CompiledACL(tuple):
+    """An :term:`ACL` which remembers, for each permission it is asked
+    about, the ACEs which mention that permission, in order.  It is a tuple
+    of the ACEs of ``acl`` and may be used wherever an ACL is expected, as
+    the ``__acl__`` attribute of a resource or as the value returned by a
+    callable ``__acl__``.
+
+    :class:`pyramid.authorization.ACLHelper` only scans the ACEs of a
+    compiled ACL once per permission, rather than once per permission
+    check.  The permissions of an ACE which are neither a string nor a
+    list, tuple or set (such as
+    :data:`pyramid.authorization.ALL_PERMISSIONS`) are asked whether they
+    contain a permission only the first time it is checked.
+
+    .. versionadded:: 2.1
+    """
+
+    def __new__(cls, acl):
+        self = tuple.__new__(cls, acl)
+        self._entries = {}
+        return self
+
+    def entries(self, permission):
+        """Return a tuple of ``(ace, action, principal)`` triples of the
+        ACEs mentioning ``permission``, in the order of the ACL."""
+        try:
+            return self._entries[permission]
+        except KeyError:
+            entries = self._entries[permission] = self._scan(permission)
+        except TypeError:
+            # an unhashable permission is never remembered
+            entries = self._scan(permission)
+        return entries
+
+    def _scan(self, permission):
+        entries = []
+        for ace in self:
+            ace_action, ace_principal, ace_permissions = ace
+            if is_nonstr_iter(ace_permissions):
+                matched = permission in ace_permissions
+            else:
+                matched = permission == ace_permissions
+            if matched:
+                entries.append((ace, ace_action, ace_principal))
+        return tuple(entries)
+
+
 @implementer(IAuthorizationPolicy)
 class ACLAuthorizationPolicy:
     """An :term:`authorization policy` which consults an :term:`ACL`
@@ -83,6 +132,23 @@ class ACLAuthorizationPolicy:
             context, permission
         )
 
+    def walk_principals_allowed_by_permission(
+        self, context, permission, children=None
+    ):
+        """Yield a ``(resource, principals)`` pair for ``context`` and each
+        of its descendants, ``principals`` being the principals granted
+        ``permission`` on ``resource``.  See the method of the same name of
+        :class:`pyramid.authorization.ACLHelper`."""
+        return self.helper.walk_principals_allowed_by_permission(
+            context, permission, children
+        )
+
+    def filter_permitted(self, resources, principals, permission):
+        """Return a list of those of ``resources`` for which the
+        ``principals`` are granted ``permission``, in order.  See
+        :meth:`pyramid.authorization.ACLHelper.filter_permitted`."""
+        return self.helper.filter_permitted(resources, principals, permission)
+
 
 class ACLHelper:
     """A helper for use with constructing a :term:`security policy` which
@@ -93,7 +159,7 @@ class ACLHelper:
 
     """
 
-    def permits(self, context, principals, permission):
+    def permits(self, context, principals, permission, cache=None):
         """Return an instance of :class:`pyramid.authorization.ACLAllowed` if
         the ACL allows access a user with the given principals, return an
         instance of :class:`pyramid.authorization.ACLDenied` if not.
@@ -118,7 +184,31 @@ class ACLHelper:
         access, return an instance of
         :class:`pyramid.authorization.ACLDenied` (equals ``False``).
 
+        ``cache`` is an optional dictionary in which the results are
+        remembered, keyed on the ``context``, ``principals`` and
+        ``permission``, such as a dictionary kept for the duration of a
+        request.  It must not outlive changes to the ACLs in the lineage of
+        the contexts it remembers.  See :ref:`caching_acl_checks`.
+
+        .. versionchanged:: 2.1
+           Added the ``cache`` argument.  The ACEs of a
+           :class:`pyramid.authorization.CompiledACL` are only scanned once
+           per permission.
+
         """
+        if cache is None:
+            return self._permits(context, principals, permission)
+        key = (id(context), frozenset(principals), permission)
+        cached = cache.get(key)
+        # the context is kept alongside the result so that a context whose
+        # id is reused by another object is not mistaken for it
+        if cached is not None and cached[0] is context:
+            return cached[1]
+        result = self._permits(context, principals, permission)
+        cache[key] = (context, result)
+        return result
+
+    def _permits(self, context, principals, permission):
         acl = '<No ACL found on any object in resource lineage>'
 
         for location in lineage(context):
@@ -130,20 +220,16 @@ class ACLHelper:
             if acl and callable(acl):
                 acl = acl()
 
-            for ace in acl:
-                ace_action, ace_principal, ace_permissions = ace
-                if ace_principal in principals:
-                    if not is_nonstr_iter(ace_permissions):
-                        ace_permissions = [ace_permissions]
-                    if permission in ace_permissions:
-                        if ace_action == Allow:
-                            return ACLAllowed(
-                                ace, acl, permission, principals, location
-                            )
-                        else:
-                            return ACLDenied(
-                                ace, acl, permission, principals, location
-                            )
+            ace = _find_ace(acl, principals, permission)
+            if ace is not None:
+                if ace[0] == Allow:
+                    return ACLAllowed(
+                        ace, acl, permission, principals, location
+                    )
+                else:
+                    return ACLDenied(
+                        ace, acl, permission, principals, location
+                    )
 
         # default deny (if no ACL in lineage at all, or if none of the
         # principals were mentioned in any ACE we found)
@@ -151,6 +237,44 @@ class ACLHelper:
             '<default deny>', acl, permission, principals, context
         )
 
+    def filter_permitted(self, resources, principals, permission):
+        """Return a list of those of ``resources`` for which the ACLs in
+        their lineage grant ``permission`` to any of ``principals``, in
+        order.  Each resource is permitted if and only if :meth:`permits`
+        would allow it, but the ACL of an ancestor shared by several of the
+        resources is only consulted once.
+
+        .. versionadded:: 2.1
+
+        """
+        # id(location) -> (location, whether the permission is granted to
+        # the principals at that location, taking its lineage into account)
+        decisions = {}
+        permitted = []
+        for resource in resources:
+            undecided = []
+            granted = False  # default deny
+            for location in lineage(resource):
+                decided = decisions.get(id(location))
+                if decided is not None and decided[0] is location:
+                    granted = decided[1]
+                    break
+                undecided.append(location)
+                acl = getattr(location, '__acl__', _marker)
+                if acl is _marker:
+                    continue
+                if acl and callable(acl):
+                    acl = acl()
+                ace = _find_ace(acl, principals, permission)
+                if ace is not None:
+                    granted = ace[0] == Allow
+                    break
+            for location in undecided:
+                decisions[id(location)] = (location, granted)
+            if granted:
+                permitted.append(resource)
+        return permitted
+
     def principals_allowed_by_permission(self, context, permission):
         """Return the set of principals explicitly granted the permission
         named ``permission`` according to the ACL directly attached to the
@@ -177,33 +301,121 @@ class ACLHelper:
 
         for location in reversed(list(lineage(context))):
             # NB: we're walking *up* the object graph from the root
-            try:
-                acl = location.__acl__
-            except AttributeError:
+            acl = getattr(location, '__acl__', _marker)
+            if acl is _marker:
                 continue
-
-            allowed_here = set()
-            denied_here = set()
-
             if acl and callable(acl):
                 acl = acl()
+            allowed = _allowed_by_acl(allowed, acl, permission)
+
+        return allowed
 
-            for ace_action, ace_principal, ace_permissions in acl:
-                if not is_nonstr_iter(ace_permissions):
-                    ace_permissions = [ace_permissions]
-                if (ace_action == Allow) and (permission in ace_permissions):
-                    if ace_principal not in denied_here:
-                        allowed_here.add(ace_principal)
-                if (ace_action == Deny) and (permission in ace_permissions):
-                    denied_here.add(ace_principal)
-                    if ace_principal == Everyone:
-                        # clear the entire allowed set, as we've hit a
-                        # deny of Everyone ala (Deny, Everyone, ALL)
-                        allowed = set()
-                        break
-                    elif ace_principal in allowed:
-                        allowed.remove(ace_principal)
-
-            allowed.update(allowed_here)
+    def walk_principals_allowed_by_permission(
+        self, context, permission, children=None
+    ):
+        """Walk the resource tree below ``context``, yielding a ``(resource,
+        principals)`` pair for ``context`` and each of its descendants,
+        where ``principals`` is the frozenset of principals
+        :meth:`principals_allowed_by_permission` would return for that
+        resource.  Each resource is yielded before its descendants.
+
+        ``children`` is a callable returning the children of a resource; by
+        default, the ``values()`` of a resource which has such a method are
+        its children.  The ACLs above ``context`` are consulted once, and the
+        principals allowed at each descendant are computed from those of its
+        parent, so that the ACL of each resource is only consulted once.
+        The principals of a resource whose ACL doesn't mention
+        ``permission`` are the same frozenset as those of its parent.
+
+        .. versionadded:: 2.1
 
+        """
+        if children is None:
+            children = _values
+        allowed = frozenset(
+            self.principals_allowed_by_permission(context, permission)
+        )
+        yield context, allowed
+        # a stack of the iterators of the children of the resources being
+        # walked, along with the principals allowed by their parent
+        stack = [(iter(children(context)), allowed)]
+        while stack:
+            resources, parent_allowed = stack[-1]
+            resource = next(resources, _marker)
+            if resource is _marker:
+                stack.pop()
+                continue
+            allowed = parent_allowed
+            acl = getattr(resource, '__acl__', _marker)
+            if acl is not _marker:
+                if acl and callable(acl):
+                    acl = acl()
+                allowed = _allowed_by_acl(parent_allowed, acl, permission)
+                if allowed is not parent_allowed:
+                    allowed = frozenset(allowed)
+            yield resource, allowed
+            stack.append((iter(children(resource)), allowed))
+
+
+def _values(resource):
+    values = getattr(resource, 'values', None)
+    if values is None:
+        return ()
+    return values()
+
+
+def _allowed_by_acl(allowed, acl, permission):
+    # the principals granted the permission by acl, given those granted it by
+    # the ACLs above; allowed itself is returned when acl doesn't mention the
+    # permission, and a new set otherwise
+    if isinstance(acl, CompiledACL):
+        entries = acl.entries(permission)
+    else:
+        entries = []
+        for ace in acl:
+            ace_action, ace_principal, ace_permissions = ace
+            if not is_nonstr_iter(ace_permissions):
+                ace_permissions = [ace_permissions]
+            if permission in ace_permissions:
+                entries.append((ace, ace_action, ace_principal))
+    if not entries:
         return allowed
+
+    allowed = set(allowed)
+    allowed_here = set()
+    denied_here = set()
+
+    for ace, ace_action, ace_principal in entries:
+        if ace_action == Allow:
+            if ace_principal not in denied_here:
+                allowed_here.add(ace_principal)
+        elif ace_action == Deny:
+            denied_here.add(ace_principal)
+            if ace_principal == Everyone:
+                # clear the entire allowed set, as we've hit a
+                # deny of Everyone ala (Deny, Everyone, ALL)
+                allowed = set()
+                break
+            elif ace_principal in allowed:
+                allowed.remove(ace_principal)
+
+    allowed.update(allowed_here)
+    return allowed
+
+
+def _find_ace(acl, principals, permission):
+    # the first ACE of the ACL granting or denying the permission to any of
+    # the principals, or None
+    if isinstance(acl, CompiledACL):
+        for ace, ace_action, ace_principal in acl.entries(permission):
+            if ace_principal in principals:
+                return ace
+        return None
+    for ace in acl:
+        ace_action, ace_principal, ace_permissions = ace
+        if ace_principal in principals:
+            if not is_nonstr_iter(ace_permissions):
+                ace_permissions = [ace_permissions]
+            if permission in ace_permissions:
+                return ace
+    return None
@@ -5,6 +5,7 @@ import threading
 import venusian
 from webob.exc import WSGIHTTPException as WebobWSGIHTTPException
 
+from pyramid.asgi import ASGIRouter
 from pyramid.asset import resolve_asset_spec
 from pyramid.authorization import ACLAuthorizationPolicy
 from pyramid.config.actions import (
@@ -37,11 +38,23 @@ from pyramid.interfaces import (
     IExceptionResponse,
 )
 from pyramid.path import DottedNameResolver, caller_package, package_of
-from pyramid.registry import Introspectable, Introspector, Registry
+from pyramid.registry import (
+    Introspectable,
+    Introspector,
+    PredicateMemoStats,
+    Registry,
+    ViewLookupStats,
+)
 from pyramid.router import Router
 from pyramid.settings import aslist
 from pyramid.threadlocal import manager
-from pyramid.util import WeakOrderedSet, get_callable_name, object_description
+from pyramid.util import (
+    LRUCache,
+    WeakOrderedSet,
+    get_callable_name,
+    object_description,
+)
+from pyramid.view import _warm_view_lookup_cache
 
 _marker = object()
 
@@ -501,9 +514,21 @@ class Configurator(
 
             def _clear_view_lookup_cache():
                 _registry._view_lookup_cache = {}
+                _registry._view_lookup_misses = LRUCache()
+                _registry.view_lookup_generation += 1
 
             _registry._clear_view_lookup_cache = _clear_view_lookup_cache
 
+        if not hasattr(_registry, 'view_lookup_stats'):
+            _registry.view_lookup_stats = ViewLookupStats()
+            _registry.view_lookup_generation = 0
+            _registry.view_lookup_miss_cache_size = (
+                Registry.view_lookup_miss_cache_size
+            )
+
+        if not hasattr(_registry, 'predicate_memo_stats'):
+            _registry.predicate_memo_stats = PredicateMemoStats()
+
     # API
 
     def _get_introspector(self):
@@ -887,7 +912,13 @@ class Configurator(
         adds this configuration's registry to
         :attr:`pyramid.config.global_registries`, and returns a
         :app:`Pyramid` WSGI application representing the committed
-        configuration state."""
+        configuration state.
+
+        .. versionchanged:: 2.1
+           When the ``pyramid.warm_caches`` setting is true, the views and
+           renderers of the application are looked up before it is
+           returned.  See :ref:`warm_caches_setting`.
+        """
         self.commit()
         app = Router(self.registry)
 
@@ -900,11 +931,40 @@ class Configurator(
         # IApplicationCreated event.
         self.begin()
         try:
+            settings = self.registry.settings
+            if settings and settings.get('warm_caches'):
+                self._warm_caches()
             self.registry.notify(ApplicationCreated(app))
         finally:
             self.end()
 
         return app
 
+    def _warm_caches(self):
+        # fill the caches which are otherwise filled by the first requests
+        _warm_view_lookup_cache(self.registry)
+        for entry in self.introspector.get_category('views'):
+            renderer = entry['introspectable'].get('renderer')
+            if renderer is not None:
+                try:
+                    renderer.renderer
+                except ValueError:
+                    # a missing renderer factory is reported when the view
+                    # is called
+                    pass
+
+    def make_asgi_app(self, executor=None):
+        """Like :meth:`pyramid.config.Configurator.make_wsgi_app`, but
+        returns an :term:`ASGI` application (a
+        :class:`pyramid.asgi.ASGIRouter`) representing the committed
+        configuration state.  The synchronous code processing requests
+        runs in threads of ``executor``, a
+        :class:`concurrent.futures.Executor`; the event loop's default
+        executor is used if it is ``None``.
+
+        .. versionadded:: 2.1
+        """
+        return ASGIRouter(self.make_wsgi_app(), executor)
+
 
 global_registries = WeakOrderedSet()
@@ -260,6 +260,8 @@ class AdaptersConfiguratorMixin:
             if iface is None:
                 iface = Interface
             self.registry.registerAdapter(adapter, (iface,), ITraverser)
+            # the router caches the traverser used for each root
+            self.registry._clear_view_lookup_cache()
 
         discriminator = ('traverser', iface)
         intr = self.introspectable(
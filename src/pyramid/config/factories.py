@@ -2,10 +2,12 @@ from zope.interface import implementer
 
 from pyramid.config.actions import action_method
 from pyramid.interfaces import (
+    PHASE1_CONFIG,
     IDefaultRootFactory,
     IExecutionPolicy,
     IRequestExtensions,
     IRequestFactory,
+    IRequestTimingSink,
     IResponseFactory,
     IRootFactory,
     ISessionFactory,
@@ -255,6 +257,47 @@ class FactoriesConfiguratorMixin:
         intr['policy'] = policy
         self.action(IExecutionPolicy, register, introspectables=(intr,))
 
+    @action_method
+    def set_request_timing_sink(self, sink):
+        """
+        Record the phases of processing each request, and pass them to
+        ``sink`` once the request is finished.  The ``sink`` argument must
+        be a :term:`request timing sink` (an object implementing
+        :class:`pyramid.interfaces.IRequestTimingSink`), such as a
+        :class:`pyramid.timing.TimingsLogger`, or a :term:`dotted Python
+        name` that points at one.  If it is ``None``, requests aren't timed.
+
+        While a sink is configured, the phases are recorded in the
+        ``timings`` attribute of the request (a
+        :class:`pyramid.timing.RequestTimings` object); otherwise it is
+        ``None`` and no time is spent recording them.  The time spent in
+        each :term:`view deriver` is recorded for the views registered in
+        the same :term:`commit` as the sink or in a later one.
+
+        .. versionadded:: 2.1
+        """
+        sink = self.maybe_dotted(sink)
+
+        def register():
+            if sink is None:
+                self.registry.unregisterUtility(provided=IRequestTimingSink)
+            else:
+                self.registry.registerUtility(sink, IRequestTimingSink)
+
+        intr = self.introspectable(
+            'request timing sink',
+            None,
+            self.object_description(sink),
+            'request timing sink',
+        )
+        intr['sink'] = sink
+        self.action(
+            IRequestTimingSink,
+            register,
+            introspectables=(intr,),
+            order=PHASE1_CONFIG,
+        )
+
 
 @implementer(IRequestExtensions)
 class _RequestExtensions:
@@ -561,7 +561,12 @@ class RoutesConfiguratorMixin:
         this configurator's :term:`registry`."""
         mapper = self.registry.queryUtility(IRoutesMapper)
         if mapper is None:
-            mapper = RoutesMapper()
+            settings = self.registry.settings or {}
+            matcher = settings.get('pyramid.route_matcher', 'linear')
+            try:
+                mapper = RoutesMapper(matcher=matcher)
+            except ValueError as e:
+                raise ConfigurationError(str(e))
             self.registry.registerUtility(mapper, IRoutesMapper)
         return mapper
 
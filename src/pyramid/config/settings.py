@@ -107,5 +107,9 @@ def Settings(d=None, _environ_=os.environ, **kw):
     S('prevent_http_cache', 'PYRAMID_PREVENT_HTTP_CACHE', asbool)
     S('prevent_cachebust', 'PYRAMID_PREVENT_CACHEBUST', asbool)
     S('csrf_trusted_origins', 'PYRAMID_CSRF_TRUSTED_ORIGINS', aslist, [])
+    S('route_matcher', 'PYRAMID_ROUTE_MATCHER', str, 'linear')
+    S('profile_tweens', 'PYRAMID_PROFILE_TWEENS', asbool)
+    S('warm_caches', 'PYRAMID_WARM_CACHES', asbool)
+    S('memoize_predicates', 'PYRAMID_MEMOIZE_PREDICATES', asbool)
 
     return d
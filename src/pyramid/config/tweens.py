@@ -1,8 +1,15 @@
 from zope.interface import implementer
 
+from pyramid.asgi import (
+    awaitable_handler,
+    coroutine_handler,
+    is_coroutine_callable,
+    synchronous_tween,
+)
 from pyramid.config.actions import action_method
 from pyramid.exceptions import ConfigurationError
 from pyramid.interfaces import ITweens
+from pyramid.timing import TweenProfile
 from pyramid.tweens import EXCVIEW, INGRESS, MAIN
 from pyramid.util import (
     TopologicalSorter,
@@ -171,6 +178,7 @@ class Tweens:
             last=MAIN,
         )
         self.explicit = []
+        self.profile = None
 
     def add_explicit(self, name, factory):
         self.explicit.append((name, factory))
@@ -186,6 +194,32 @@ class Tweens:
             use = self.explicit
         else:
             use = self.implicit()
+        profile = self.profile
+        if profile is None and registry is not None:
+            settings = registry.settings
+            if settings and settings.get('profile_tweens'):
+                profile = self.profile = TweenProfile()
+        if profile is not None:
+            handler = _profiled(profile, MAIN, handler)
         for name, factory in use[::-1]:
-            handler = factory(handler, registry)
+            # the handler is awaitable if the tween is a coroutine tween
+            downstream = awaitable_handler(handler)
+            tween = factory(downstream, registry)
+            if tween is downstream:
+                continue
+            if is_coroutine_callable(tween):
+                downstream._awaited = True
+                tween = synchronous_tween(tween)
+            if profile is not None:
+                tween = _profiled(profile, name, tween)
+            handler = tween
         return handler
+
+
+def _profiled(profile, name, handler):
+    # profile both the handler and its coroutine equivalent
+    coroutine = coroutine_handler(handler)
+    handler = profile.profiled(name, handler)
+    handler._synchronous_handler = handler
+    handler._coroutine_handler = profile.profiled(name, coroutine)
+    return handler
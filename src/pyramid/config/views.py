@@ -10,6 +10,7 @@ from zope.interface import Interface, implementedBy, implementer
 from zope.interface.interfaces import IInterface
 
 from pyramid import renderers
+from pyramid.asgi import is_coroutine_callable
 from pyramid.asset import resolve_asset_spec
 from pyramid.config.actions import action_method
 from pyramid.config.predicates import (
@@ -35,6 +36,7 @@ from pyramid.interfaces import (
     IPackageOverrides,
     IRendererFactory,
     IRequest,
+    IRequestTimingSink,
     IResponse,
     IRouteRequest,
     ISecuredView,
@@ -49,12 +51,16 @@ import pyramid.predicates
 from pyramid.registry import Deferred
 from pyramid.security import NO_PERMISSION_REQUIRED
 from pyramid.static import static_view
+from pyramid.timing import timed_view
 from pyramid.url import parse_url_overrides
 from pyramid.util import (
     WIN,
     TopologicalSorter,
+    acceptable_offers,
     as_sorted_tuple,
+    check_predicates,
     is_nonstr_iter,
+    predicate_key,
 )
 from pyramid.view import AppendSlashNotFoundViewFactory
 import pyramid.viewderivers
@@ -62,6 +68,9 @@ from pyramid.viewderivers import (
     INGRESS,
     VIEW,
     DefaultViewMapper,
+    bridged_view,
+    fusable_view,
+    fused_view,
     preserve_view_attrs,
     requestonly,
     view_description,
@@ -81,6 +90,7 @@ class MultiView:
         self.media_views = {}
         self.views = []
         self.accepts = []
+        self._tables = {}
 
     def __discriminator__(self, context, request):
         # used by introspection systems like so:
@@ -92,6 +102,7 @@ class MultiView:
         return view.__discriminator__(context, request)
 
     def add(self, view, order, phash=None, accept=None, accept_order=None):
+        self._tables = {}
         if phash is not None:
             for i, (s, v, h) in enumerate(list(self.views)):
                 if phash == h:
@@ -120,14 +131,63 @@ class MultiView:
     def get_views(self, request):
         if self.accepts and hasattr(request, 'accept'):
             views = []
-            for offer, _ in request.accept.acceptable_offers(self.accepts):
+            offers = acceptable_offers(request, tuple(self.accepts))
+            for offer, _ in offers:
                 views.extend(self.media_views[offer])
             views.extend(self.views)
             return views
         return self.views
 
-    def match(self, context, request):
+    def _table(self, view):
+        # the predicates of a view made by predicated_view, keyed so that
+        # equivalent predicates of different views share their result, and
+        # the view it wraps, which can be called once they have been checked
+        key = id(view)
+        entry = self._tables.get(key)
+        if entry is not None and entry[0] is view:
+            return entry[1]
+        table = None
+        predicates = getattr(view, '__predicates__', None)
+        unpredicated = getattr(view, '__predicated_view__', None)
+        if isinstance(predicates, (list, tuple)) and unpredicated is not None:
+            table = (
+                unpredicated,
+                tuple((predicate_key(p), p) for p in predicates),
+            )
+        self._tables[key] = (view, table)
+        return table
+
+    def _candidates(self, context, request):
+        # yield (view, callable) for each view in order whose predicates
+        # may accept the request.  Each distinct predicate is evaluated at
+        # most once, and a view known to accept the request is yielded with
+        # the view it wraps as the callable, so that its predicates are not
+        # checked again.  Other views check their own predicates.
+        results = {}
+        memo = getattr(request, '_predicate_memo', None)
         for order, view, phash in self.get_views(request):
+            table = self._table(view)
+            if table is None:
+                yield view, view
+                continue
+            unpredicated, checks = table
+            for key, predicate in checks:
+                result = results.get(key)
+                if result is None:
+                    if memo is None:
+                        result = predicate(context, request)
+                    else:
+                        result = memo(predicate, context, request)
+                    result = results[key] = bool(result)
+                if not result:
+                    break
+            else:
+                yield view, unpredicated
+
+    def match(self, context, request):
+        for view, func in self._candidates(context, request):
+            if func is not view:
+                return view
             if not hasattr(view, '__predicated__'):
                 return view
             if view.__predicated__(context, request):
@@ -146,9 +206,9 @@ class MultiView:
         return view(context, request)
 
     def __call__(self, context, request):
-        for order, view, phash in self.get_views(request):
+        for view, func in self._candidates(context, request):
             try:
-                return view(context, request)
+                return func(context, request)
             except PredicateMismatch:
                 continue
         raise PredicateMismatch(self.name)
@@ -169,6 +229,7 @@ def attr_wrapped_view(view, info):
     def attr_view(context, request):
         return view(context, request)
 
+    fusable_view(attr_view, view)
     attr_view.__accept__ = accept
     attr_view.__order__ = order
     attr_view.__phash__ = phash
@@ -178,6 +239,8 @@ def attr_wrapped_view(view, info):
 
 
 attr_wrapped_view.options = ('accept', 'attr', 'permission')
+# the wrapper returns the awaitable returned by a coroutine view as is
+attr_wrapped_view.supports_coroutines = True
 
 
 def predicated_view(view, info):
@@ -185,24 +248,40 @@ def predicated_view(view, info):
     if not preds:
         return view
 
-    def predicate_wrapper(context, request):
+    def check(context, request):
+        memo = getattr(request, '_predicate_memo', None)
         for predicate in preds:
-            if not predicate(context, request):
+            if memo is None:
+                result = predicate(context, request)
+            else:
+                result = memo(predicate, context, request)
+            if not result:
                 view_name = getattr(view, '__name__', view)
                 raise PredicateMismatch(
                     'predicate mismatch for view %s (%s)'
                     % (view_name, predicate.text())
                 )
+
+    def predicate_wrapper(context, request):
+        check(context, request)
         return view(context, request)
 
     def checker(context, request):
-        return all(predicate(context, request) for predicate in preds)
+        return check_predicates(preds, context, request)
 
     predicate_wrapper.__predicated__ = checker
     predicate_wrapper.__predicates__ = preds
+    predicate_wrapper.__predicated_view__ = view
+    fusable_view(predicate_wrapper, view, check=check)
     return predicate_wrapper
 
 
+# the predicates are checked when the view is called, so that a mismatch is
+# raised to MultiView and _call_view, and the awaitable returned by a
+# coroutine view is returned as is
+predicated_view.supports_coroutines = True
+
+
 def viewdefaults(wrapped):
     """Decorator for add_view-like methods which takes into account
     __view_defaults__ attached to view it is passed.  Not a documented API but
@@ -962,6 +1041,7 @@ class ViewsConfiguratorMixin:
                         name=None, package=self.package, registry=self.registry
                     )
 
+            view_intr['renderer'] = renderer
             renderer_type = getattr(renderer, 'type', None)
             intrspc = self.introspector
             if (
@@ -1171,8 +1251,23 @@ class ViewsConfiguratorMixin:
 
         view = info.original_view
         derivers = self.registry.getUtility(IViewDerivers)
+        timed = self.registry.queryUtility(IRequestTimingSink) is not None
         for name, deriver in reversed(outer_derivers + derivers.sorted()):
+            if (
+                view is not info.original_view
+                and not getattr(deriver, 'supports_coroutines', False)
+                and is_coroutine_callable(view)
+            ):
+                # derivers expect a synchronous view unless they say
+                # otherwise, so the coroutine chain ends here; otherwise the
+                # derived view returns an awaitable
+                view = bridged_view(view)
             view = wraps_view(deriver)(view, info)
+            if timed:
+                view = preserve_view_attrs(view, timed_view(view, name))
+        if not timed:
+            # timed views record a span per deriver, so keep them apart
+            view = fused_view(view)
         return view
 
     @action_method
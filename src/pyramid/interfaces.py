@@ -897,6 +897,14 @@ class IExecutionPolicy(Interface):
         """
 
 
+class IRequestTimingSink(Interface):
+    def __call__(request, timings):
+        """Called by the :term:`router` once it has finished processing
+        ``request``, with ``timings`` (a
+        :class:`pyramid.timing.RequestTimings` object) recording the phases
+        of the processing."""
+
+
 class ISettings(IDict):
     """Runtime settings utility for pyramid; represents the
     deployment settings for the application.  Implements a mapping
@@ -1213,6 +1221,28 @@ class ISession(IDict):
         """
 
 
+class ISessionStore(Interface):
+    """An object storing the serialized state of the sessions created by
+    :func:`pyramid.session.ServerSideSessionFactory`, keyed by session id.
+    A store may forget a session at any time, such as when it has expired
+    or to make room for another one.
+
+    .. versionadded:: 2.1
+    """
+
+    def load(session_id):
+        """Return the bytes last saved for the session ``session_id``, or
+        ``None`` if the store has no unexpired state for it."""
+
+    def save(session_id, data, timeout):
+        """Save the bytes ``data`` for the session ``session_id``, replacing
+        any previous state.  The state expires ``timeout`` seconds from now,
+        or never if ``timeout`` is ``None``."""
+
+    def delete(session_id):
+        """Forget the state of the session ``session_id``, if any."""
+
+
 class ICSRFStoragePolicy(Interface):
     """An object that offers the ability to verify CSRF tokens and generate
     new ones."""
@@ -7,12 +7,19 @@ from pyramid.traversal import (
     traversal_path,
 )
 from pyramid.urldispatch import _compile_route
-from pyramid.util import as_sorted_tuple, is_nonstr_iter, object_description
+from pyramid.util import (
+    acceptable_offers,
+    as_sorted_tuple,
+    is_nonstr_iter,
+    object_description,
+)
 
 _marker = object()
 
 
 class XHRPredicate:
+    request_only = True
+
     def __init__(self, val, config):
         self.val = bool(val)
 
@@ -26,6 +33,8 @@ class XHRPredicate:
 
 
 class RequestMethodPredicate:
+    request_only = True
+
     def __init__(self, val, config):
         request_method = as_sorted_tuple(val)
         if 'GET' in request_method and 'HEAD' not in request_method:
@@ -43,6 +52,8 @@ class RequestMethodPredicate:
 
 
 class PathInfoPredicate:
+    request_only = True
+
     def __init__(self, val, config):
         self.orig = val
         try:
@@ -61,6 +72,8 @@ class PathInfoPredicate:
 
 
 class RequestParamPredicate:
+    request_only = True
+
     def __init__(self, val, config):
         val = as_sorted_tuple(val)
         reqs = []
@@ -97,6 +110,8 @@ class RequestParamPredicate:
 
 
 class HeaderPredicate:
+    request_only = True
+
     def __init__(self, val, config):
         values = []
 
@@ -138,10 +153,12 @@ class HeaderPredicate:
 
 
 class AcceptPredicate:
+    request_only = True
+
     def __init__(self, values, config):
         if not is_nonstr_iter(values):
             values = (values,)
-        self.values = values
+        self.values = tuple(values)
 
     def text(self):
         return 'accept = {}'.format(', '.join(self.values))
@@ -149,7 +166,7 @@ class AcceptPredicate:
     phash = text
 
     def __call__(self, context, request):
-        return bool(request.accept.acceptable_offers(self.values))
+        return bool(acceptable_offers(request, self.values))
 
 
 class ContainmentPredicate:
@@ -180,6 +197,8 @@ class RequestTypePredicate:
 
 
 class MatchParamPredicate:
+    request_only = True
+
     def __init__(self, val, config):
         val = as_sorted_tuple(val)
         self.val = val
@@ -275,6 +294,8 @@ class PhysicalPathPredicate:
 
 
 class IsAuthenticatedPredicate:
+    request_only = True
+
     def __init__(self, val, config):
         self.val = val
 
@@ -288,6 +309,8 @@ class IsAuthenticatedPredicate:
 
 
 class EffectivePrincipalsPredicate:
+    request_only = True
+
     def __init__(self, val, config):
         if is_nonstr_iter(val):
             self.val = set(val)
@@ -311,6 +334,7 @@ class EffectivePrincipalsPredicate:
 class Notted:
     def __init__(self, predicate):
         self.predicate = predicate
+        self.request_only = getattr(predicate, 'request_only', False)
 
     def _notted_text(self, val):
         # if the underlying predicate doesnt return a value, it's not really
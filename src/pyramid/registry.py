@@ -6,6 +6,7 @@ from zope.interface.registry import Components
 from pyramid.decorator import reify
 from pyramid.interfaces import IIntrospectable, IIntrospector, ISettings
 from pyramid.path import CALLER_PACKAGE, caller_package
+from pyramid.util import LRUCache
 
 
 class Registry(Components, dict):
@@ -43,10 +44,16 @@ class Registry(Components, dict):
 
     _settings = None
 
+    #: The maximum number of view lookups which found no view remembered by
+    #: the registry, least recently used first out.
+    view_lookup_miss_cache_size = 1000
+
     def __init__(self, package_name=CALLER_PACKAGE, *args, **kw):
         # add a registry-instance-specific lock, which is used when the lookup
         # cache is mutated
         self._lock = threading.Lock()
+        self.view_lookup_stats = ViewLookupStats()
+        self.predicate_memo_stats = PredicateMemoStats()
         # add a view lookup cache
         self._clear_view_lookup_cache()
         if package_name is CALLER_PACKAGE:
@@ -54,8 +61,14 @@ class Registry(Components, dict):
         Components.__init__(self, package_name, *args, **kw)
         dict.__init__(self)
 
+    #: Incremented each time the view lookup cache is cleared, which
+    #: happens whenever views or traversers are registered.
+    view_lookup_generation = 0
+
     def _clear_view_lookup_cache(self):
         self._view_lookup_cache = {}
+        self._view_lookup_misses = LRUCache()
+        self.view_lookup_generation += 1
 
     def __bool__(self):
         # defeat bool determination via dict.__len__
@@ -114,6 +127,69 @@ class Registry(Components, dict):
     settings = property(_get_settings, _set_settings)
 
 
+class ViewLookupStats:
+    """Counters of the view lookups made in an :term:`application registry`,
+    available as its ``view_lookup_stats`` attribute.
+
+    ``hits``
+      The number of lookups answered from the cache of views found by
+      earlier lookups.
+
+    ``misses``
+      The number of lookups which searched the registry.
+
+    ``negative_hits``
+      The number of lookups answered from the cache of lookups which found no
+      view, without searching the registry.
+
+    ``negative_stores``
+      The number of lookups which searched the registry, found no view and
+      were added to that cache.
+
+    ``negative_evictions``
+      The number of lookups dropped from that cache, least recently used
+      first, to keep it within
+      :attr:`pyramid.registry.Registry.view_lookup_miss_cache_size` entries.
+
+    The counters are updated without locking and are only approximate when
+    requests are served by several threads.
+
+    .. versionadded:: 2.1
+    """
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.negative_hits = 0
+        self.negative_stores = 0
+        self.negative_evictions = 0
+
+
+class PredicateMemoStats:
+    """Counters of the predicate results memoized per request when the
+    ``memoize_predicates`` setting is enabled, available as the
+    ``predicate_memo_stats`` attribute of an :term:`application registry`.
+    See :ref:`memoize_predicates_setting`.
+
+    ``evaluations``
+      The number of predicates evaluated and remembered for the rest of a
+      request.
+
+    ``saved``
+      The number of predicate evaluations answered from the results
+      remembered earlier in the same request.
+
+    The counters are updated without locking and are only approximate when
+    requests are served by several threads.
+
+    .. versionadded:: 2.1
+    """
+
+    def __init__(self):
+        self.evaluations = 0
+        self.saved = 0
+
+
 @implementer(IIntrospector)
 class Introspector:
     def __init__(self):
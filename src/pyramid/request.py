@@ -177,6 +177,8 @@ class Request(
     matchdict = None
     matched_route = None
     request_iface = IRequest
+    timings = None
+    _predicate_memo = None
 
     ResponseClass = Response
 
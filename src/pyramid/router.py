@@ -1,5 +1,7 @@
+from inspect import isawaitable
 from zope.interface import implementer, providedBy
 
+from pyramid.asgi import awaitable_handler, coroutine_handler, run_in_thread
 from pyramid.events import (
     BeforeTraversal,
     ContextFound,
@@ -8,11 +10,13 @@ from pyramid.events import (
 )
 from pyramid.httpexceptions import HTTPNotFound
 from pyramid.interfaces import (
+    VH_ROOT_KEY,
     IDebugLogger,
     IExecutionPolicy,
     IRequest,
     IRequestExtensions,
     IRequestFactory,
+    IRequestTimingSink,
     IRootFactory,
     IRouter,
     IRouteRequest,
@@ -21,8 +25,11 @@ from pyramid.interfaces import (
     ITweens,
 )
 from pyramid.request import Request, apply_request_extensions
+from pyramid.response import Response
 from pyramid.threadlocal import RequestContext
+from pyramid.timing import RequestTimings
 from pyramid.traversal import DefaultRootFactory, ResourceTreeTraverser
+from pyramid.util import PredicateMemo
 from pyramid.view import _call_view
 
 
@@ -31,6 +38,7 @@ class Router:
 
     debug_notfound = False
     debug_routematch = False
+    memoize_predicates = False
 
     def __init__(self, registry):
         q = registry.queryUtility
@@ -42,20 +50,51 @@ class Router:
         self.execution_policy = q(
             IExecutionPolicy, default=default_execution_policy
         )
+        self.timing_sink = q(IRequestTimingSink)
         self.orig_handle_request = self.handle_request
+        self.orig_handle_request_async = self.handle_request_async
         tweens = q(ITweens)
         if tweens is not None:
-            self.handle_request = tweens(self.handle_request, registry)
+            handler = awaitable_handler(
+                self.handle_request, self.handle_request_async
+            )
+            tweened = tweens(handler, registry)
+            if tweened is not handler:
+                self.handle_request = tweened
+                self.handle_request_async = coroutine_handler(tweened)
         self.root_policy = self.root_factory  # b/w compat
         self.registry = registry
         settings = registry.settings
         if settings is not None:
             self.debug_notfound = settings['debug_notfound']
             self.debug_routematch = settings['debug_routematch']
-
-    def handle_request(self, request):
+            self.memoize_predicates = settings.get('memoize_predicates', False)
+        self._plans = None
+
+    def _get_plans(self, registry):
+        """Return the dispatch plans computed for ``registry``: a mapping of
+        route to ``(request_iface, root_factory)`` and a mapping of root
+        interface to traverser factory (``None`` meaning the default
+        traverser).
+
+        The plans are thrown away along with the registry's view lookup
+        cache, which is cleared whenever views or traversers are
+        registered."""
+        generation = registry.view_lookup_generation
+        plans = self._plans
+        if plans is None or plans[0] != generation:
+            plans = self._plans = (generation, {}, {})
+        return plans
+
+    def handle_request(self, request, _allow_awaitable=False):
         attrs = request.__dict__
         registry = attrs['registry']
+        timings = attrs.get('timings')
+        timings and timings.mark('ingress')
+        if self.memoize_predicates:
+            attrs['_predicate_memo'] = PredicateMemo(
+                registry.predicate_memo_stats
+            )
 
         request.request_iface = IRequest
         context = None
@@ -66,7 +105,10 @@ class Router:
         notify = registry.notify
         logger = self.logger
 
+        _, route_plans, traversers = self._get_plans(registry)
+
         has_listeners and notify(NewRequest(request))
+        timings and timings.mark('new_request')
         # find the root object
         root_factory = self.root_factory
         if routes_mapper is not None:
@@ -99,11 +141,19 @@ class Router:
                     )
                     logger and logger.debug(msg)
 
-                request.request_iface = registry.queryUtility(
-                    IRouteRequest, name=route.name, default=IRequest
-                )
+                plan = route_plans.get(route)
+                if plan is None:
+                    request_iface = registry.queryUtility(
+                        IRouteRequest, name=route.name, default=IRequest
+                    )
+                    plan = route_plans[route] = (
+                        request_iface,
+                        route.factory or self.root_factory,
+                    )
+
+                request.request_iface, root_factory = plan
 
-                root_factory = route.factory or self.root_factory
+        timings and timings.mark('route_match')
 
         # Notify anyone listening that we are about to start traversal
         #
@@ -116,33 +166,80 @@ class Router:
         # Create the root factory
         root = root_factory(request)
         attrs['root'] = root
+        timings and timings.mark('root_factory')
 
         # We are about to traverse and find a context
-        traverser = adapters.queryAdapter(root, ITraverser)
-        if traverser is None:
-            traverser = ResourceTreeTraverser(root)
-        tdict = traverser(request)
-
-        context, view_name, subpath, traversed, vroot, vroot_path = (
-            tdict['context'],
-            tdict['view_name'],
-            tdict['subpath'],
-            tdict['traversed'],
-            tdict['virtual_root'],
-            tdict['virtual_root_path'],
-        )
+        root_iface = providedBy(root)
+        try:
+            traverser_factory = traversers[root_iface]
+        except KeyError:
+            traverser_factory = traversers[root_iface] = adapters.lookup(
+                (root_iface,), ITraverser
+            )
+
+        matchdict = request.matchdict
+        if (
+            traverser_factory is None
+            and matchdict is not None
+            and 'traverse' not in matchdict
+            and 'subpath' not in matchdict
+            and VH_ROOT_KEY not in request.environ
+        ):
+            # The default traverser would not traverse anything for a route
+            # without a traverse or subpath in its matchdict; skip it and use
+            # the root as the context.
+            context = vroot = root
+            view_name = ''
+            subpath = traversed = vroot_path = ()
+            attrs['context'] = context
+            attrs['view_name'] = view_name
+            attrs['subpath'] = subpath
+            attrs['traversed'] = traversed
+            attrs['virtual_root'] = vroot
+            attrs['virtual_root_path'] = vroot_path
 
-        attrs.update(tdict)
+        else:
+            traverser = None
+            if traverser_factory is not None:
+                traverser = traverser_factory(root)
+            if traverser is None:
+                traverser = ResourceTreeTraverser(root)
+            tdict = traverser(request)
+
+            context, view_name, subpath, traversed, vroot, vroot_path = (
+                tdict['context'],
+                tdict['view_name'],
+                tdict['subpath'],
+                tdict['traversed'],
+                tdict['virtual_root'],
+                tdict['virtual_root_path'],
+            )
+
+            attrs.update(tdict)
 
         # Notify anyone listening that we have a context and traversal is
         # complete
         has_listeners and notify(ContextFound(request))
+        timings and timings.mark('traversal')
 
         # find a view callable
         context_iface = providedBy(context)
         response = _call_view(
-            registry, request, context, context_iface, view_name
+            registry,
+            request,
+            context,
+            context_iface,
+            view_name,
+            allow_awaitable=_allow_awaitable,
         )
+        if (
+            _allow_awaitable
+            and response.__class__ is not Response
+            and isawaitable(response)
+        ):
+            # the view is marked done once the awaitable is
+            return response
+        timings and timings.mark('view')
 
         if response is None:
             if self.debug_notfound:
@@ -170,6 +267,21 @@ class Router:
 
         return response
 
+    async def handle_request_async(self, request):
+        """The coroutine equivalent of :meth:`handle_request`, used by
+        :class:`pyramid.asgi.ASGIRouter`.  Routing, traversal and the
+        synchronous part of the view lookup and call run in a thread; the
+        awaitable returned by a coroutine view is awaited on the running
+        event loop."""
+        response = await run_in_thread(
+            request, self.orig_handle_request, request, True
+        )
+        if response.__class__ is not Response and isawaitable(response):
+            response = await response
+            timings = request.__dict__.get('timings')
+            timings and timings.mark('view')
+        return response
+
     def invoke_subrequest(self, request, use_tweens=False):
         """Obtain a response object from the Pyramid application based on
         information in the ``request`` object provided.  The ``request``
@@ -241,18 +353,72 @@ class Router:
         else:
             handle_request = self.orig_handle_request
 
+        timing_sink = self.timing_sink
+        timings = None
+        if timing_sink is not None:
+            timings = request.timings = RequestTimings()
+
         try:
             response = handle_request(request)
+            timings and timings.mark('egress')
 
             if request.response_callbacks:
                 request._process_response_callbacks(response)
 
             has_listeners and notify(NewResponse(request, response))
+            timings and timings.mark('response_callbacks')
 
             return response
 
         finally:
             self.finish_request(request)
+            if timings is not None:
+                timings.mark('finished_callbacks')
+                timing_sink(request, timings)
+
+    async def invoke_request_async(self, request):
+        """The coroutine equivalent of :meth:`invoke_request`, used by
+        :class:`pyramid.asgi.ASGIRouter`.  The request is processed by the
+        coroutine equivalent of the tweens and
+        :meth:`handle_request_async`; response and finished callbacks,
+        subscribers and the timing sink are called in a thread.  The
+        threadlocals are only pushed while code runs in a thread."""
+        registry = self.registry
+        has_listeners = registry.has_listeners
+
+        timing_sink = self.timing_sink
+        timings = None
+        if timing_sink is not None:
+            timings = request.timings = RequestTimings()
+
+        try:
+            response = await self.handle_request_async(request)
+            timings and timings.mark('egress')
+
+            if request.response_callbacks or has_listeners:
+                await run_in_thread(
+                    request, self._process_response, request, response
+                )
+            timings and timings.mark('response_callbacks')
+
+            return response
+
+        finally:
+            if request.finished_callbacks:
+                await run_in_thread(request, self.finish_request, request)
+            else:
+                self.finish_request(request)
+            if timings is not None:
+                timings.mark('finished_callbacks')
+                await run_in_thread(request, timing_sink, request, timings)
+
+    def _process_response(self, request, response):
+        if request.response_callbacks:
+            request._process_response_callbacks(response)
+        registry = self.registry
+        registry.has_listeners and registry.notify(
+            NewResponse(request, response)
+        )
 
     def finish_request(self, request):
         if request.finished_callbacks:
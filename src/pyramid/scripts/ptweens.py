@@ -5,6 +5,7 @@ import textwrap
 from pyramid.interfaces import ITweens
 from pyramid.paster import bootstrap, setup_logging
 from pyramid.scripts.common import parse_vars
+from pyramid.timing import TweenProfile
 from pyramid.tweens import INGRESS, MAIN
 
 
@@ -26,6 +27,10 @@ class PTweensCommand:
     shell. The format is "inifile#name". If the name is left off, "main"
     will be assumed.  Example: "ptweens myapp.ini#main".
 
+    With "--profile N", N requests for the "--path" URL path are sent
+    through the tween chain, and the time spent in each tween (excluding the
+    tweens and the router it calls) is reported.
+
     """
     parser = argparse.ArgumentParser(
         description=textwrap.dedent(description),
@@ -48,6 +53,22 @@ class PTweensCommand:
         "passed here.",
     )
 
+    parser.add_argument(
+        '--profile',
+        type=int,
+        default=0,
+        metavar='N',
+        help='Send N requests through the tween chain and report the time '
+        'spent in each tween.',
+    )
+
+    parser.add_argument(
+        '--path',
+        default='/',
+        help='The URL path of the requests sent by --profile '
+        '(default: "/").',
+    )
+
     stdout = sys.stdout
     bootstrap = staticmethod(bootstrap)  # testing
     setup_logging = staticmethod(setup_logging)  # testing
@@ -75,6 +96,47 @@ class PTweensCommand:
             self.out(fmt % (pos, name))
         self.out(fmt % ('-', MAIN))
 
+    def profile_chain(self, registry, tweens, count, path):
+        from pyramid.request import Request
+        from pyramid.router import Router
+
+        saved_profile = tweens.profile
+        profile = tweens.profile = TweenProfile()
+        try:
+            router = Router(registry)
+        finally:
+            tweens.profile = saved_profile
+        environ = Request.blank(path).environ
+        for _ in range(count):
+            with router.request_context(environ.copy()) as request:
+                try:
+                    router.invoke_request(request)
+                except Exception:
+                    # an exception escaping the tweens still went through
+                    # them
+                    pass
+        return profile
+
+    def show_profile(self, chain, profile):
+        fmt = '%-40s  %7s  %8s  %8s  %8s'
+        self.out(fmt % ('Name', 'Count', 'Mean ms', 'p50 ms', 'p99 ms'))
+        self.out(fmt % ('-' * 4, '-' * 5, '-' * 7, '-' * 6, '-' * 6))
+        for name in [name for name, _ in chain] + [MAIN]:
+            histogram = profile.histograms.get(name)
+            if histogram is None:
+                self.out(fmt % (name, 0, '-', '-', '-'))
+                continue
+            self.out(
+                fmt
+                % (
+                    name,
+                    histogram.count,
+                    '%.3f' % (histogram.mean * 1000),
+                    '%.3f' % (histogram.percentile(50) * 1000),
+                    '%.3f' % (histogram.percentile(99) * 1000),
+                )
+            )
+
     def run(self):
         if not self.args.config_uri:
             self.out('Requires a config file argument')
@@ -109,6 +171,13 @@ class PTweensCommand:
                 self.out('Implicit Tween Chain')
                 self.out('')
                 self.show_chain(tweens.implicit())
+            if self.args.profile > 0:
+                count, path = self.args.profile, self.args.path
+                profile = self.profile_chain(registry, tweens, count, path)
+                self.out('')
+                self.out('Tween Profile (%d requests to %s)' % (count, path))
+                self.out('')
+                self.show_profile(explicit or tweens.implicit(), profile)
         return 0
 
 
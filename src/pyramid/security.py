@@ -1,3 +1,4 @@
+import copy
 from zope.deprecation import deprecated
 from zope.interface import implementer, providedBy
 
@@ -276,6 +277,38 @@ class SecurityAPIMixin:
             return Allowed('No security policy in use.')
         return policy.permits(self, context, permission)
 
+    def filter_permitted(self, resources, permission):
+        """Return a list of those of ``resources`` for which this request
+        has the given permission, in order.
+
+        This method delegates to the ``filter_permitted(request, resources,
+        permission)`` method of the current security policy if it has one,
+        which may check the resources together.  Otherwise, it calls the
+        policy's ``permits`` method for each resource, keeping those for
+        which it returns :data:`pyramid.security.Allowed`.  Every resource
+        is kept if no security policy has been registered for this request.
+
+        :param resources: An iterable of resource objects
+        :param permission: The permission to check for
+        :type permission: str
+        :returns: A list of resource objects
+
+        .. versionadded:: 2.1
+
+        """
+        policy = _get_security_policy(self)
+        if policy is None:
+            return list(resources)
+        filter_permitted = getattr(policy, 'filter_permitted', None)
+        if filter_permitted is not None:
+            return filter_permitted(self, resources, permission)
+        permits = policy.permits
+        return [
+            resource
+            for resource in resources
+            if permits(self, resource, permission)
+        ]
+
 
 class AuthenticationAPIMixin:
     """Mixin for Request class providing compatibility properties."""
@@ -334,8 +367,7 @@ class AuthenticationAPIMixin:
 
         security = _get_security_policy(self)
         if security is not None and isinstance(security, LegacySecurityPolicy):
-            authn = security._get_authn_policy(self)
-            return authn.effective_principals(self)
+            return security.effective_principals(self)
         return [Everyone]
 
     effective_principals = deprecated(
@@ -354,24 +386,75 @@ class LegacySecurityPolicy:
     A :term:`security policy` which provides a backwards compatibility shim for
     the :term:`authentication policy` and the :term:`authorization policy`.
 
+    The authenticated userid and the effective principals returned by the
+    authentication policy, whose ``callback`` may query a database, are
+    remembered for the rest of the request, until :meth:`remember` or
+    :meth:`forget` is called for it.  The ``saved_calls`` attribute counts
+    the calls to the authentication policy saved this way.
+
+    .. versionchanged:: 2.1
+       The authenticated userid and the effective principals are remembered
+       for the rest of the request.
+
     """
 
+    def __init__(self):
+        from pyramid.request import RequestLocalCache
+
+        self._userid_cache = RequestLocalCache()
+        self._principals_cache = RequestLocalCache()
+        self.saved_calls = 0
+
     def _get_authn_policy(self, request):
         return request.registry.getUtility(IAuthenticationPolicy)
 
     def _get_authz_policy(self, request):
         return request.registry.getUtility(IAuthorizationPolicy)
 
+    def _get_or_create(self, cache, request, creator):
+        value = cache.get(request)
+        if value is cache.NO_VALUE:
+            value = creator(request)
+            cache.set(request, value)
+        else:
+            self.saved_calls += 1
+        return value
+
+    def _clear_caches(self, request):
+        self._userid_cache.clear(request)
+        self._principals_cache.clear(request)
+
     def identity(self, request):
         return self.authenticated_userid(request)
 
     def authenticated_userid(self, request):
         authn = self._get_authn_policy(request)
-        return authn.authenticated_userid(request)
+        return self._get_or_create(
+            self._userid_cache, request, authn.authenticated_userid
+        )
+
+    def effective_principals(self, request):
+        """Return the effective principals of the ``request`` according to
+        the authentication policy.
+
+        .. versionadded:: 2.1
+
+        """
+        authn = self._get_authn_policy(request)
+        principals = self._get_or_create(
+            self._principals_cache, request, authn.effective_principals
+        )
+        # a copy, so that a caller changing it can't change the principals
+        # of later calls
+        return copy.copy(principals)
 
     def remember(self, request, userid, **kw):
         authn = self._get_authn_policy(request)
-        return authn.remember(request, userid, **kw)
+        headers = authn.remember(request, userid, **kw)
+        # a policy may change the identity of the request, as the session
+        # authentication policy does
+        self._clear_caches(request)
+        return headers
 
     def forget(self, request, **kw):
         if kw:
@@ -380,14 +463,27 @@ class LegacySecurityPolicy:
                 'arguments for `forget`'
             )
         authn = self._get_authn_policy(request)
-        return authn.forget(request)
+        headers = authn.forget(request)
+        self._clear_caches(request)
+        return headers
 
     def permits(self, request, context, permission):
-        authn = self._get_authn_policy(request)
         authz = self._get_authz_policy(request)
-        principals = authn.effective_principals(request)
+        principals = self.effective_principals(request)
         return authz.permits(context, principals, permission)
 
+    def filter_permitted(self, request, resources, permission):
+        authz = self._get_authz_policy(request)
+        principals = self.effective_principals(request)
+        filter_permitted = getattr(authz, 'filter_permitted', None)
+        if filter_permitted is not None:
+            return filter_permitted(resources, principals, permission)
+        return [
+            resource
+            for resource in resources
+            if authz.permits(resource, principals, permission)
+        ]
+
 
 Everyone = 'system.Everyone'
 Authenticated = 'system.Authenticated'
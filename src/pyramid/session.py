@@ -1,13 +1,18 @@
 import binascii
+from collections import OrderedDict
 import os
 import pickle
+import re
+import sqlite3
+import tempfile
+import threading
 import time
 from webob.cookies import JSONSerializer, SignedSerializer
 from zope.deprecation import deprecated
 from zope.interface import implementer
 
 from pyramid.csrf import check_csrf_origin, check_csrf_token
-from pyramid.interfaces import ISession
+from pyramid.interfaces import ISession, ISessionStore
 from pyramid.util import bytes_, text_
 
 
@@ -26,6 +31,19 @@ def manage_accessed(wrapped):
     return accessed
 
 
+def manage_loaded(wrapped):
+    """Decorator which causes the state of a lazily loaded session to be
+    loaded before a method is called."""
+
+    def loaded(session, *arg, **kw):
+        if not session._loaded:
+            session._load()
+        return wrapped(session, *arg, **kw)
+
+    loaded.__doc__ = wrapped.__doc__
+    return loaded
+
+
 def manage_changed(wrapped):
     """Decorator which causes a cookie to be set when a setter method
     is called."""
@@ -114,6 +132,12 @@ def BaseCookieSessionFactory(
     which are limited to storing fewer than 4000 bytes of data (as the
     payload must fit into a single cookie).
 
+    The state of a session is only loaded from its cookie when the session
+    is first used.  Code reading the storage of the underlying ``dict``
+    directly rather than through its methods, such as the C accelerator of
+    :func:`json.dumps`, sees an empty dictionary until then; pass it
+    ``dict(session)`` instead.
+
     .. warning:
 
        This class provides no protection from tampering and is only intended
@@ -185,6 +209,10 @@ def BaseCookieSessionFactory(
     .. versionchanged: 1.10
 
        Added the ``samesite`` option and made the default ``'Lax'``.
+
+    .. versionchanged: 2.1
+
+       The state of a session is loaded when the session is first used.
     """
 
     @implementer(ISession)
@@ -208,46 +236,19 @@ def BaseCookieSessionFactory(
         # dirty flag
         _dirty = False
 
+        # whether the state of the session was loaded from the request, and
+        # the attributes set when it is
+        _loaded = False
+        _loaded_attrs = frozenset(('created', 'accessed', 'renewed', 'new'))
+
         def __init__(self, request):
             self.request = request
-            now = time.time()
-            created = renewed = now
-            new = True
-            value = None
-            state = {}
-            cookieval = request.cookies.get(self._cookie_name)
-            if cookieval is not None:
-                try:
-                    value = serializer.loads(bytes_(cookieval))
-                except ValueError:
-                    # the cookie failed to deserialize, dropped
-                    value = None
-
-            if value is not None:
-                try:
-                    # since the value is not necessarily signed, we have
-                    # to unpack it a little carefully
-                    rval, cval, sval = value
-                    renewed = float(rval)
-                    created = float(cval)
-                    state = sval
-                    new = False
-                except (TypeError, ValueError):
-                    # value failed to unpack properly or renewed was not
-                    # a numeric type so we'll fail deserialization here
-                    state = {}
 
-            if self._timeout is not None:
-                if now - renewed > self._timeout:
-                    # expire the session because it was not renewed
-                    # before the timeout threshold
-                    state = {}
-
-            self.created = created
-            self.accessed = renewed
-            self.renewed = renewed
-            self.new = new
-            dict.__init__(self, state)
+        def __getattr__(self, name):
+            if name in self._loaded_attrs and not self._loaded:
+                self._load()
+                return getattr(self, name)
+            raise AttributeError(name)
 
         # ISession methods
         def changed(self):
@@ -264,48 +265,87 @@ def BaseCookieSessionFactory(
             self.clear()  # XXX probably needs to unset cookie
 
         # non-modifying dictionary methods
-        get = manage_accessed(dict.get)
-        __getitem__ = manage_accessed(dict.__getitem__)
-        items = manage_accessed(dict.items)
-        values = manage_accessed(dict.values)
-        keys = manage_accessed(dict.keys)
-        __contains__ = manage_accessed(dict.__contains__)
-        __len__ = manage_accessed(dict.__len__)
-        __iter__ = manage_accessed(dict.__iter__)
+        get = manage_loaded(manage_accessed(dict.get))
+        __getitem__ = manage_loaded(manage_accessed(dict.__getitem__))
+        items = manage_loaded(manage_accessed(dict.items))
+        values = manage_loaded(manage_accessed(dict.values))
+        keys = manage_loaded(manage_accessed(dict.keys))
+        __contains__ = manage_loaded(manage_accessed(dict.__contains__))
+        __len__ = manage_loaded(manage_accessed(dict.__len__))
+        __iter__ = manage_loaded(manage_accessed(dict.__iter__))
+        copy = manage_loaded(dict.copy)
+        __eq__ = manage_loaded(dict.__eq__)
+        __ne__ = manage_loaded(dict.__ne__)
+        __repr__ = manage_loaded(dict.__repr__)
+
+        # non-modifying dictionary methods missing from some Python versions
+        @manage_loaded
+        @manage_accessed
+        def __reversed__(self):
+            return reversed(list(dict.__iter__(self)))
+
+        @manage_loaded
+        @manage_accessed
+        def __or__(self, other):
+            if not isinstance(other, dict):
+                return NotImplemented
+            new = dict.copy(self)
+            new.update(other)
+            return new
+
+        @manage_loaded
+        @manage_accessed
+        def __ror__(self, other):
+            if not isinstance(other, dict):
+                return NotImplemented
+            new = dict(other)
+            new.update(dict.items(self))
+            return new
 
         # modifying dictionary methods
-        clear = manage_changed(dict.clear)
-        update = manage_changed(dict.update)
-        setdefault = manage_changed(dict.setdefault)
-        pop = manage_changed(dict.pop)
-        popitem = manage_changed(dict.popitem)
-        __setitem__ = manage_changed(dict.__setitem__)
-        __delitem__ = manage_changed(dict.__delitem__)
+        clear = manage_loaded(manage_changed(dict.clear))
+        update = manage_loaded(manage_changed(dict.update))
+        setdefault = manage_loaded(manage_changed(dict.setdefault))
+        pop = manage_loaded(manage_changed(dict.pop))
+        popitem = manage_loaded(manage_changed(dict.popitem))
+        __setitem__ = manage_loaded(manage_changed(dict.__setitem__))
+        __delitem__ = manage_loaded(manage_changed(dict.__delitem__))
+
+        @manage_loaded
+        @manage_changed
+        def __ior__(self, other):
+            dict.update(self, other)
+            return self
 
         # flash API methods
+        @manage_loaded
         @manage_changed
         def flash(self, msg, queue='', allow_duplicate=True):
             storage = self.setdefault('_f_' + queue, [])
             if allow_duplicate or (msg not in storage):
                 storage.append(msg)
 
+        @manage_loaded
         @manage_changed
         def pop_flash(self, queue=''):
             storage = self.pop('_f_' + queue, [])
             return storage
 
+        @manage_loaded
         @manage_accessed
         def peek_flash(self, queue=''):
             storage = self.get('_f_' + queue, [])
             return storage
 
         # CSRF API methods
+        @manage_loaded
         @manage_changed
         def new_csrf_token(self):
             token = text_(binascii.hexlify(os.urandom(20)))
             self['_csrft_'] = token
             return token
 
+        @manage_loaded
         @manage_accessed
         def get_csrf_token(self):
             token = self.get('_csrft_', None)
@@ -314,13 +354,57 @@ def BaseCookieSessionFactory(
             return token
 
         # non-API methods
-        def _set_cookie(self, response):
-            if not self._cookie_on_exception:
-                exception = getattr(self.request, 'exception', None)
-                if (
-                    exception is not None
-                ):  # dont set a cookie during exceptions
-                    return False
+        def _load(self):
+            # the cookie is only deserialized (and its signature verified)
+            # once the session is used
+            now = time.time()
+            created = renewed = now
+            new = True
+            state = {}
+            value = self._load_value(self.request)
+
+            if value is not None:
+                try:
+                    # since the value is not necessarily signed, we have
+                    # to unpack it a little carefully
+                    rval, cval, sval = value
+                    renewed = float(rval)
+                    created = float(cval)
+                    state = sval
+                    new = False
+                except (TypeError, ValueError):
+                    # value failed to unpack properly or renewed was not
+                    # a numeric type so we'll fail deserialization here
+                    state = {}
+
+            if self._timeout is not None:
+                if now - renewed > self._timeout:
+                    # expire the session because it was not renewed
+                    # before the timeout threshold
+                    state = {}
+
+            self.created = created
+            self.accessed = renewed
+            self.renewed = renewed
+            self.new = new
+            dict.update(self, state)
+            # only once loading succeeded, so a failure is raised again the
+            # next time the session is used
+            self._loaded = True
+
+        def _load_value(self, request):
+            # the (renewed, created, state) value of the session found in
+            # the request, or None
+            cookieval = request.cookies.get(self._cookie_name)
+            if cookieval is not None:
+                try:
+                    return serializer.loads(bytes_(cookieval))
+                except ValueError:
+                    # the cookie failed to deserialize, dropped
+                    pass
+            return None
+
+        def _cookie_value(self):
             cookieval = text_(
                 serializer.dumps((self.accessed, self.created, dict(self)))
             )
@@ -329,6 +413,16 @@ def BaseCookieSessionFactory(
                     'Cookie value is too long to store (%s bytes)'
                     % len(cookieval)
                 )
+            return cookieval
+
+        def _set_cookie(self, response):
+            if not self._cookie_on_exception:
+                exception = getattr(self.request, 'exception', None)
+                if (
+                    exception is not None
+                ):  # dont set a cookie during exceptions
+                    return False
+            cookieval = self._cookie_value()
             response.set_cookie(
                 self._cookie_name,
                 value=cookieval,
@@ -493,6 +587,428 @@ def SignedCookieSessionFactory(
     )
 
 
+class _PurgingSessionStore:
+    #: The number of saves after which the expired sessions are purged, or
+    #: ``0`` to only purge them when :meth:`purge` is called.
+    purge_interval = 1000
+
+    _saves = 0
+
+    def _saved(self):
+        self._saves += 1
+        if self.purge_interval and self._saves % self.purge_interval == 0:
+            self.purge()
+
+
+@implementer(ISessionStore)
+class MemorySessionStore(_PurgingSessionStore):
+    """A :class:`pyramid.interfaces.ISessionStore` keeping the state of the
+    sessions in memory.  The sessions are lost when the process exits and
+    are not shared with other processes.
+
+    At most ``max_entries`` sessions are kept; the least recently used one
+    is forgotten to make room for another one.  Expired sessions are
+    forgotten when they are loaded or purged.
+
+    .. versionadded:: 2.1
+    """
+
+    def __init__(self, max_entries=10000):
+        self.max_entries = max_entries
+        # session id -> (expiry time or None, data), least recently used
+        # first
+        self._sessions = OrderedDict()
+        self._lock = threading.Lock()
+
+    def load(self, session_id):
+        with self._lock:
+            entry = self._sessions.get(session_id)
+            if entry is None:
+                return None
+            expires, data = entry
+            if expires is not None and expires < time.time():
+                del self._sessions[session_id]
+                return None
+            self._sessions.move_to_end(session_id)
+            return data
+
+    def save(self, session_id, data, timeout):
+        expires = None if timeout is None else time.time() + timeout
+        with self._lock:
+            sessions = self._sessions
+            sessions[session_id] = (expires, data)
+            sessions.move_to_end(session_id)
+            while len(sessions) > self.max_entries:
+                sessions.popitem(last=False)
+        self._saved()
+
+    def delete(self, session_id):
+        with self._lock:
+            self._sessions.pop(session_id, None)
+
+    def purge(self):
+        """Forget the expired sessions."""
+        now = time.time()
+        with self._lock:
+            sessions = self._sessions
+            expired = [
+                session_id
+                for session_id, (expires, data) in sessions.items()
+                if expires is not None and expires < now
+            ]
+            for session_id in expired:
+                del sessions[session_id]
+
+
+@implementer(ISessionStore)
+class SQLiteSessionStore(_PurgingSessionStore):
+    """A :class:`pyramid.interfaces.ISessionStore` keeping the state of the
+    sessions in the table named ``table`` of the SQLite database at
+    ``path``, which is created if it doesn't exist.  The processes of an
+    application may share the database.
+
+    Expired sessions are forgotten when they are loaded and every
+    :attr:`purge_interval` saves.  Sessions saved with no ``timeout`` never
+    expire: if ``max_entries`` isn't ``None``, the least recently saved
+    sessions beyond the first ``max_entries`` are forgotten when purging,
+    otherwise such sessions are kept until they are deleted.
+
+    .. versionadded:: 2.1
+    """
+
+    def __init__(self, path, table='pyramid_sessions', max_entries=None):
+        self.path = path
+        self.table = table
+        self.max_entries = max_entries
+        self._connection = sqlite3.connect(
+            path, check_same_thread=False, isolation_level=None
+        )
+        self._lock = threading.Lock()
+        self._execute(
+            'CREATE TABLE IF NOT EXISTS "%(table)s" '
+            '(id TEXT PRIMARY KEY, data BLOB NOT NULL, expires REAL)'
+        )
+
+    def _execute(self, sql, params=()):
+        with self._lock:
+            return self._connection.execute(
+                sql % {'table': self.table}, params
+            ).fetchone()
+
+    def load(self, session_id):
+        row = self._execute(
+            'SELECT data, expires FROM "%(table)s" WHERE id = ?',
+            (session_id,),
+        )
+        if row is None:
+            return None
+        data, expires = row
+        if expires is not None and expires < time.time():
+            self.delete(session_id)
+            return None
+        return bytes(data)
+
+    def save(self, session_id, data, timeout):
+        expires = None if timeout is None else time.time() + timeout
+        self._execute(
+            'INSERT OR REPLACE INTO "%(table)s" (id, data, expires) '
+            'VALUES (?, ?, ?)',
+            (session_id, data, expires),
+        )
+        self._saved()
+
+    def delete(self, session_id):
+        self._execute('DELETE FROM "%(table)s" WHERE id = ?', (session_id,))
+
+    def purge(self):
+        """Forget the expired sessions and, if ``max_entries`` isn't
+        ``None``, the least recently saved sessions beyond the first
+        ``max_entries``."""
+        self._execute(
+            'DELETE FROM "%(table)s" WHERE expires < ?', (time.time(),)
+        )
+        if self.max_entries is not None:
+            # a replaced row gets a new rowid, greater than the others
+            self._execute(
+                'DELETE FROM "%(table)s" WHERE rowid NOT IN '
+                '(SELECT rowid FROM "%(table)s" ORDER BY rowid DESC LIMIT ?)',
+                (self.max_entries,),
+            )
+
+    def close(self):
+        """Close the connection to the database."""
+        with self._lock:
+            self._connection.close()
+
+
+_session_id_re = re.compile('[0-9a-f]+')
+
+
+@implementer(ISessionStore)
+class FileSessionStore(_PurgingSessionStore):
+    """A :class:`pyramid.interfaces.ISessionStore` keeping the state of each
+    session in a file of the directory ``directory``, which is created if it
+    doesn't exist.  The processes of an application may share the
+    directory.
+
+    Expired sessions are forgotten when they are loaded and every
+    :attr:`purge_interval` saves.  Sessions saved with no ``timeout`` never
+    expire: if ``max_entries`` isn't ``None``, the least recently saved
+    sessions beyond the first ``max_entries`` are forgotten when purging,
+    otherwise such sessions are kept until they are deleted.
+
+    .. versionadded:: 2.1
+    """
+
+    def __init__(self, directory, max_entries=None):
+        self.directory = os.path.abspath(directory)
+        self.max_entries = max_entries
+        os.makedirs(self.directory, exist_ok=True)
+
+    def _path(self, session_id):
+        if not _session_id_re.fullmatch(session_id):
+            raise ValueError('Invalid session id %r' % (session_id,))
+        return os.path.join(self.directory, session_id)
+
+    def load(self, session_id):
+        path = self._path(session_id)
+        try:
+            with open(path, 'rb') as f:
+                expires, data = f.read().split(b'\n', 1)
+            expires = None if expires == b'-' else float(expires)
+        except (OSError, ValueError):
+            return None
+        if expires is not None and expires < time.time():
+            self.delete(session_id)
+            return None
+        return data
+
+    def save(self, session_id, data, timeout):
+        path = self._path(session_id)
+        if timeout is None:
+            expires = b'-'
+        else:
+            expires = b'%f' % (time.time() + timeout)
+        # write a temporary file renamed over the session's file, so that
+        # the session's file is never partially written
+        fd, tmp = tempfile.mkstemp(dir=self.directory, prefix='.')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(expires + b'\n' + data)
+            os.replace(tmp, path)
+        except BaseException:
+            os.remove(tmp)
+            raise
+        self._saved()
+
+    def delete(self, session_id):
+        try:
+            os.remove(self._path(session_id))
+        except FileNotFoundError:
+            pass
+
+    def purge(self):
+        """Forget the expired sessions and, if ``max_entries`` isn't
+        ``None``, the least recently saved sessions beyond the first
+        ``max_entries``."""
+        kept = []
+        for name in os.listdir(self.directory):
+            if _session_id_re.fullmatch(name) and self.load(name) is not None:
+                kept.append(name)
+        if self.max_entries is not None and len(kept) > self.max_entries:
+            saved = {}
+            for name in kept:
+                try:
+                    saved[name] = os.stat(self._path(name)).st_mtime
+                except FileNotFoundError:
+                    pass
+            kept = sorted(saved, key=saved.get, reverse=True)
+            for name in kept[self.max_entries :]:
+                self.delete(name)
+
+
+def ServerSideSessionFactory(
+    secret,
+    store=None,
+    cookie_name='session',
+    max_age=None,
+    path='/',
+    domain=None,
+    secure=False,
+    httponly=False,
+    samesite='Lax',
+    set_on_exception=True,
+    timeout=1200,
+    reissue_time=0,
+    hashalg='sha512',
+    salt='pyramid.session.id.',
+    serializer=None,
+):
+    """
+    Configure a :term:`session factory` which will provide sessions whose
+    state is kept on the server, in a session ``store``, while the session
+    cookie only holds a signed session id.  The return value of this
+    function is a :term:`session factory`, which may be provided as
+    the ``session_factory`` argument of a
+    :class:`pyramid.config.Configurator` constructor, or used
+    as the ``session_factory`` argument of the
+    :meth:`pyramid.config.Configurator.set_session_factory`
+    method.
+
+    Unlike the sessions of :func:`SignedCookieSessionFactory`, these sessions
+    are not limited in size, and the size of the session cookie doesn't grow
+    with the data stored in the session.  A new session id is used once the
+    session is invalidated.
+
+    Parameters:
+
+    ``secret``
+      A string which is used to sign the session id. The secret should be at
+      least as long as the block size of the selected hash algorithm. For
+      ``sha512`` this would mean a 512 bit (64 character) secret.  It should
+      be unique within the set of secret values provided to Pyramid for
+      its various subsystems (see :ref:`admonishment_against_secret_sharing`).
+
+    ``store``
+      A :class:`pyramid.interfaces.ISessionStore` keeping the state of the
+      sessions, such as a :class:`MemorySessionStore`,
+      :class:`SQLiteSessionStore` or :class:`FileSessionStore`.  Default: a
+      new :class:`MemorySessionStore`, which is not shared with the other
+      processes of the application.
+
+    ``hashalg``
+      The HMAC digest algorithm to use for signing. The algorithm must be
+      supported by the :mod:`hashlib` library. Default: ``'sha512'``.
+
+    ``salt``
+      A namespace to avoid collisions between different uses of a shared
+      secret. Reusing a secret for different parts of an application is
+      strongly discouraged (see :ref:`admonishment_against_secret_sharing`).
+      Default: ``'pyramid.session.id.'``.
+
+    ``cookie_name``
+      The name of the cookie used for sessioning. Default: ``'session'``.
+
+    ``max_age``
+      The maximum age of the cookie used for sessioning (in seconds).
+      Default: ``None`` (browser scope).
+
+    ``path``
+      The path used for the session cookie. Default: ``'/'``.
+
+    ``domain``
+      The domain used for the session cookie.  Default: ``None`` (no domain).
+
+    ``secure``
+      The 'secure' flag of the session cookie. Default: ``False``.
+
+    ``httponly``
+      Hide the cookie from Javascript by setting the 'HttpOnly' flag of the
+      session cookie. Default: ``False``.
+
+    ``samesite``
+      The 'samesite' option of the session cookie. Set the value to ``None``
+      to turn off the samesite option.  Default: ``'Lax'``.
+
+    ``timeout``
+      A number of seconds of inactivity before a session times out. If
+      ``None`` then the session never expires.  The store forgets the
+      state of a session which timed out.  Default: ``1200``.
+
+    ``reissue_time``
+      The number of seconds that must pass before the session is
+      automatically saved again and its cookie reissued as the result of
+      accessing the session, extending its lifetime.  If this value is
+      ``0``, the session is saved on every request accessing it.  If
+      ``None`` then the session's lifetime will never be extended.
+      Default: ``0``.
+
+    ``set_on_exception``
+      If ``True``, save the session and set its cookie even if an exception
+      occurs while rendering a view. Default: ``True``.
+
+    ``serializer``
+      An object with two methods: ``loads`` and ``dumps``, used to serialize
+      the state of the session to the bytes kept by the store.  The
+      ``loads`` method should accept bytes and return a Python object.  The
+      ``dumps`` method should accept a Python object and return bytes.  A
+      ``ValueError`` should be raised for malformed inputs.  If a serializer
+      is not passed, the :class:`pyramid.session.JSONSerializer` serializer
+      will be used.
+
+    .. versionadded:: 2.1
+
+    """
+    if store is None:
+        store = MemorySessionStore()
+
+    if serializer is None:
+        serializer = JSONSerializer()
+
+    id_serializer = SignedSerializer(
+        secret, salt, hashalg, serializer=JSONSerializer()
+    )
+
+    CookieSession = BaseCookieSessionFactory(
+        serializer,
+        cookie_name=cookie_name,
+        max_age=max_age,
+        path=path,
+        domain=domain,
+        secure=secure,
+        httponly=httponly,
+        samesite=samesite,
+        timeout=timeout,
+        reissue_time=reissue_time,
+        set_on_exception=set_on_exception,
+    )
+
+    class ServerSideSession(CookieSession):
+        """Dictionary-like session object whose state is kept in a store"""
+
+        _store = store
+        _loaded_attrs = CookieSession._loaded_attrs | {'_session_id'}
+
+        def invalidate(self):
+            self.clear()
+            self._store.delete(self._session_id)
+            self._session_id = _new_session_id()
+
+        # non-API methods
+        def _load_value(self, request):
+            cookieval = request.cookies.get(self._cookie_name)
+            if cookieval is not None:
+                try:
+                    session_id = id_serializer.loads(bytes_(cookieval))
+                except ValueError:
+                    # the cookie failed to verify, dropped
+                    session_id = None
+                if isinstance(session_id, str):
+                    data = self._store.load(session_id)
+                    if data is not None:
+                        try:
+                            value = serializer.loads(data)
+                        except ValueError:
+                            # the state failed to deserialize, dropped
+                            value = None
+                        if value is not None:
+                            self._session_id = session_id
+                            return value
+            self._session_id = _new_session_id()
+            return None
+
+        def _cookie_value(self):
+            data = serializer.dumps((self.accessed, self.created, dict(self)))
+            self._store.save(self._session_id, data, self._timeout)
+            return text_(id_serializer.dumps(self._session_id))
+
+    return ServerSideSession
+
+
+def _new_session_id():
+    return text_(binascii.hexlify(os.urandom(32)))
+
+
 check_csrf_origin = check_csrf_origin  # api
 deprecated(
     'check_csrf_origin',
@@ -10,6 +10,7 @@ from pyramid.httpexceptions import HTTPMovedPermanently, HTTPNotFound
 from pyramid.path import caller_package
 from pyramid.response import FileResponse, _guess_type
 from pyramid.traversal import traversal_path_info
+from pyramid.util import acceptable_offers
 
 
 class static_view:
@@ -217,11 +218,11 @@ class static_view:
             return identity_path, None
 
         # find encodings the client will accept
+        offers = tuple(
+            encoding for path, encoding in files if encoding is not None
+        )
         acceptable_encodings = {
-            x[0]
-            for x in request.accept_encoding.acceptable_offers(
-                [encoding for path, encoding in files if encoding is not None]
-            )
+            x[0] for x in acceptable_offers(request, offers, 'accept_encoding')
         }
         acceptable_encodings.add(None)
 
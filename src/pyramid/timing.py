@@ -0,0 +1,279 @@
+import functools
+from inspect import isawaitable
+import logging
+import threading
+import time
+
+from pyramid.asgi import is_coroutine_callable
+from pyramid.response import Response
+
+
+class RequestTimings:
+    """The phases of processing a request, as a list of ``(phase, start,
+    end)`` spans of :func:`time.perf_counter` timestamps in the ``spans``
+    attribute, in the order in which they ended.
+
+    The :term:`router` records the following phases, one after the other:
+
+    ``ingress``
+      The tweens called before the router's main handler.
+
+    ``new_request``
+      Notifying :class:`pyramid.events.NewRequest` subscribers.
+
+    ``route_match``
+      Matching the request against the application's routes.
+
+    ``root_factory``
+      Notifying :class:`pyramid.events.BeforeTraversal` subscribers and
+      calling the :term:`root factory`.
+
+    ``traversal``
+      Finding the :term:`context` and notifying
+      :class:`pyramid.events.ContextFound` subscribers.
+
+    ``view_lookup``
+      Looking up the view callables registered for the context.
+
+    ``view``
+      Calling the view callable.  Each :term:`view deriver` wrapping it is
+      also recorded as a span named after the deriver, which begins and ends
+      within this phase.  Rendering is the ``rendered_view`` span.
+
+    ``egress``
+      The tweens returning from the router's main handler, including any
+      exception view called by the excview tween.
+
+    ``response_callbacks``
+      Calling the request's :term:`response callback`\\s and notifying
+      :class:`pyramid.events.NewResponse` subscribers.
+
+    ``finished_callbacks``
+      Calling the request's :term:`finished callback`\\s.
+
+    A phase is missing when an exception raised before it ends skips it.
+
+    .. versionadded:: 2.1
+    """
+
+    def __init__(self):
+        self.start = self.last = time.perf_counter()
+        self.spans = []
+
+    def mark(self, phase):
+        """Record that ``phase`` ended now, having begun when the previous
+        phase ended."""
+        now = time.perf_counter()
+        self.spans.append((phase, self.last, now))
+        self.last = now
+
+    @property
+    def total(self):
+        """The time, in seconds, from the start of the first phase to the
+        end of the last one."""
+        return self.last - self.start
+
+    def durations(self):
+        """Return a list of ``(phase, seconds)`` pairs in the order in which
+        the phases began.  The time spent in a phase excludes the time spent
+        in the phases it contains, so that the durations add up to
+        :attr:`total`."""
+        spans = sorted(self.spans, key=lambda span: (span[1], -span[2]))
+        durations = []
+        stack = []
+        for phase, start, end in spans:
+            while stack and stack[-1][1] <= start:
+                stack.pop()
+            if stack:
+                durations[stack[-1][0]][1] -= end - start
+            stack.append((len(durations), end))
+            durations.append([phase, end - start])
+        return [(phase, seconds) for phase, seconds in durations]
+
+
+class TimingsLogger:
+    """A :term:`request timing sink` logging the durations of the phases of
+    each request on a single line at the ``DEBUG`` level.
+
+    ``logger`` is a :class:`logging.Logger` or the name of one.
+
+    .. versionadded:: 2.1
+    """
+
+    def __init__(self, logger='pyramid.timing'):
+        if isinstance(logger, str):
+            logger = logging.getLogger(logger)
+        self.logger = logger
+
+    def __call__(self, request, timings):
+        logger = self.logger
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                '%s %s %.3fms (%s)',
+                request.method,
+                request.path_info,
+                timings.total * 1000,
+                ', '.join(
+                    '%s=%.3fms' % (phase, seconds * 1000)
+                    for phase, seconds in timings.durations()
+                ),
+            )
+
+
+class LatencyHistogram:
+    """Counts durations in buckets whose bounds are powers of two
+    microseconds, along with their total, minimum and maximum.
+
+    .. versionadded:: 2.1
+    """
+
+    def __init__(self):
+        # counts[i] is the number of durations in [2 ** (i - 1), 2 ** i)
+        # microseconds; counts[0] is the number of durations under 1us.
+        self.counts = []
+        self.count = 0
+        self.total = 0.0
+        self.min = None
+        self.max = 0.0
+
+    def add(self, seconds):
+        """Count a duration of ``seconds``."""
+        index = int(seconds * 1e6).bit_length()
+        counts = self.counts
+        if index >= len(counts):
+            counts.extend([0] * (index + 1 - len(counts)))
+        counts[index] += 1
+        self.count += 1
+        self.total += seconds
+        if self.min is None or seconds < self.min:
+            self.min = seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    @property
+    def mean(self):
+        """The mean duration in seconds, or ``None`` if nothing was
+        counted."""
+        if self.count:
+            return self.total / self.count
+
+    def percentile(self, percent):
+        """Return an upper bound, in seconds, of the ``percent`` (from 0 to
+        100) percentile of the counted durations, or ``None`` if nothing was
+        counted."""
+        rank = self.count * percent / 100
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if count and seen >= rank:
+                return min((1 << index) / 1e6, self.max)
+
+
+class TweenProfile:
+    """A :class:`LatencyHistogram` of the time spent in each :term:`tween`,
+    excluding the time spent in the handlers it calls, keyed by tween name.
+    The router's main handler is named :data:`pyramid.tweens.MAIN`.
+
+    See :ref:`profiling_tweens`.
+
+    .. versionadded:: 2.1
+    """
+
+    def __init__(self):
+        self.histograms = {}
+        self.lock = threading.Lock()
+
+    def record(self, name, seconds):
+        """Add a duration of ``seconds`` to the histogram of ``name``."""
+        with self.lock:
+            histogram = self.histograms.get(name)
+            if histogram is None:
+                histogram = self.histograms[name] = LatencyHistogram()
+            histogram.add(seconds)
+
+    def profiled(self, name, handler):
+        """Wrap the tween or main ``handler`` named ``name``, so that the
+        time spent in it is recorded.  ``handler`` may be a coroutine
+        function."""
+
+        def enter(attrs):
+            # the time spent in the handler's callee, added to by the
+            # profiled handler it calls
+            outer = attrs.get('_tween_profile_cell')
+            cell = attrs['_tween_profile_cell'] = [0.0]
+            return outer, cell, time.perf_counter()
+
+        def leave(attrs, outer, cell, start):
+            elapsed = time.perf_counter() - start
+            attrs['_tween_profile_cell'] = outer
+            if outer is not None:
+                outer[0] += elapsed
+            self.record(name, elapsed - cell[0])
+
+        if is_coroutine_callable(handler):
+
+            @functools.wraps(handler)
+            async def profiled_handler(request):
+                attrs = request.__dict__
+                state = enter(attrs)
+                try:
+                    return await handler(request)
+                finally:
+                    leave(attrs, *state)
+
+        else:
+
+            @functools.wraps(handler)
+            def profiled_handler(request):
+                attrs = request.__dict__
+                state = enter(attrs)
+                try:
+                    return handler(request)
+                finally:
+                    leave(attrs, *state)
+
+        return profiled_handler
+
+
+def timed_view(view, name):
+    """Wrap ``view``, the result of the :term:`view deriver` named
+    ``name``, so that the time spent in it is recorded in the timings of the
+    request.  ``view`` may be a coroutine function, or return an
+    awaitable."""
+    if is_coroutine_callable(view):
+
+        async def _timed_view(context, request):
+            timings = getattr(request, 'timings', None)
+            if timings is None:
+                return await view(context, request)
+            start = time.perf_counter()
+            try:
+                return await view(context, request)
+            finally:
+                timings.spans.append((name, start, time.perf_counter()))
+
+    else:
+
+        def _timed_view(context, request):
+            timings = getattr(request, 'timings', None)
+            if timings is None:
+                return view(context, request)
+            start = time.perf_counter()
+            try:
+                response = view(context, request)
+            except BaseException:
+                timings.spans.append((name, start, time.perf_counter()))
+                raise
+            if response.__class__ is not Response and isawaitable(response):
+                return _timed_awaitable(response, timings, name, start)
+            timings.spans.append((name, start, time.perf_counter()))
+            return response
+
+    return _timed_view
+
+
+async def _timed_awaitable(awaitable, timings, name, start):
+    try:
+        return await awaitable
+    finally:
+        timings.spans.append((name, start, time.perf_counter()))
@@ -1,5 +1,4 @@
-import sys
-
+from pyramid.asgi import coroutine_handler, run_in_thread, synchronous_handler
 from pyramid.httpexceptions import HTTPNotFound
 from pyramid.util import reraise
 
@@ -7,7 +6,7 @@ from pyramid.util import reraise
 def _error_handler(request, exc):
     # NOTE: we do not need to delete exc_info because this function
     # should never be in the call stack of the exception
-    exc_info = sys.exc_info()
+    exc_info = (type(exc), exc, exc.__traceback__)
 
     try:
         response = request.invoke_exception_view(exc_info)
@@ -36,13 +35,27 @@ def excview_tween_factory(handler, registry):
 
     """
 
+    handle_request = synchronous_handler(handler)
+    handle_request_async = coroutine_handler(handler)
+
     def excview_tween(request):
         try:
-            response = handler(request)
+            response = handle_request(request)
         except Exception as exc:
             response = _error_handler(request, exc)
         return response
 
+    async def excview_tween_async(request):
+        try:
+            response = await handle_request_async(request)
+        except Exception as exc:
+            # exception views are looked up and called synchronously
+            response = await run_in_thread(
+                request, _error_handler, request, exc
+            )
+        return response
+
+    excview_tween._coroutine_handler = excview_tween_async
     return excview_tween
 
 
@@ -1,10 +1,12 @@
+from functools import lru_cache, partial
 import re
 from zope.interface import implementer
 
+from pyramid.encode import url_quote
 from pyramid.exceptions import URLDecodeError
 from pyramid.interfaces import IRoute, IRoutesMapper
 from pyramid.traversal import PATH_SAFE, quote_path_segment, split_path_info
-from pyramid.util import is_nonstr_iter, text_
+from pyramid.util import check_predicates, is_nonstr_iter, text_
 
 _marker = object()
 
@@ -25,11 +27,40 @@ class Route:
 
 @implementer(IRoutesMapper)
 class RoutesMapper:
-    def __init__(self):
+    """The default :term:`routes mapper`.
+
+    ``matcher`` names the strategy used to find the route matching a
+    request path.  ``linear`` (the default) tries the pattern of each route
+    in turn.  ``tree`` compiles the routes into a prefix tree keyed on path
+    segments.  ``regex`` compiles the route patterns into a single regex
+    alternation.  ``index`` only tries the routes which could match the
+    first segment of the request path and the request method.  Every
+    strategy returns the same result: the first route, in
+    registration order, whose pattern matches and whose predicates accept
+    the request.
+
+    Whatever the strategy, paths matched by a route without replacement
+    markers or predicates are remembered (up to ``literal_cache_size`` of
+    them) when no earlier route's pattern matches the path, and are then
+    answered without any matching at all.
+    """
+
+    literal_cache_size = 1000
+
+    def __init__(self, matcher='linear'):
+        if matcher not in _matchers:
+            raise ValueError(
+                'Unknown route matcher %r; must be one of %s'
+                % (matcher, ', '.join(sorted(_matchers)))
+            )
         self.routelist = []
         self.static_routes = []
 
         self.routes = {}
+        self.matcher = matcher
+        self._match = None
+        self._literal_routes = {}
+        self._literal_cache = {}
 
     def has_routes(self):
         return bool(self.routelist)
@@ -64,6 +95,8 @@ class RoutesMapper:
             self.static_routes.append(route)
 
         self.routes[name] = route
+        # the matcher is rebuilt from the new routelist on the next request
+        self._match = None
         return route
 
     def generate(self, name, kw):
@@ -80,18 +113,312 @@ class RoutesMapper:
                 e.encoding, e.object, e.start, e.end, e.reason
             )
 
-        for route in self.routelist:
-            match = route.match(path)
+        match = self._match
+        if match is None:
+            match = self._compile()
+        route = self._literal_cache.get(path)
+        if route is not None:
+            return {'match': {}, 'route': route}
+
+        info = match(path, request)
+        route = info['route']
+        if route in self._literal_routes:
+            self._cache_literal(path, route)
+        return info
+
+    def _compile(self):
+        self._literal_routes = {}
+        for index, route in enumerate(self.routelist):
+            parts, remainder = _parse_route(route.pattern)
+            if len(parts) == 1 and not remainder and not route.predicates:
+                self._literal_routes[route] = index
+        self._literal_cache = {}
+        self._match = _matchers[self.matcher](self.routelist)
+        return self._match
+
+    def _cache_literal(self, path, route):
+        cache = self._literal_cache
+        if path in cache or len(cache) >= self.literal_cache_size:
+            return
+        # the predicates of an earlier route whose pattern also matches the
+        # path might accept a different request, so the path can only be
+        # answered from the cache if there is no such route; None records
+        # that there is one
+        index = self._literal_routes[route]
+        for earlier in self.routelist[:index]:
+            if earlier.match(path) is not None:
+                route = None
+                break
+        cache[path] = route
+
+
+def _scan(routes, path, request):
+    for route in routes:
+        match = route.match(path)
+        if match is not None:
+            preds = route.predicates
+            info = {'match': match, 'route': route}
+            if preds and not check_predicates(preds, info, request):
+                continue
+            return info
+
+    return {'route': None, 'match': None}
+
+
+class _RouteNode:
+    __slots__ = ('children', 'wildcard', 'leaves', 'stars', 'regexes')
+
+    def __init__(self):
+        self.children = {}
+        self.wildcard = None
+        # routes ending at this depth: (order, route, params)
+        self.leaves = []
+        # routes with a star argument spanning the rest of the path:
+        # (order, route, params, name)
+        self.stars = []
+        # routes which must be confirmed using their own regex from here on:
+        # (order, route)
+        self.regexes = []
+
+
+class _RouteTree:
+    """Match routes by walking a prefix tree of path segments.
+
+    Segments which are entirely literal, entirely a ``{name}`` replacement
+    marker or a trailing ``*stararg`` are matched in the tree.  A route
+    containing any other segment (a custom ``{name:regex}`` marker or a
+    segment mixing literal text and markers) is stored at the node where
+    that segment begins and is confirmed using its own regex.  Candidates
+    are tried in registration order, so the first route whose predicates
+    pass wins, exactly as in a linear scan.
+    """
+
+    def __init__(self, routes):
+        self.routes = routes
+        self.root = _RouteNode()
+        for order, route in enumerate(routes):
+            self._add(order, route)
+
+    def _add(self, order, route):
+        node = self.root
+        params = []
+        segments = _route_segments(*_parse_route(route.pattern))
+        for depth, (kind, value) in enumerate(segments):
+            if kind == 'literal':
+                child = node.children.get(value)
+                if child is None:
+                    child = node.children[value] = _RouteNode()
+                node = child
+            elif kind == 'var':
+                if node.wildcard is None:
+                    node.wildcard = _RouteNode()
+                node = node.wildcard
+                params.append((depth, value))
+            elif kind == 'star':
+                node.stars.append((order, route, tuple(params), value))
+                return
+            else:
+                node.regexes.append((order, route))
+                return
+        node.leaves.append((order, route, tuple(params)))
+
+    def __call__(self, path, request):
+        if '\n' in path:
+            # a regex "$" also matches before a trailing newline and "."
+            # does not match newlines at all; leave such paths to the
+            # routes' own patterns
+            return _scan(self.routes, path, request)
+
+        segs = path.split('/')
+        nsegs = len(segs)
+        candidates = []
+        stack = [(self.root, 0)]
+        while stack:
+            node, depth = stack.pop()
+            for order, route in node.regexes:
+                candidates.append((order, route, None))
+            if depth == nsegs:
+                for order, route, params in node.leaves:
+                    match = {name: segs[i] for i, name in params}
+                    candidates.append((order, route, match))
+                continue
+            for order, route, params, name in node.stars:
+                match = {name: segs[i] for i, name in params}
+                match[name] = split_path_info('/'.join(segs[depth:]))
+                candidates.append((order, route, match))
+            seg = segs[depth]
+            child = node.children.get(seg)
+            if child is not None:
+                stack.append((child, depth + 1))
+            if seg and node.wildcard is not None:
+                stack.append((node.wildcard, depth + 1))
+
+        candidates.sort(key=lambda candidate: candidate[0])
+        for order, route, match in candidates:
+            if match is None:
+                match = route.match(path)
+                if match is None:
+                    continue
+            preds = route.predicates
+            info = {'match': match, 'route': route}
+            if preds and not check_predicates(preds, info, request):
+                continue
+            return info
+
+        return {'route': None, 'match': None}
+
+
+class _RouteAlternation:
+    """Match routes using a single regex alternating between the patterns
+    of consecutive routes.
+
+    One ``match()`` finds the first route whose pattern matches; if that
+    route's predicates reject the request, scanning resumes with the routes
+    after it.  A route whose custom ``{name:regex}`` markers contain groups
+    or flags of their own can't safely be embedded in an alternation; it is
+    matched separately, splitting the alternation around it.
+    """
+
+    def __init__(self, routes):
+        self.chunks = []
+        sources = []
+        chunk = []
+        for route in routes:
+            source = _route_source(*_parse_route(route.pattern))
+            if source is None:
+                self._add_chunk(sources, chunk)
+                self.chunks.append((None, [route]))
+                sources, chunk = [], []
+            else:
+                # an empty group marks which alternative matched; wrapping
+                # each alternative in a group instead makes backtracking
+                # over the failed alternatives far slower
+                sources.append(f'{source}(?P<r{len(chunk)}>)$')
+                chunk.append(route)
+        self._add_chunk(sources, chunk)
+
+    def _add_chunk(self, sources, routes):
+        if routes:
+            self.chunks.append((re.compile('|'.join(sources)).match, routes))
+
+    def __call__(self, path, request):
+        for match, routes in self.chunks:
+            start = 0
             if match is not None:
-                preds = route.predicates
-                info = {'match': match, 'route': route}
-                if preds and not all(p(info, request) for p in preds):
+                m = match(path)
+                if m is None:
                     continue
-                return info
+                start = int(m.lastgroup[1:])
+            for i in range(start, len(routes)):
+                route = routes[i]
+                match = route.match(path)
+                if match is not None:
+                    preds = route.predicates
+                    info = {'match': match, 'route': route}
+                    if preds and not check_predicates(preds, info, request):
+                        continue
+                    return info
 
         return {'route': None, 'match': None}
 
 
+def _route_source(parts, remainder):
+    """Return the regex source for a parsed pattern without any groups, or
+    ``None`` if a custom marker regex has groups or flags of its own."""
+    default_flags = re.compile('').flags
+    rpat = []
+    for i, part in enumerate(parts):
+        if i % 2:
+            reg = part[1]
+            try:
+                compiled = re.compile(reg)
+            except re.error:
+                # e.g. a backreference to another marker
+                return None
+            if compiled.groups or compiled.flags != default_flags:
+                return None
+            rpat.append(f'(?:{reg})')
+        else:
+            rpat.append(re.escape(part))
+    if remainder:
+        rpat.append('.*?')
+    return ''.join(rpat)
+
+
+class _RouteIndex:
+    """Narrow the routes to scan using the first segment of the request
+    path and the request method.
+
+    Routes are indexed on the first segment of their pattern when it is
+    literal and on the methods accepted by their ``request_method``
+    predicate.  A request is only matched against the routes which could
+    accept its first path segment and method, in registration order; the
+    others are skipped without running their regex or predicates.
+    """
+
+    def __init__(self, routes):
+        from pyramid.predicates import RequestMethodPredicate
+
+        self.routes = routes
+        self.entries = []
+        self.prefixes = set()
+        self.methods = set()
+        self.candidates = {}
+        for route in routes:
+            segments = _route_segments(*_parse_route(route.pattern))
+            kind, prefix = segments[1]
+            if kind != 'literal':
+                prefix = None
+            else:
+                self.prefixes.add(prefix)
+            methods = None
+            for predicate in route.predicates:
+                if isinstance(predicate, RequestMethodPredicate):
+                    if methods is None:
+                        methods = set(predicate.val)
+                    else:
+                        methods.intersection_update(predicate.val)
+            if methods is not None:
+                self.methods.update(methods)
+            self.entries.append((route, prefix, methods))
+
+    def _candidates(self, prefix, method):
+        return [
+            route
+            for route, route_prefix, methods in self.entries
+            if (route_prefix is None or route_prefix == prefix)
+            and (methods is None or method in methods)
+        ]
+
+    def __call__(self, path, request):
+        if '\n' in path or not path.startswith('/'):
+            # see _RouteTree.__call__
+            return _scan(self.routes, path, request)
+
+        prefix = path.split('/', 2)[1]
+        if prefix not in self.prefixes:
+            prefix = None
+        method = None
+        if self.methods:
+            method = request.method
+            if method not in self.methods:
+                method = None
+        key = (prefix, method)
+        routes = self.candidates.get(key)
+        if routes is None:
+            # there are at most (prefixes + 1) * (methods + 1) keys
+            routes = self.candidates[key] = self._candidates(prefix, method)
+        return _scan(routes, path, request)
+
+
+_matchers = {
+    'index': _RouteIndex,
+    'linear': lambda routes: partial(_scan, routes),
+    'regex': _RouteAlternation,
+    'tree': _RouteTree,
+}
+
+
 # stolen from bobo and modified
 old_route_re = re.compile(r'(\:[_a-zA-Z]\w*)')
 star_at_end = re.compile(r'\*(\w*)$')
@@ -108,7 +435,13 @@ def update_pattern(matchobj):
     return '{%s}' % name[1:]
 
 
-def _compile_route(route):
+def _parse_route(route):
+    """Split the pattern ``route`` into its literal and replacement marker
+    parts.
+
+    Return a list alternating between literal strings and ``(name, regex)``
+    tuples (always beginning and ending with a literal) along with the name
+    of the trailing star argument or ``None`` if there isn't one."""
     # This function really wants to consume Unicode patterns natively, but if
     # someone passes us a bytestring, we allow it by converting it to Unicode
     # using the ASCII decoding.  We decode it using ASCII because we don't
@@ -134,49 +467,70 @@ def _compile_route(route):
     if star_at_end.search(route):
         route, remainder = route.rsplit('*', 1)
 
-    pat = route_re.split(route)
-
-    # every element in "pat" will be Unicode (regardless of whether the
+    # every element in "parts" will be Unicode (regardless of whether the
     # route_re regex pattern is itself Unicode or str)
-    pat.reverse()
-    rpat = []
-    gen = []
-    prefix = pat.pop()  # invar: always at least one element (route='/'+route)
-
-    # We want to generate URL-encoded URLs, so we url-quote the prefix, being
-    # careful not to quote any embedded slashes.  We have to replace '%' with
-    # '%%' afterwards, as the strings that go into "gen" are used as string
-    # replacement targets.
-    gen.append(
-        quote_path_segment(prefix, safe='/').replace('%', '%%')
-    )  # native
-    rpat.append(re.escape(prefix))  # unicode
-
-    while pat:
-        name = pat.pop()  # unicode
-        name = name[1:-1]
+    parts = route_re.split(route)
+    for i in range(1, len(parts), 2):
+        name = parts[i][1:-1]
         if ':' in name:
             # reg may contain colons as well,
             # so we must strictly split name into two parts
             name, reg = name.split(':', 1)
         else:
             reg = '[^/]+'
-        gen.append('%%(%s)s' % name)  # native
-        name = f'(?P<{name}>{reg})'  # unicode
-        rpat.append(name)
-        s = pat.pop()  # unicode
-        if s:
-            rpat.append(re.escape(s))  # unicode
-            # We want to generate URL-encoded URLs, so we url-quote this
-            # literal in the pattern, being careful not to quote the embedded
-            # slashes.  We have to replace '%' with '%%' afterwards, as the
-            # strings that go into "gen" are used as string replacement
-            # targets.  What is appended to gen is a native string.
-            gen.append(quote_path_segment(s, safe='/').replace('%', '%%'))
+        parts[i] = (name, reg)
+
+    return parts, remainder or None
+
+
+def _route_segments(parts, remainder):
+    """Describe each ``/``-separated segment of a parsed pattern as a
+    ``(kind, value)`` tuple, where ``kind`` is ``literal``, ``var`` (a lone
+    ``{name}`` marker), ``star`` (a trailing star argument) or ``regex``.
+    A ``regex`` segment ends the description, as it may span slashes."""
+    segments = [[]]
+    for i, part in enumerate(parts):
+        if i % 2:
+            segments[-1].append(part)
+        else:
+            pieces = part.split('/')
+            segments[-1].append(pieces[0])
+            segments.extend([piece] for piece in pieces[1:])
+
+    result = []
+    last = len(segments) - 1
+    for i, segment in enumerate(segments):
+        segment = [part for part in segment if part]
+        if remainder and i == last:
+            if segment:
+                result.append(('regex', None))
+            else:
+                result.append(('star', remainder))
+        elif not segment:
+            result.append(('literal', ''))
+        elif len(segment) == 1 and segment[0].__class__ is str:
+            result.append(('literal', segment[0]))
+        elif len(segment) == 1 and segment[0][1] == '[^/]+':
+            result.append(('var', segment[0][0]))
+        else:
+            result.append(('regex', None))
+            break
+    return result
+
+
+def _compile_route(route):
+    parts, remainder = _parse_route(route)
+    rpat = []
+
+    for i, part in enumerate(parts):
+        if i % 2:
+            name, reg = part
+            rpat.append(f'(?P<{name}>{reg})')  # unicode
+        else:
+            rpat.append(re.escape(part))  # unicode
 
     if remainder:
         rpat.append('(?P<%s>.*?)' % remainder)  # unicode
-        gen.append('%%(%s)s' % remainder)  # native
 
     pattern = ''.join(rpat) + '$'  # unicode
 
@@ -194,35 +548,64 @@ def _compile_route(route):
                 d[k] = v
         return d
 
-    gen = ''.join(gen)
+    return matcher, _compile_generator(parts, remainder)
 
-    def q(v):
-        return quote_path_segment(v, safe=PATH_SAFE)
 
-    def generator(dict):
-        newdict = {}
-        for k, v in dict.items():
-            if v.__class__ is bytes:
-                # url_quote below needs a native string
-                v = v.decode('utf-8')
+def _compile_generator(parts, remainder):
+    # We want to generate URL-encoded URLs, so we url-quote the literals in
+    # the pattern once, here, being careful not to quote the embedded
+    # slashes.
+    literals = [quote_path_segment(part, safe='/') for part in parts[::2]]
+    prefix = literals[0]
+    pieces = tuple(zip([name for name, reg in parts[1::2]], literals[1:]))
 
-            if k == remainder:
-                # a stararg argument
-                if is_nonstr_iter(v):
-                    v = '/'.join([q(x) for x in v])  # native
-                else:
-                    if v.__class__ is not str:
-                        v = str(v)
-                    v = q(v)
-            else:
+    if not pieces and not remainder:
+
+        def generator(kw):
+            return prefix
+
+    elif not remainder:
+
+        def generator(kw):
+            path = prefix
+            for name, literal in pieces:
+                v = kw[name]
                 if v.__class__ is not str:
-                    v = str(v)
-                v = q(v)
+                    v = _native(v)
+                path += _quote_path(v) + literal
+            return path
+
+    else:
+
+        def generator(kw):
+            path = prefix
+            for name, literal in pieces:
+                v = kw[name]
+                if v.__class__ is not str:
+                    v = _native(v)
+                path += _quote_path(v) + literal
+            v = kw[remainder]
+            if v.__class__ is not str:
+                v = _native(v, iterable=True)
+                if v.__class__ is not str:
+                    # a stararg argument
+                    return path + '/'.join(
+                        [_quote_path(_native(x)) for x in v]
+                    )
+            return path + _quote_path(v)
+
+    return generator
+
 
-            # at this point, the value will be a native string
-            newdict[k] = v
+def _native(v, iterable=False):
+    if v.__class__ is bytes:
+        # url_quote below needs a native string
+        return v.decode('utf-8')
+    if v.__class__ is str or (iterable and is_nonstr_iter(v)):
+        return v
+    return str(v)
 
-        result = gen % newdict  # native string result
-        return result
 
-    return matcher, generator
+@lru_cache(1000)
+def _quote_path(segment):
+    return url_quote(segment, PATH_SAFE)
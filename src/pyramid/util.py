@@ -1,9 +1,16 @@
+from collections import OrderedDict
 from contextlib import contextmanager
 import functools
 from hmac import compare_digest
 import inspect
 import platform
+import threading
 import weakref
+from webob import BaseRequest
+from webob.acceptparse import (
+    create_accept_encoding_header,
+    create_accept_header,
+)
 
 from pyramid.path import DottedNameResolver as _DottedNameResolver
 
@@ -317,6 +324,60 @@ class WeakOrderedSet:
             return self._items[oid]()
 
 
+class LRUCache:
+    """A cache of values which may be shared by threads, forgetting the
+    least recently used ones first.
+
+    Looking a value up never waits for another thread: the recency of the
+    value is only updated if no other thread is changing the cache.  The
+    number of values is bounded by the ``maxsize`` given to :meth:`put`, so
+    that the owner of the cache may change its size setting at any time.
+    """
+
+    def __init__(self):
+        self._values = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._values)
+
+    def __iter__(self):
+        """Iterate over the keys, least recently used first."""
+        return iter(self._values)
+
+    def get(self, key, default=None):
+        values = self._values
+        value = values.get(key, _marker)
+        if value is _marker:
+            return default
+        lock = self._lock
+        if lock.acquire(False):
+            try:
+                if key in values:
+                    values.move_to_end(key)
+            finally:
+                lock.release()
+        return value
+
+    def put(self, key, value, maxsize):
+        """Remember ``value`` for ``key``, then forget the least recently
+        used values beyond ``maxsize``.  Return the number of values
+        forgotten."""
+        values = self._values
+        forgotten = 0
+        with self._lock:
+            values[key] = value
+            values.move_to_end(key)
+            while len(values) > maxsize:
+                values.popitem(last=False)
+                forgotten += 1
+        return forgotten
+
+    def pop(self, key, default=None):
+        with self._lock:
+            return self._values.pop(key, default)
+
+
 def strings_differ(string1, string2):
     """Check whether two strings differ while avoiding timing attacks.
 
@@ -734,3 +795,92 @@ def reraise(tp, value, tb=None):
     finally:
         value = None
         tb = None
+
+
+_accept_headers = {
+    'accept': ('HTTP_ACCEPT', create_accept_header),
+    'accept_encoding': (
+        'HTTP_ACCEPT_ENCODING',
+        create_accept_encoding_header,
+    ),
+}
+
+
+def acceptable_offers(request, offers, header='accept'):
+    """Return ``getattr(request, header).acceptable_offers(offers)`` as a
+    tuple, where ``header`` is ``accept`` or ``accept_encoding``.
+
+    ``offers`` must be a tuple.  For a :term:`WebOb` request, the result is
+    computed once for each value of the header and is then shared by all
+    requests sending the same value, in a bounded LRU cache.  Parsing the
+    header is then also skipped."""
+    cls = type(request)
+    if isinstance(request, BaseRequest) and getattr(cls, header) is getattr(
+        BaseRequest, header
+    ):
+        environ_key, create = _accept_headers[header]
+        return _acceptable_offers(
+            create, request.environ.get(environ_key), offers
+        )
+    return tuple(getattr(request, header).acceptable_offers(offers))
+
+
+@functools.lru_cache(1000)
+def _acceptable_offers(create, header_value, offers):
+    return tuple(create(header_value).acceptable_offers(offers))
+
+
+def predicate_key(predicate):
+    """Return a key identifying ``predicate``: predicates of the same type
+    with the same phash are equivalent, as far as
+    :class:`pyramid.config.predicates.PredicateList` is concerned.  A
+    predicate without a phash is only equivalent to itself."""
+    try:
+        hashes = predicate.phash()
+    except AttributeError:
+        return predicate
+    if not hashes:
+        return predicate
+    if is_nonstr_iter(hashes):
+        hashes = tuple(hashes)
+    return (type(predicate), hashes)
+
+
+class PredicateMemo:
+    """The results of the predicates evaluated for a request whose result
+    depends only on the request, keyed by :func:`predicate_key`, so that
+    equivalent route and view predicates are only evaluated once.
+
+    A predicate says that its result only depends on the request by having
+    a true ``request_only`` attribute.  Other predicates are always
+    evaluated.  ``stats`` is a
+    :class:`pyramid.registry.PredicateMemoStats`."""
+
+    def __init__(self, stats):
+        self.results = {}
+        self.stats = stats
+
+    def __call__(self, predicate, context, request):
+        """Return the result of ``predicate(context, request)``."""
+        if not getattr(predicate, 'request_only', False):
+            return predicate(context, request)
+        key = predicate_key(predicate)
+        results = self.results
+        try:
+            result = results[key]
+        except KeyError:
+            result = results[key] = predicate(context, request)
+            self.stats.evaluations += 1
+        else:
+            self.stats.saved += 1
+        return result
+
+
+def check_predicates(predicates, context, request):
+    """Return whether all of ``predicates`` accept ``context`` and
+    ``request``, using the :class:`PredicateMemo` of the request if it has
+    one."""
+    memo = getattr(request, '_predicate_memo', None)
+    if memo is None:
+        return all(p(context, request) for p in predicates)
+    return all(memo(p, context, request) for p in predicates)
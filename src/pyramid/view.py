@@ -2,8 +2,9 @@ import inspect
 import itertools
 import sys
 import venusian
-from zope.interface import providedBy
+from zope.interface import implementedBy, providedBy
 
+from pyramid.asgi import run_awaitable
 from pyramid.exceptions import ConfigurationError, PredicateMismatch
 from pyramid.httpexceptions import (
     HTTPNotFound,
@@ -14,12 +15,16 @@ from pyramid.interfaces import (
     IExceptionViewClassifier,
     IMultiView,
     IRequest,
+    IRootFactory,
+    IRouteRequest,
     IRoutesMapper,
     ISecuredView,
     IView,
     IViewClassifier,
 )
+from pyramid.response import Response
 from pyramid.threadlocal import get_current_registry, manager
+from pyramid.traversal import DefaultRootFactory
 from pyramid.util import hide_attrs, reraise as reraise_
 
 _marker = object()
@@ -605,34 +610,122 @@ def _find_views(
         view_types = (IView, ISecuredView, IMultiView)
     if view_classifier is None:
         view_classifier = IViewClassifier
-    registered = registry.adapters.registered
+    # the caches are replaced rather than emptied when views are
+    # registered, so a lookup racing with a registration stores its result
+    # in caches which are already thrown away.  Writing to a dict needs no
+    # lock, so reading the caches never waits for another thread.
     cache = registry._view_lookup_cache
     views = cache.get((request_iface, context_iface, view_name))
-    if views is None:
-        views = []
-        for req_type, ctx_type in itertools.product(
-            request_iface.__sro__, context_iface.__sro__
-        ):
-            source_ifaces = (view_classifier, req_type, ctx_type)
-            for view_type in view_types:
-                view_callable = registered(
-                    source_ifaces, view_type, name=view_name
-                )
-                if view_callable is not None:
-                    views.append(view_callable)
-        if views:
-            # do not cache view lookup misses.  rationale: dont allow cache to
-            # grow without bound if somebody tries to hit the site with many
-            # missing URLs.  we could use an LRU cache instead, but then
-            # purposeful misses by an attacker would just blow out the cache
-            # anyway. downside: misses will almost always consume more CPU than
-            # hits in steady state.
-            with registry._lock:
-                cache[(request_iface, context_iface, view_name)] = views
+    stats = registry.view_lookup_stats
+    if views is not None:
+        stats.hits += 1
+        return views
+
+    # lookups which found nothing (requests for missing URLs, exceptions
+    # without an exception view) are remembered in a bounded LRU cache, so
+    # that purposeful misses can only push out other misses.  The classifier
+    # and view types are part of the key because a miss for one does not
+    # imply a miss for another.
+    misses = registry._view_lookup_misses
+    miss_key = (
+        view_classifier,
+        request_iface,
+        context_iface,
+        view_name,
+        view_types,
+    )
+    if misses.get(miss_key):
+        stats.negative_hits += 1
+        return []
+
+    stats.misses += 1
+    registered = registry.adapters.registered
+    views = []
+    for req_type, ctx_type in itertools.product(
+        request_iface.__sro__, context_iface.__sro__
+    ):
+        source_ifaces = (view_classifier, req_type, ctx_type)
+        for view_type in view_types:
+            view_callable = registered(
+                source_ifaces, view_type, name=view_name
+            )
+            if view_callable is not None:
+                views.append(view_callable)
+    if views:
+        cache[(request_iface, context_iface, view_name)] = views
+    else:
+        stats.negative_stores += 1
+        stats.negative_evictions += misses.put(
+            miss_key, True, registry.view_lookup_miss_cache_size
+        )
 
     return views
 
 
+def _warm_view_lookup_cache(registry):
+    """Look up the views recorded by the introspector of ``registry``, so
+    that requests for them are answered from the view lookup cache from the
+    start.
+
+    A view is looked up when the interfaces provided by the context of the
+    requests it answers can be inferred: when it is registered for a context
+    class, or when the root factory of its route (or of the application) is
+    a class providing its context, the root being the context of requests
+    which are not traversed any further.  Exception views are also looked up
+    for the requests matching each route."""
+    introspector = getattr(registry, 'introspector', None)
+    if introspector is None:
+        return
+    default_root_factory = registry.queryUtility(
+        IRootFactory, default=DefaultRootFactory
+    )
+    mapper = registry.queryUtility(IRoutesMapper)
+    route_ifaces = [
+        iface for _, iface in registry.getUtilitiesFor(IRouteRequest)
+    ]
+    for entry in introspector.get_category('views'):
+        intr = entry['introspectable']
+        request_iface = IRequest
+        root_factory = default_root_factory
+        route_name = intr['route_name']
+        if route_name is not None:
+            request_iface = registry.queryUtility(
+                IRouteRequest, name=route_name
+            )
+            if request_iface is None:
+                continue
+            route = mapper and mapper.get_route(route_name)
+            if route is not None and route.factory is not None:
+                root_factory = route.factory
+
+        context = intr['context']
+        if inspect.isclass(context):
+            context_iface = implementedBy(context)
+        elif inspect.isclass(root_factory) and (
+            context is None or context.implementedBy(root_factory)
+        ):
+            context_iface = implementedBy(root_factory)
+        else:
+            continue
+
+        name = intr['name']
+        if not intr['exception_only']:
+            _find_views(registry, request_iface, context_iface, name)
+        if name == '' and inspect.isclass(context):
+            if issubclass(context, Exception):
+                request_ifaces = [request_iface]
+                if route_name is None:
+                    request_ifaces.extend(route_ifaces)
+                for request_iface in request_ifaces:
+                    _find_views(
+                        registry,
+                        request_iface.combined,
+                        context_iface,
+                        name,
+                        view_classifier=IExceptionViewClassifier,
+                    )
+
+
 def _call_view(
     registry,
     request,
@@ -643,6 +736,7 @@ def _call_view(
     view_classifier=None,
     secure=True,
     request_iface=None,
+    allow_awaitable=False,
 ):
     if request_iface is None:
         request_iface = getattr(request, 'request_iface', IRequest)
@@ -654,6 +748,8 @@ def _call_view(
         view_types=view_types,
         view_classifier=view_classifier,
     )
+    timings = getattr(request, 'timings', None)
+    timings and timings.mark('view_lookup')
 
     pme = None
     response = None
@@ -672,6 +768,14 @@ def _call_view(
             # appropriately if the executing user does not have the proper
             # permission
             response = view_callable(context, request)
+            if (
+                not allow_awaitable
+                and response.__class__ is not Response
+                and inspect.isawaitable(response)
+            ):
+                # the view callable of a coroutine view returns an
+                # awaitable, unless a view deriver made it synchronous
+                response = run_awaitable(request, response)
             return response
         except PredicateMismatch as _pme:
             pme = _pme
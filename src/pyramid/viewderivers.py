@@ -2,6 +2,7 @@ import inspect
 from zope.interface import implementer, provider
 
 from pyramid import renderers
+from pyramid.asgi import is_coroutine_callable, run_awaitable, run_in_thread
 from pyramid.csrf import check_csrf_origin, check_csrf_token
 from pyramid.exceptions import ConfigurationError
 from pyramid.httpexceptions import HTTPForbidden
@@ -51,10 +52,12 @@ class DefaultViewMapper:
             )
 
         if inspect.isclass(view):
-            view = self.map_class(view)
+            mapped_view = self.map_class(view)
         else:
-            view = self.map_nonclass(view)
-        return view
+            mapped_view = self.map_nonclass(view)
+        if is_coroutine_callable(view, self.attr):
+            mapped_view = coroutine_view(mapped_view)
+        return mapped_view
 
     def map_class(self, view):
         ronly = requestonly(view, self.attr)
@@ -155,6 +158,34 @@ class DefaultViewMapper:
         return _attr_view
 
 
+def coroutine_view(view):
+    """Return a coroutine function equivalent to ``view``, a function
+    returning an awaitable, or ``view`` itself if it is already a coroutine
+    function."""
+    if is_coroutine_callable(view):
+        return view
+
+    async def _coroutine_view(context, request):
+        return await view(context, request)
+
+    return preserve_view_attrs(view, _coroutine_view)
+
+
+def bridged_view(view):
+    """Return a synchronous view callable running the coroutine view
+    ``view`` with :func:`pyramid.asgi.run_awaitable`, for a view deriver
+    which doesn't support coroutines."""
+
+    def _bridged_view(context, request):
+        return run_awaitable(request, view(context, request))
+
+    preserve_view_attrs(view, _bridged_view)
+    call_permissive = getattr(view, '__call_permissive__', None)
+    if is_coroutine_callable(call_permissive):
+        _bridged_view.__call_permissive__ = bridged_view(call_permissive)
+    return _bridged_view
+
+
 def wraps_view(wrapper):
     def inner(view, info):
         wrapper_view = wrapper(view, info)
@@ -193,6 +224,7 @@ def preserve_view_attrs(view, wrapper):
         '__permission__',
         '__predicated__',
         '__predicates__',
+        '__predicated_view__',
         '__accept__',
         '__order__',
         '__text__',
@@ -205,6 +237,77 @@ def preserve_view_attrs(view, wrapper):
     return wrapper
 
 
+def fusable_view(wrapper, view, check=None, finish=None):
+    """Mark ``wrapper``, a synchronous view callable wrapping ``view``, as
+    one which :func:`fused_view` may replace: it calls
+    ``check(context, request)`` when given, then ``view``, then returns
+    ``finish(context, request, response)`` when given or the response of
+    ``view`` otherwise, and does nothing else."""
+    wrapper.__fusable__ = (wrapper, view, check, finish)
+    return wrapper
+
+
+def fused_view(view):
+    """Return a view callable equivalent to ``view`` which calls the checks
+    and finishers of the chain of :func:`fusable_view` wrappers at the top
+    of ``view`` itself, rather than calling through each wrapper, or
+    ``view`` if there are fewer than two such wrappers."""
+    checks = []
+    finishers = []
+    inner = view
+    depth = 0
+    while True:
+        step = getattr(inner, '__fusable__', None)
+        # a wrapper copying the attributes of the view it wraps does not
+        # own the step it copied
+        if step is None or step[0] is not inner:
+            break
+        _, inner, check, finish = step
+        check is not None and checks.append(check)
+        finish is not None and finishers.insert(0, finish)
+        depth += 1
+    if depth < 2:
+        return view
+
+    checks = tuple(checks)
+    finishers = tuple(finishers)
+    if not finishers:
+
+        def _fused_view(context, request):
+            for check in checks:
+                check(context, request)
+            return inner(context, request)
+
+    elif not checks:
+
+        def _fused_view(context, request):
+            response = inner(context, request)
+            for finish in finishers:
+                response = finish(context, request, response)
+            return response
+
+    else:
+
+        def _fused_view(context, request):
+            for check in checks:
+                check(context, request)
+            response = inner(context, request)
+            for finish in finishers:
+                response = finish(context, request, response)
+            return response
+
+    # keep the attributes set by the wrappers, such as those of
+    # attr_wrapped_view, which preserve_view_attrs doesn't know about
+    _fused_view.__dict__.update(view.__dict__)
+    del _fused_view.__fusable__
+    preserve_view_attrs(view, _fused_view)
+    for attr in ('__call_permissive__', '__predicated_view__'):
+        unfused = getattr(view, attr, None)
+        if unfused is not None:
+            setattr(_fused_view, attr, fused_view(unfused))
+    return _fused_view
+
+
 def mapped_view(view, info):
     mapper = info.options.get('mapper')
     if mapper is None:
@@ -215,10 +318,14 @@ def mapped_view(view, info):
                 mapper = DefaultViewMapper
 
     mapped_view = mapper(**info.options)(view)
+    if is_coroutine_callable(view, info.options.get('attr')):
+        # custom view mappers might not return a coroutine function
+        mapped_view = coroutine_view(mapped_view)
     return mapped_view
 
 
 mapped_view.options = ('mapper', 'attr')
+mapped_view.supports_coroutines = True
 
 
 def owrapped_view(view, info):
@@ -227,8 +334,7 @@ def owrapped_view(view, info):
     if not wrapper_viewname:
         return view
 
-    def _owrapped_view(context, request):
-        response = view(context, request)
+    def wrap(context, request, response):
         request.wrapped_response = response
         request.wrapped_body = response.body
         request.wrapped_view = view
@@ -242,10 +348,27 @@ def owrapped_view(view, info):
             )
         return wrapped_response
 
+    if is_coroutine_callable(view):
+
+        async def _owrapped_view(context, request):
+            response = await view(context, request)
+            # the wrapper view is looked up and called synchronously
+            return await run_in_thread(
+                request, wrap, context, request, response
+            )
+
+    else:
+
+        def _owrapped_view(context, request):
+            return wrap(context, request, view(context, request))
+
+        fusable_view(_owrapped_view, view, finish=wrap)
+
     return _owrapped_view
 
 
 owrapped_view.options = ('name', 'wrapper')
+owrapped_view.supports_coroutines = True
 
 
 def http_cached_view(view, info):
@@ -268,8 +391,7 @@ def http_cached_view(view, info):
                 'in the form (seconds, options); not %s' % (seconds,)
             )
 
-    def wrapper(context, request):
-        response = view(context, request)
+    def cache(context, request, response):
         prevent_caching = getattr(
             response.cache_control, 'prevent_auto', False
         )
@@ -277,10 +399,23 @@ def http_cached_view(view, info):
             response.cache_expires(seconds, **options)
         return response
 
+    if is_coroutine_callable(view):
+
+        async def wrapper(context, request):
+            return cache(context, request, await view(context, request))
+
+    else:
+
+        def wrapper(context, request):
+            return cache(context, request, view(context, request))
+
+        fusable_view(wrapper, view, finish=cache)
+
     return wrapper
 
 
 http_cached_view.options = ('http_cache',)
+http_cached_view.supports_coroutines = True
 
 
 def secured_view(view, info):
@@ -290,6 +425,7 @@ def secured_view(view, info):
 
 
 secured_view.options = ('permission',)
+secured_view.supports_coroutines = True
 
 
 def _secured_view(view, info):
@@ -313,17 +449,31 @@ def _secured_view(view, info):
         def permitted(context, request):
             return policy.permits(request, context, permission)
 
-        def secured_view(context, request):
+        def check(context, request):
             result = permitted(context, request)
-            if result:
+            if not result:
+                view_name = getattr(view, '__name__', view)
+                msg = getattr(
+                    request,
+                    'authdebug_message',
+                    'Unauthorized: %s failed permission check' % view_name,
+                )
+                raise HTTPForbidden(msg, result=result)
+
+        if is_coroutine_callable(view):
+
+            async def secured_view(context, request):
+                # the security policy is synchronous
+                await run_in_thread(request, check, context, request)
+                return await view(context, request)
+
+        else:
+
+            def secured_view(context, request):
+                check(context, request)
                 return view(context, request)
-            view_name = getattr(view, '__name__', view)
-            msg = getattr(
-                request,
-                'authdebug_message',
-                'Unauthorized: %s failed permission check' % view_name,
-            )
-            raise HTTPForbidden(msg, result=result)
+
+            fusable_view(secured_view, view, check=check)
 
         secured_view.__call_permissive__ = view
         secured_view.__permitted__ = permitted
@@ -348,7 +498,7 @@ def _authdebug_view(view, info):
 
     if settings and settings.get('debug_authorization', False):
 
-        def authdebug_view(context, request):
+        def debug(context, request):
             view_name = getattr(request, 'view_name', None)
 
             if policy:
@@ -372,7 +522,20 @@ def _authdebug_view(view, info):
                 logger.debug(msg)
             if request is not None:
                 request.authdebug_message = msg
-            return view(context, request)
+
+        if is_coroutine_callable(view):
+
+            async def authdebug_view(context, request):
+                await run_in_thread(request, debug, context, request)
+                return await view(context, request)
+
+        else:
+
+            def authdebug_view(context, request):
+                debug(context, request)
+                return view(context, request)
+
+            fusable_view(authdebug_view, view, check=debug)
 
         wrapped_view = authdebug_view
 
@@ -388,8 +551,7 @@ def rendered_view(view, info):
         # rendering.  registering a default renderer will also allow
         # override_renderer to work if a renderer is left unspecified for
         # a view registration.
-        def viewresult_to_response(context, request):
-            result = view(context, request)
+        def result_to_response(context, request, result):
             if result.__class__ is Response:  # common case
                 response = result
             else:
@@ -418,13 +580,41 @@ def rendered_view(view, info):
 
             return response
 
-        return viewresult_to_response
-
-    if renderer is renderers.null_renderer:
+    elif renderer is renderers.null_renderer:
         return view
 
-    def rendered_view(context, request):
-        result = view(context, request)
+    else:
+        result_to_response = _rendered_result(view, info, renderer)
+
+    if is_coroutine_callable(view):
+
+        async def rendered_view(context, request):
+            result = await view(context, request)
+            if result.__class__ is Response:
+                # result_to_response returns it as is
+                return result
+            # renderers are synchronous
+            return await run_in_thread(
+                request, result_to_response, context, request, result
+            )
+
+    else:
+
+        def rendered_view(context, request):
+            result = view(context, request)
+            return result_to_response(context, request, result)
+
+        fusable_view(rendered_view, view, finish=result_to_response)
+
+    return rendered_view
+
+
+rendered_view.options = ('renderer',)
+rendered_view.supports_coroutines = True
+
+
+def _rendered_result(view, info, renderer):
+    def result_to_response(context, request, result):
         if result.__class__ is Response:  # potential common case
             response = result
         else:
@@ -452,20 +642,22 @@ def rendered_view(view, info):
                 )
         return response
 
-    return rendered_view
-
-
-rendered_view.options = ('renderer',)
+    return result_to_response
 
 
 def decorated_view(view, info):
     decorator = info.options.get('decorator')
     if decorator is None:
         return view
-    return decorator(view)
+    decorated_view = decorator(view)
+    if is_coroutine_callable(view):
+        # the decorator may return a function returning an awaitable
+        decorated_view = coroutine_view(decorated_view)
+    return decorated_view
 
 
 decorated_view.options = ('decorator',)
+decorated_view.supports_coroutines = True
 
 
 def csrf_view(view, info):
@@ -500,7 +692,7 @@ def csrf_view(view, info):
     wrapped_view = view
     if enabled:
 
-        def csrf_view(context, request):
+        def check(context, request):
             if request.method not in safe_methods and (
                 callback is None or callback(request)
             ):
@@ -509,13 +701,28 @@ def csrf_view(view, info):
                         request, raises=True, allow_no_origin=allow_no_origin
                     )
                 check_csrf_token(request, token, header, raises=True)
-            return view(context, request)
+
+        if is_coroutine_callable(view):
+
+            async def csrf_view(context, request):
+                # the CSRF storage policy is synchronous
+                await run_in_thread(request, check, context, request)
+                return await view(context, request)
+
+        else:
+
+            def csrf_view(context, request):
+                check(context, request)
+                return view(context, request)
+
+            fusable_view(csrf_view, view, check=check)
 
         wrapped_view = csrf_view
     return wrapped_view
 
 
 csrf_view.options = ('require_csrf',)
+csrf_view.supports_coroutines = True
 
 VIEW = 'VIEW'
 INGRESS = 'INGRESS'
@@ -0,0 +1,761 @@
+import asyncio
+import unittest
+from zope.interface import Interface, implementer
+
+from pyramid import testing
+
+
+class TestASGIRouter(unittest.TestCase):
+    def setUp(self):
+        from pyramid.config import Configurator
+
+        self.config = Configurator()
+
+    def _makeOne(self, executor=None):
+        from pyramid.asgi import ASGIRouter
+        from pyramid.router import Router
+
+        self.config.commit()
+        return ASGIRouter(Router(self.config.registry), executor)
+
+    def _makeScope(self, path='/', **kw):
+        scope = {
+            'type': 'http',
+            'http_version': '1.1',
+            'method': 'GET',
+            'scheme': 'http',
+            'path': path,
+            'root_path': '',
+            'query_string': b'',
+            'headers': [],
+            'server': ('example.com', 80),
+        }
+        scope.update(kw)
+        return scope
+
+    def _call(self, app, scope, messages=None):
+        if messages is None:
+            messages = [{'type': 'http.request', 'body': b''}]
+        received = list(messages)
+        sent = []
+
+        async def receive():
+            return received.pop(0)
+
+        async def send(message):
+            sent.append(message)
+
+        asyncio.run(app(scope, receive, send))
+        return sent
+
+    async def _request(self, app, scope):
+        received = [{'type': 'http.request', 'body': b''}]
+        sent = []
+
+        async def receive():
+            return received.pop(0)
+
+        async def send(message):
+            sent.append(message)
+
+        await app(scope, receive, send)
+        return sent
+
+    def _body(self, sent):
+        return b''.join(
+            message['body']
+            for message in sent
+            if message['type'] == 'http.response.body'
+        )
+
+    def test_sync_view(self):
+        from pyramid.response import Response
+
+        def view(request):
+            return Response(request.path_info + ' ' + request.params['a'])
+
+        self.config.add_view(view, name='foo')
+        app = self._makeOne()
+        sent = self._call(app, self._makeScope('/foo', query_string=b'a=1'))
+        self.assertEqual(sent[0]['type'], 'http.response.start')
+        self.assertEqual(sent[0]['status'], 200)
+        self.assertIn(
+            (b'content-type', b'text/html; charset=UTF-8'), sent[0]['headers']
+        )
+        self.assertEqual(self._body(sent), b'/foo 1')
+        self.assertEqual(sent[-1], {'type': 'http.response.body', 'body': b''})
+
+    def test_coroutine_view(self):
+        from pyramid.asgi import LOOP_KEY
+        from pyramid.response import Response
+
+        loops = []
+
+        async def view(request):
+            loops.append(asyncio.get_running_loop())
+            self.assertIs(request.environ[LOOP_KEY], loops[0])
+            return Response(request.body)
+
+        self.config.add_view(view)
+        app = self._makeOne()
+        sent = self._call(
+            app,
+            self._makeScope(method='POST'),
+            [
+                {'type': 'http.request', 'body': b'a', 'more_body': True},
+                {'type': 'http.request', 'body': b'b'},
+            ],
+        )
+        self.assertEqual(sent[0]['status'], 200)
+        self.assertEqual(self._body(sent), b'ab')
+        self.assertEqual(len(loops), 1)
+
+    def test_coroutine_tween(self):
+        from pyramid.response import Response
+        from pyramid.threadlocal import get_current_request
+
+        def view(request):
+            self.assertIs(get_current_request(), request)
+            return Response('view')
+
+        self.config.add_view(view)
+        self.config.add_tween('tests.test_asgi.async_tween_factory')
+        app = self._makeOne()
+        sent = self._call(app, self._makeScope())
+        self.assertEqual(self._body(sent), b'view')
+        self.assertIn((b'x-tween', b'async'), sent[0]['headers'])
+
+    def test_coroutine_tweens_dont_hold_threads(self):
+        from concurrent.futures import ThreadPoolExecutor
+        import time
+
+        from pyramid.response import Response
+
+        self.config.add_view(lambda request: Response('view'))
+        self.config.add_tween('tests.test_asgi.sleeping_tween_factory')
+        with ThreadPoolExecutor(2) as executor:
+            app = self._makeOne(executor)
+
+            async def main():
+                return await asyncio.gather(
+                    *[self._request(app, self._makeScope()) for i in range(20)]
+                )
+
+            start = time.perf_counter()
+            results = asyncio.run(main())
+            elapsed = time.perf_counter() - start
+        self.assertEqual(
+            [self._body(sent) for sent in results], [b'view'] * 20
+        )
+        # 20 requests sleeping 0.2 seconds each in 2 threads would take 2
+        # seconds
+        self.assertLess(elapsed, 1.5)
+
+    def test_coroutine_views_dont_hold_threads(self):
+        from concurrent.futures import ThreadPoolExecutor
+        import time
+
+        async def view(request):
+            await asyncio.sleep(0.2)
+            return 'view'
+
+        self.config.add_view(view, renderer='string')
+        with ThreadPoolExecutor(2) as executor:
+            app = self._makeOne(executor)
+
+            async def main():
+                return await asyncio.gather(
+                    *[self._request(app, self._makeScope()) for i in range(20)]
+                )
+
+            start = time.perf_counter()
+            results = asyncio.run(main())
+            elapsed = time.perf_counter() - start
+        self.assertEqual(
+            [self._body(sent) for sent in results], [b'view'] * 20
+        )
+        # 20 requests sleeping 0.2 seconds each in 2 threads would take 2
+        # seconds
+        self.assertLess(elapsed, 1.5)
+
+    def test_coroutine_view_predicates(self):
+        from pyramid.response import Response
+
+        async def get_view(request):
+            return Response('get')
+
+        async def post_view(request):
+            return Response('post')
+
+        async def context_view(request):
+            return Response('context')
+
+        self.config.add_view(get_view, name='a', request_method='GET')
+        self.config.add_view(post_view, name='a', request_method='POST')
+        self.config.add_view(
+            context_view, name='b', context=IDummyContext, request_method='GET'
+        )
+        self.config.add_view(post_view, name='b', request_method='POST')
+        self.config.set_root_factory(DummyRoot)
+        app = self._makeOne()
+        sent = self._call(app, self._makeScope('/a', method='POST'))
+        self.assertEqual(self._body(sent), b'post')
+        sent = self._call(app, self._makeScope('/a'))
+        self.assertEqual(self._body(sent), b'get')
+        sent = self._call(app, self._makeScope('/b'))
+        self.assertEqual(self._body(sent), b'context')
+        # the mismatch of the more specific view falls back to the other
+        sent = self._call(app, self._makeScope('/b', method='POST'))
+        self.assertEqual(self._body(sent), b'post')
+        sent = self._call(app, self._makeScope('/b', method='PUT'))
+        self.assertEqual(sent[0]['status'], 404)
+
+    def test_coroutine_exception_view(self):
+        from pyramid.response import Response
+
+        async def view(request):
+            raise ValueError
+
+        async def excview(exc, request):
+            return Response('error', status=500)
+
+        self.config.add_view(view)
+        self.config.add_view(excview, context=ValueError)
+        app = self._makeOne()
+        sent = self._call(app, self._makeScope())
+        self.assertEqual(sent[0]['status'], 500)
+        self.assertEqual(self._body(sent), b'error')
+
+    def test_exception_view(self):
+        from pyramid.response import Response
+        from pyramid.threadlocal import get_current_request
+
+        def view(request):
+            raise ValueError
+
+        def excview(exc, request):
+            self.assertIs(get_current_request(), request)
+            return Response('error', status=500)
+
+        self.config.add_view(view)
+        self.config.add_view(excview, context=ValueError)
+        self.config.add_tween('tests.test_asgi.async_tween_factory')
+        app = self._makeOne()
+        sent = self._call(app, self._makeScope())
+        self.assertEqual(sent[0]['status'], 500)
+        self.assertEqual(self._body(sent), b'error')
+        self.assertIn((b'x-tween', b'async'), sent[0]['headers'])
+
+    def test_callbacks_and_subscribers(self):
+        from pyramid.events import NewResponse
+        from pyramid.response import Response
+        from pyramid.threadlocal import get_current_request
+
+        called = []
+
+        def response_callback(request, response):
+            self.assertIs(get_current_request(), request)
+            called.append('response')
+
+        def finished_callback(request):
+            self.assertIs(get_current_request(), request)
+            called.append('finished')
+
+        def subscriber(event):
+            self.assertIs(get_current_request(), event.request)
+            called.append('subscriber')
+
+        def view(request):
+            request.add_response_callback(response_callback)
+            request.add_finished_callback(finished_callback)
+            return Response('view')
+
+        self.config.add_view(view)
+        self.config.add_subscriber(subscriber, NewResponse)
+        app = self._makeOne()
+        sent = self._call(app, self._makeScope())
+        self.assertEqual(self._body(sent), b'view')
+        self.assertEqual(called, ['response', 'subscriber', 'finished'])
+
+    def test_timings(self):
+        from pyramid.response import Response
+
+        timings = []
+
+        async def view(request):
+            return Response('view')
+
+        self.config.add_view(view)
+        self.config.set_request_timing_sink(
+            lambda request, t: timings.append(t)
+        )
+        app = self._makeOne()
+        self._call(app, self._makeScope())
+        phases = [span[0] for span in timings[0].spans]
+        self.assertIn('view', phases)
+        self.assertEqual(phases[-1], 'finished_callbacks')
+
+    def test_custom_execution_policy(self):
+        from pyramid.response import Response
+        from pyramid.threadlocal import get_current_request
+
+        def policy(environ, router):
+            with router.request_context(environ) as request:
+                self.assertIs(get_current_request(), request)
+                response = router.invoke_request(request)
+                response.headers['X-Policy'] = 'custom'
+                return response
+
+        async def view(request):
+            return Response('view')
+
+        self.config.add_view(view)
+        self.config.set_execution_policy(policy)
+        app = self._makeOne()
+        sent = self._call(app, self._makeScope())
+        self.assertEqual(self._body(sent), b'view')
+        self.assertIn((b'x-policy', b'custom'), sent[0]['headers'])
+
+    def test_streamed_app_iter(self):
+        from pyramid.response import Response
+
+        closed = []
+
+        class AppIter:
+            def __iter__(self):
+                yield b'a'
+                yield b''
+                yield b'b'
+
+            def close(self):
+                closed.append(True)
+
+        def view(request):
+            return Response(app_iter=AppIter())
+
+        self.config.add_view(view)
+        app = self._makeOne()
+        sent = self._call(app, self._makeScope())
+        self.assertEqual(self._body(sent), b'ab')
+        self.assertEqual(closed, [True])
+
+    def test_not_found(self):
+        app = self._makeOne()
+        sent = self._call(app, self._makeScope('/missing'))
+        self.assertEqual(sent[0]['status'], 404)
+
+    def test_disconnect_before_body(self):
+        app = self._makeOne()
+        sent = self._call(
+            app, self._makeScope(), [{'type': 'http.disconnect'}]
+        )
+        self.assertEqual(sent, [])
+
+    def test_lifespan(self):
+        app = self._makeOne()
+        sent = self._call(
+            app,
+            {'type': 'lifespan'},
+            [{'type': 'lifespan.startup'}, {'type': 'lifespan.shutdown'}],
+        )
+        self.assertEqual(
+            sent,
+            [
+                {'type': 'lifespan.startup.complete'},
+                {'type': 'lifespan.shutdown.complete'},
+            ],
+        )
+        self.assertRaises(RuntimeError, app.handler_executor.submit, print)
+
+    def test_close(self):
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(1) as executor:
+            app = self._makeOne(executor)
+            app.close()
+            self.assertRaises(RuntimeError, app.handler_executor.submit, print)
+            self.assertEqual(executor.submit(lambda: 'OK').result(), 'OK')
+
+    def test_unsupported_scope(self):
+        app = self._makeOne()
+        self.assertRaises(
+            ValueError, self._call, app, {'type': 'websocket'}, []
+        )
+
+
+class TestWSGIRouterTweens(unittest.TestCase):
+    def setUp(self):
+        from pyramid.config import Configurator
+
+        self.config = Configurator()
+
+    def _makeOne(self):
+        from pyramid.response import Response
+
+        def view(request):
+            return Response('view')
+
+        self.config.add_view(view)
+        return self.config.make_wsgi_app()
+
+    def _call(self, app):
+        from pyramid.request import Request
+
+        return Request.blank('/').get_response(app)
+
+    def test_sync_tween_from_running_loop(self):
+        self.config.add_tween('tests.test_asgi.sync_tween_factory')
+        app = self._makeOne()
+
+        async def main():
+            return self._call(app)
+
+        response = asyncio.run(main())
+        self.assertEqual(response.body, b'view')
+        self.assertEqual(response.headers['X-Tween'], 'sync')
+
+    def test_mixed_tweens(self):
+        self.config.add_tween('tests.test_asgi.sync_tween_factory')
+        self.config.add_tween('tests.test_asgi.async_tween_factory')
+        app = self._makeOne()
+        response = self._call(app)
+        self.assertEqual(response.body, b'view')
+        self.assertEqual(response.headers['X-Tween'], 'async')
+
+
+class Test_make_environ(unittest.TestCase):
+    def _callFUT(self, scope, body=b''):
+        from pyramid.asgi import make_environ
+
+        return make_environ(scope, body)
+
+    def test_it(self):
+        scope = {
+            'type': 'http',
+            'http_version': '1.1',
+            'method': 'POST',
+            'scheme': 'https',
+            'path': '/app/caf\xe9',
+            'root_path': '/app',
+            'query_string': b'a=1',
+            'headers': [
+                (b'content-type', b'text/plain'),
+                (b'content-length', b'4'),
+                (b'x-forwarded-for', b'a'),
+                (b'x-forwarded-for', b'b'),
+            ],
+            'server': ('example.com', 8443),
+            'client': ('127.0.0.1', 1234),
+        }
+        environ = self._callFUT(scope, b'body')
+        self.assertEqual(environ['REQUEST_METHOD'], 'POST')
+        self.assertEqual(environ['SCRIPT_NAME'], '/app')
+        self.assertEqual(environ['PATH_INFO'], '/caf\xc3\xa9')
+        self.assertEqual(environ['QUERY_STRING'], 'a=1')
+        self.assertEqual(environ['SERVER_NAME'], 'example.com')
+        self.assertEqual(environ['SERVER_PORT'], '8443')
+        self.assertEqual(environ['SERVER_PROTOCOL'], 'HTTP/1.1')
+        self.assertEqual(environ['wsgi.url_scheme'], 'https')
+        self.assertEqual(environ['wsgi.input'].read(), b'body')
+        self.assertEqual(environ['CONTENT_TYPE'], 'text/plain')
+        self.assertEqual(environ['CONTENT_LENGTH'], '4')
+        self.assertEqual(environ['HTTP_X_FORWARDED_FOR'], 'a,b')
+        self.assertEqual(environ['REMOTE_ADDR'], '127.0.0.1')
+        self.assertIs(environ['asgi.scope'], scope)
+
+    def test_defaults(self):
+        environ = self._callFUT({'type': 'http', 'method': 'GET', 'path': '/'})
+        self.assertEqual(environ['CONTENT_LENGTH'], '0')
+        self.assertEqual(environ['SCRIPT_NAME'], '')
+        self.assertEqual(environ['QUERY_STRING'], '')
+        self.assertEqual(environ['SERVER_NAME'], 'localhost')
+        self.assertEqual(environ['SERVER_PORT'], '80')
+        self.assertEqual(environ['wsgi.url_scheme'], 'http')
+        self.assertNotIn('REMOTE_ADDR', environ)
+
+
+class Test_run_awaitable(unittest.TestCase):
+    def _callFUT(self, request, awaitable):
+        from pyramid.asgi import run_awaitable
+
+        return run_awaitable(request, awaitable)
+
+    def test_without_loop(self):
+        async def coro():
+            return 'OK'
+
+        request = testing.DummyRequest()
+        self.assertEqual(self._callFUT(request, coro()), 'OK')
+
+    def test_with_stopped_loop(self):
+        from pyramid.asgi import LOOP_KEY
+
+        async def coro():
+            return 'OK'
+
+        loop = asyncio.new_event_loop()
+        try:
+            request = testing.DummyRequest(environ={LOOP_KEY: loop})
+            self.assertEqual(self._callFUT(request, coro()), 'OK')
+        finally:
+            loop.close()
+
+    def test_with_loop_in_other_thread(self):
+        from concurrent.futures import ThreadPoolExecutor
+        import threading
+
+        from pyramid.asgi import (
+            EXECUTOR_KEY,
+            HANDLER_EXECUTOR_KEY,
+            LOOP_KEY,
+            run_in_thread,
+        )
+
+        loop = asyncio.new_event_loop()
+        thread = threading.Thread(target=loop.run_forever)
+        thread.start()
+        executor = ThreadPoolExecutor(1, thread_name_prefix='executor')
+        handler_executor = ThreadPoolExecutor(1, thread_name_prefix='handler')
+        try:
+            request = testing.DummyRequest(
+                environ={
+                    LOOP_KEY: loop,
+                    EXECUTOR_KEY: executor,
+                    HANDLER_EXECUTOR_KEY: handler_executor,
+                }
+            )
+
+            async def coro():
+                self.assertIs(asyncio.get_running_loop(), loop)
+                # the calling thread is blocked, so synchronous code runs
+                # in the separate thread pool
+                current = await run_in_thread(
+                    request, threading.current_thread
+                )
+                return current.name
+
+            self.assertTrue(self._callFUT(request, coro()).startswith('h'))
+        finally:
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join()
+            loop.close()
+            executor.shutdown()
+            handler_executor.shutdown()
+
+    def test_from_running_loop(self):
+        async def coro():
+            """ """
+
+        async def main():
+            request = testing.DummyRequest()
+            self.assertRaises(RuntimeError, self._callFUT, request, coro())
+
+        asyncio.run(main())
+
+
+class Test_run_in_thread(unittest.TestCase):
+    def _callFUT(self, request, func, *args):
+        from pyramid.asgi import run_in_thread
+
+        return run_in_thread(request, func, *args)
+
+    def test_it(self):
+        import threading
+
+        from pyramid.threadlocal import get_current_request
+
+        def func(a):
+            return a, get_current_request(), threading.current_thread()
+
+        request = testing.DummyRequest()
+        a, current, thread = asyncio.run(self._callFUT(request, func, 1))
+        self.assertEqual(a, 1)
+        self.assertIs(current, request)
+        self.assertIsNot(thread, threading.current_thread())
+
+
+class Test_is_coroutine_callable(unittest.TestCase):
+    def _callFUT(self, ob, attr=None):
+        from pyramid.asgi import is_coroutine_callable
+
+        return is_coroutine_callable(ob, attr)
+
+    def test_function(self):
+        def view(request):
+            """ """
+
+        async def aview(request):
+            """ """
+
+        self.assertFalse(self._callFUT(view))
+        self.assertTrue(self._callFUT(aview))
+
+    def test_instance(self):
+        class View:
+            def __call__(self, request):
+                """ """
+
+        class AView:
+            async def __call__(self, request):
+                """ """
+
+        self.assertFalse(self._callFUT(View()))
+        self.assertTrue(self._callFUT(AView()))
+        self.assertFalse(self._callFUT(object()))
+
+    def test_class(self):
+        class View:
+            def __init__(self, request):
+                """ """
+
+            async def __call__(self):
+                """ """
+
+            async def index(self):
+                """ """
+
+            def other(self):
+                """ """
+
+        self.assertTrue(self._callFUT(View))
+        self.assertTrue(self._callFUT(View, 'index'))
+        self.assertFalse(self._callFUT(View, 'other'))
+        self.assertFalse(self._callFUT(View, 'missing'))
+
+
+class Test_awaitable_handler(unittest.TestCase):
+    def _callFUT(self, handler, coroutine=None):
+        from pyramid.asgi import awaitable_handler
+
+        return awaitable_handler(handler, coroutine)
+
+    def test_without_loop(self):
+        def handler(request):
+            return request
+
+        request = testing.DummyRequest()
+        self.assertIs(self._callFUT(handler)(request), request)
+
+    def test_in_loop_not_awaited(self):
+        def handler(request):
+            return request
+
+        request = testing.DummyRequest()
+
+        async def main():
+            return self._callFUT(handler)(request)
+
+        self.assertIs(asyncio.run(main()), request)
+
+    def test_awaited(self):
+        from pyramid.threadlocal import get_current_request
+
+        def handler(request):
+            return get_current_request()
+
+        request = testing.DummyRequest()
+        wrapper = self._callFUT(handler)
+        wrapper._awaited = True
+
+        async def main():
+            return await wrapper(request)
+
+        self.assertIs(asyncio.run(main()), request)
+
+    def test_awaited_with_coroutine(self):
+        async def coroutine(request):
+            return 'coroutine'
+
+        def handler(request):
+            """ """
+
+        wrapper = self._callFUT(handler, coroutine)
+        wrapper._awaited = True
+
+        async def main():
+            return await wrapper(testing.DummyRequest())
+
+        self.assertEqual(asyncio.run(main()), 'coroutine')
+
+
+class Test_synchronous_handler(unittest.TestCase):
+    def _callFUT(self, handler):
+        from pyramid.asgi import synchronous_handler
+
+        return synchronous_handler(handler)
+
+    def test_it(self):
+        from pyramid.asgi import awaitable_handler
+
+        def handler(request):
+            """ """
+
+        self.assertIs(self._callFUT(handler), handler)
+        self.assertIs(self._callFUT(awaitable_handler(handler)), handler)
+
+
+class Test_coroutine_handler(unittest.TestCase):
+    def _callFUT(self, handler):
+        from pyramid.asgi import coroutine_handler
+
+        return coroutine_handler(handler)
+
+    def test_coroutine_function(self):
+        async def handler(request):
+            """ """
+
+        self.assertIs(self._callFUT(handler), handler)
+
+    def test_synchronous_tween(self):
+        from pyramid.asgi import synchronous_tween
+
+        async def handler(request):
+            """ """
+
+        self.assertIs(self._callFUT(synchronous_tween(handler)), handler)
+
+    def test_synchronous(self):
+        import threading
+
+        def handler(request):
+            return threading.current_thread()
+
+        coroutine = self._callFUT(handler)
+        thread = asyncio.run(coroutine(testing.DummyRequest()))
+        self.assertIsNot(thread, threading.current_thread())
+
+
+class IDummyContext(Interface):
+    pass
+
+
+@implementer(IDummyContext)
+class DummyRoot:
+    def __init__(self, request):
+        pass
+
+
+def sleeping_tween_factory(handler, registry):
+    async def tween(request):
+        await asyncio.sleep(0.2)
+        return await handler(request)
+
+    return tween
+
+
+def async_tween_factory(handler, registry):
+    async def tween(request):
+        response = await handler(request)
+        response.headers['X-Tween'] = 'async'
+        return response
+
+    return tween
+
+
+def sync_tween_factory(handler, registry):
+    def tween(request):
+        response = handler(request)
+        response.headers['X-Tween'] = 'sync'
+        return response
+
+    return tween
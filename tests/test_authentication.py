@@ -903,6 +903,80 @@ class TestAuthTktCookieHelper(unittest.TestCase):
         result = helper.identify(request)
         self.assertFalse(result)
 
+    def test_identify_parsed_ticket_cached(self):
+        helper = self._makeOne('secret', include_ip=True)
+        helper.auth_tkt.tokens = [text_('a')]
+        result = helper.identify(self._makeRequest('ticket'))
+        self.assertEqual(result['tokens'], [text_('a')])
+        helper.parse_ticket = None
+        result['tokens'].append(text_('b'))
+        request = self._makeRequest('ticket')
+        result = helper.identify(request)
+        self.assertEqual(result['userid'], 'userid')
+        self.assertEqual(result['tokens'], [text_('a')])
+        self.assertEqual(request.environ['REMOTE_USER_TOKENS'], ['a'])
+
+    def test_identify_parsed_ticket_cache_keys(self):
+        helper = self._makeOne('secret', include_ip=True)
+        helper.identify(self._makeRequest('ticket'))
+        helper.identify(self._makeRequest('other'))
+        helper.identify(self._makeRequest('ticket', ipv6=True))
+        self.assertEqual(
+            list(helper._parsed_tickets),
+            [
+                ('ticket', '1.1.1.1', 'secret', 'sha512'),
+                ('other', '1.1.1.1', 'secret', 'sha512'),
+                ('ticket', '::1', 'secret', 'sha512'),
+            ],
+        )
+
+    def test_identify_parsed_ticket_cache_evicts_least_recent(self):
+        helper = self._makeOne('secret')
+        helper.parsed_ticket_cache_size = 2
+        helper.identify(self._makeRequest('one'))
+        helper.identify(self._makeRequest('two'))
+        helper.identify(self._makeRequest('one'))
+        helper.identify(self._makeRequest('three'))
+        self.assertEqual(
+            [key[0] for key in helper._parsed_tickets], ['one', 'three']
+        )
+
+    def test_identify_parsed_ticket_cache_busy(self):
+        helper = self._makeOne('secret')
+        helper.identify(self._makeRequest('one'))
+        helper.identify(self._makeRequest('two'))
+        with helper._parsed_tickets._lock:
+            result = helper.identify(self._makeRequest('one'))
+        self.assertEqual(result['userid'], 'userid')
+        self.assertEqual(
+            [key[0] for key in helper._parsed_tickets], ['one', 'two']
+        )
+
+    def test_identify_parsed_ticket_cache_disabled(self):
+        helper = self._makeOne('secret')
+        helper.parsed_ticket_cache_size = 0
+        helper.identify(self._makeRequest('ticket'))
+        self.assertEqual(len(helper._parsed_tickets), 0)
+
+    def test_identify_bad_cookie_not_cached(self):
+        helper = self._makeOne('secret')
+        helper.auth_tkt.parse_raise = True
+        self.assertEqual(helper.identify(self._makeRequest('ticket')), None)
+        self.assertEqual(len(helper._parsed_tickets), 0)
+
+    def test_identify_cookie_timeout_aged_forgotten(self):
+        import time
+
+        helper = self._makeOne('secret', timeout=10)
+        now = time.time()
+        helper.auth_tkt.timestamp = now - 1
+        helper.now = now
+        self.assertTrue(helper.identify(self._makeRequest('ticket')))
+        self.assertEqual(len(helper._parsed_tickets), 1)
+        helper.now = now + 10
+        self.assertFalse(helper.identify(self._makeRequest('ticket')))
+        self.assertEqual(len(helper._parsed_tickets), 0)
+
     def test_identify_cookie_reissue(self):
         import time
 
@@ -148,6 +148,38 @@ class TestACLAuthorizationPolicy(unittest.TestCase):
         # ['view_stuff']
         self.assertEqual(result, False)
 
+    def test_filter_permitted(self):
+        from pyramid.authorization import Allow
+
+        root = DummyContext(__acl__=[(Allow, 'fred', VIEW)])
+        child = DummyContext(__parent__=root, __acl__=[])
+        other = DummyContext()
+        policy = self._makeOne()
+        self.assertEqual(
+            policy.filter_permitted([root, other, child], ['fred'], VIEW),
+            [root, child],
+        )
+
+    def test_walk_principals_allowed_by_permission(self):
+        from pyramid.authorization import Allow
+
+        root = DummyContext(__acl__=[(Allow, 'fred', VIEW)])
+        child = DummyContext(__parent__=root, __acl__=[(Allow, 'bob', VIEW)])
+        root.values = lambda: [child]
+        policy = self._makeOne()
+        self.assertEqual(
+            list(policy.walk_principals_allowed_by_permission(root, VIEW)),
+            [(root, {'fred'}), (child, {'fred', 'bob'})],
+        )
+        self.assertEqual(
+            list(
+                policy.walk_principals_allowed_by_permission(
+                    root, VIEW, lambda resource: []
+                )
+            ),
+            [(root, {'fred'})],
+        )
+
     def test_principals_allowed_by_permission_direct(self):
         from pyramid.authorization import DENY_ALL, Allow
 
@@ -527,6 +559,258 @@ class TestACLHelper(unittest.TestCase):
         )
         self.assertEqual(result, [])
 
+    def _makeLineage(self, compiled):
+        from pyramid.authorization import (
+            ALL_PERMISSIONS,
+            DENY_ALL,
+            Allow,
+            Authenticated,
+            CompiledACL,
+            Deny,
+        )
+
+        acl = CompiledACL if compiled else list
+        root = DummyContext(__name__='')
+        community = DummyContext(__name__='community', __parent__=root)
+        blog = DummyContext(__name__='blog', __parent__=community)
+        root.__acl__ = acl([(Allow, Authenticated, VIEW)])
+        community.__acl__ = acl(
+            [
+                (Allow, 'fred', ALL_PERMISSIONS),
+                (Deny, 'barney', EDIT),
+                (Allow, 'wilma', VIEW),
+                DENY_ALL,
+            ]
+        )
+        blog.__acl__ = lambda: acl(
+            [
+                (Allow, 'barney', MEMBER_PERMS),
+                (Allow, 'wilma', VIEW),
+                (Deny, 'wilma', set(MODERATOR_PERMS)),
+            ]
+        )
+        return [root, community, blog]
+
+    def test_compiled_acl(self):
+        from pyramid.authorization import ACLHelper, Authenticated, Everyone
+
+        helper = ACLHelper()
+        plain = self._makeLineage(False)
+        compiled = self._makeLineage(True)
+        for principals in (
+            [Everyone],
+            [Everyone, Authenticated],
+            [Everyone, Authenticated, 'fred'],
+            [Everyone, Authenticated, 'barney'],
+            [Everyone, Authenticated, 'wilma'],
+        ):
+            for permission in ADMINISTRATOR_PERMS + ('other',):
+                for context, compiled_context in zip(plain, compiled):
+                    expected = helper.permits(context, principals, permission)
+                    result = helper.permits(
+                        compiled_context, principals, permission
+                    )
+                    self.assertEqual(result, expected)
+                    self.assertEqual(result.ace, expected.ace)
+                    self.assertEqual(list(result.acl), list(expected.acl))
+                    self.assertEqual(
+                        result.context.__name__, expected.context.__name__
+                    )
+
+    def test_permits_cache(self):
+        from pyramid.authorization import (
+            DENY_ALL,
+            ACLHelper,
+            Authenticated,
+            Everyone,
+        )
+
+        helper = ACLHelper()
+        root, community, blog = self._makeLineage(True)
+        cache = {}
+        principals = [Everyone, Authenticated, 'wilma']
+        result = helper.permits(blog, principals, VIEW, cache=cache)
+        self.assertEqual(result, True)
+        blog.__acl__ = [DENY_ALL]
+        self.assertIs(
+            helper.permits(blog, principals[::-1], VIEW, cache=cache), result
+        )
+        self.assertEqual(helper.permits(blog, principals, VIEW), False)
+        self.assertEqual(
+            helper.permits(blog, principals, EDIT, cache=cache), False
+        )
+        self.assertEqual(len(cache), 2)
+
+    def test_permits_cache_reused_id(self):
+        from pyramid.authorization import ACLHelper, Allow, Everyone
+
+        helper = ACLHelper()
+        context = DummyContext(__acl__=[(Allow, Everyone, VIEW)])
+        other = DummyContext()
+        cache = {(id(other), frozenset([Everyone]), VIEW): (context, True)}
+        result = helper.permits(other, [Everyone], VIEW, cache=cache)
+        self.assertEqual(result, False)
+        self.assertIs(
+            cache[(id(other), frozenset([Everyone]), VIEW)][0], other
+        )
+
+    def test_filter_permitted(self):
+        from pyramid.authorization import ACLHelper, Authenticated, Everyone
+
+        helper = ACLHelper()
+        for compiled in (False, True):
+            root, community, blog = self._makeLineage(compiled)
+            posts = [
+                DummyContext(__name__=str(i), __parent__=blog)
+                for i in range(3)
+            ]
+            unrelated = DummyContext(__name__='unrelated')
+            resources = [root, community] + posts + [blog, unrelated]
+            for principals in (
+                [Everyone],
+                [Everyone, Authenticated],
+                [Everyone, Authenticated, 'barney'],
+                [Everyone, Authenticated, 'wilma'],
+            ):
+                for permission in ADMINISTRATOR_PERMS:
+                    expected = [
+                        resource
+                        for resource in resources
+                        if helper.permits(resource, principals, permission)
+                    ]
+                    self.assertEqual(
+                        helper.filter_permitted(
+                            resources, principals, permission
+                        ),
+                        expected,
+                    )
+
+    def test_filter_permitted_consults_shared_acls_once(self):
+        from pyramid.authorization import ACLHelper, Allow, Everyone
+
+        calls = []
+
+        def acl():
+            calls.append(True)
+            return [(Allow, 'fred', VIEW)]
+
+        helper = ACLHelper()
+        root = DummyContext(__name__='', __acl__=acl)
+        folder = DummyContext(__name__='folder', __parent__=root)
+        children = [
+            DummyContext(__name__=str(i), __parent__=folder) for i in range(10)
+        ]
+        self.assertEqual(
+            helper.filter_permitted(children, [Everyone], VIEW), []
+        )
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(
+            helper.filter_permitted(children, [Everyone, 'fred'], VIEW),
+            children,
+        )
+
+    def test_walk_principals_allowed_by_permission(self):
+        from pyramid.authorization import ACLHelper, Allow, Deny
+
+        helper = ACLHelper()
+        for compiled in (False, True):
+            root, community, blog = self._makeLineage(compiled)
+            posts = [
+                DummyContext(__name__=str(i), __parent__=blog)
+                for i in range(3)
+            ]
+            posts[1].__acl__ = [(Deny, 'barney', VIEW), (Allow, 'fred', EDIT)]
+            members = DummyContext(__name__='members', __parent__=community)
+            root.values = lambda: [community]
+            community.values = lambda: [blog, members]
+            blog.values = lambda: posts
+            resources = [root, community, blog] + posts + [members]
+            for permission in ADMINISTRATOR_PERMS + ('other',):
+                result = list(
+                    helper.walk_principals_allowed_by_permission(
+                        root, permission
+                    )
+                )
+                self.assertEqual(
+                    [resource for resource, principals in result], resources
+                )
+                for resource, principals in result:
+                    self.assertIsInstance(principals, frozenset)
+                    self.assertEqual(
+                        principals,
+                        helper.principals_allowed_by_permission(
+                            resource, permission
+                        ),
+                    )
+                allowed = dict(result)
+                self.assertIs(allowed[posts[0]], allowed[blog])
+                self.assertIs(allowed[members], allowed[community])
+
+    def test_walk_principals_allowed_by_permission_children(self):
+        from pyramid.authorization import ACLHelper, Allow, Everyone
+
+        helper = ACLHelper()
+        root = DummyContext(__name__='', __acl__=[(Allow, 'fred', VIEW)])
+        folder = DummyContext(__name__='folder', __parent__=root)
+        leaf = DummyContext(__acl__=[(Allow, Everyone, VIEW)])
+        tree = {folder: [leaf]}
+        result = list(
+            helper.walk_principals_allowed_by_permission(
+                folder, VIEW, lambda resource: tree.get(resource, [])
+            )
+        )
+        self.assertEqual(
+            result,
+            [(folder, {'fred'}), (leaf, {'fred', Everyone})],
+        )
+
+
+class TestCompiledACL(unittest.TestCase):
+    def _makeOne(self, acl):
+        from pyramid.authorization import CompiledACL
+
+        return CompiledACL(acl)
+
+    def test_sequence(self):
+        from pyramid.authorization import Allow, Everyone
+
+        acl = [(Allow, Everyone, VIEW), (Allow, 'fred', EDIT)]
+        compiled = self._makeOne(acl)
+        self.assertEqual(list(compiled), acl)
+        self.assertEqual(compiled, tuple(acl))
+        self.assertFalse(self._makeOne([]))
+
+    def test_entries(self):
+        from pyramid.authorization import ALL_PERMISSIONS, Allow, Deny
+
+        acl = [
+            (Allow, 'fred', VIEW),
+            (Allow, 'wilma', [VIEW, EDIT]),
+            (Allow, 'barney', 'review'),
+            (Deny, 'betty', ALL_PERMISSIONS),
+        ]
+        compiled = self._makeOne(acl)
+        entries = compiled.entries(VIEW)
+        self.assertEqual(
+            entries,
+            (
+                (acl[0], Allow, 'fred'),
+                (acl[1], Allow, 'wilma'),
+                (acl[3], Deny, 'betty'),
+            ),
+        )
+        self.assertIs(compiled.entries(VIEW), entries)
+        self.assertEqual(
+            compiled.entries('view-review'), ((acl[3], Deny, 'betty'),)
+        )
+
+    def test_entries_unhashable_permission(self):
+        from pyramid.authorization import ALL_PERMISSIONS, Deny
+
+        compiled = self._makeOne([(Deny, 'betty', ALL_PERMISSIONS)])
+        self.assertEqual(len(compiled.entries([VIEW])), 1)
+        self.assertEqual(compiled._entries, {})
+
 
 class DummyContext:
     def __init__(self, *arg, **kw):
@@ -298,6 +298,12 @@ class AdaptersConfiguratorMixinTests(unittest.TestCase):
         self.assertEqual(traverser.__class__, DummyTraverser)
         self.assertEqual(traverser.root, iface)
 
+    def test_add_traverser_clears_view_lookup_cache(self):
+        config = self._makeOne(autocommit=True)
+        cache = config.registry._view_lookup_cache
+        config.add_traverser(DummyTraverser, DummyIface)
+        self.assertIsNot(config.registry._view_lookup_cache, cache)
+
     def test_add_traverser_introspectables(self):
         config = self._makeOne()
         config.add_traverser(DummyTraverser, DummyIface)
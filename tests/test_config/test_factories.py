@@ -196,3 +196,35 @@ class TestFactoriesMixin(unittest.TestCase):
         registry = config.registry
         result = registry.queryUtility(IExecutionPolicy)
         self.assertEqual(result, default_execution_policy)
+
+    def test_set_request_timing_sink(self):
+        from pyramid.interfaces import IRequestTimingSink
+
+        config = self._makeOne(autocommit=True)
+
+        def dummy_sink(request, timings):  # pragma: no cover
+            pass
+
+        config.set_request_timing_sink(dummy_sink)
+        registry = config.registry
+        result = registry.queryUtility(IRequestTimingSink)
+        self.assertEqual(result, dummy_sink)
+
+    def test_set_request_timing_sink_dottedname(self):
+        from pyramid.interfaces import IRequestTimingSink
+        from pyramid.timing import TimingsLogger
+
+        config = self._makeOne(autocommit=True)
+        config.set_request_timing_sink('pyramid.timing.TimingsLogger')
+        registry = config.registry
+        result = registry.queryUtility(IRequestTimingSink)
+        self.assertEqual(result, TimingsLogger)
+
+    def test_set_request_timing_sink_to_None(self):
+        from pyramid.interfaces import IRequestTimingSink
+
+        config = self._makeOne(autocommit=True)
+        config.set_request_timing_sink(lambda request, timings: None)
+        config.set_request_timing_sink(None)
+        registry = config.registry
+        self.assertEqual(registry.queryUtility(IRequestTimingSink), None)
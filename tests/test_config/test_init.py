@@ -485,6 +485,20 @@ class ConfiguratorTests(unittest.TestCase):
         self.assertFalse(hasattr(reg, '_view_lookup_cache'))
         reg._clear_view_lookup_cache()
         self.assertEqual(reg._view_lookup_cache, {})
+        self.assertEqual(len(reg._view_lookup_misses), 0)
+        self.assertEqual(reg.view_lookup_generation, 1)
+
+    def test__fix_registry_adds_view_lookup_stats(self):
+        from pyramid.registry import Registry
+
+        reg = DummyRegistry()
+        config = self._makeOne(reg)
+        config._fix_registry()
+        self.assertEqual(reg.view_lookup_stats.negative_hits, 0)
+        self.assertEqual(
+            reg.view_lookup_miss_cache_size,
+            Registry.view_lookup_miss_cache_size,
+        )
 
     def test_setup_registry_calls_fix_registry(self):
         reg = DummyRegistry()
@@ -851,6 +865,65 @@ test_config.dummy_include2"""
         self.assertTrue(IApplicationCreated.providedBy(subscriber[0]))
         pyramid.config.global_registries.empty()
 
+    def test_make_wsgi_app_warm_caches(self):
+        from zope.interface import implementedBy
+
+        import pyramid.config
+
+        renderers = []
+
+        def renderer_factory(info):
+            renderers.append(info.name)
+            return lambda value, system: value
+
+        config = self._makeOne(settings={'pyramid.warm_caches': 'true'})
+        config.add_renderer('moo', renderer_factory)
+        config.add_view(
+            lambda context, request: 'OK', context=DummyContext, renderer='moo'
+        )
+        config.add_view(lambda request: 'OK', name='bad', renderer='missing')
+        config.make_wsgi_app()
+        self.assertEqual(renderers, ['moo'])
+        self.assertIn(
+            (IRequest, implementedBy(DummyContext), ''),
+            config.registry._view_lookup_cache,
+        )
+        pyramid.config.global_registries.empty()
+
+    def test_make_wsgi_app_warm_caches_off(self):
+        import pyramid.config
+
+        renderers = []
+
+        def renderer_factory(info):
+            renderers.append(info.name)  # pragma: no cover
+
+        config = self._makeOne()
+        config.add_renderer('moo', renderer_factory)
+        config.add_view(lambda request: 'OK', renderer='moo')
+        config.make_wsgi_app()
+        self.assertEqual(renderers, [])
+        self.assertEqual(config.registry._view_lookup_cache, {})
+        pyramid.config.global_registries.empty()
+
+    def test_make_asgi_app(self):
+        from pyramid.asgi import ASGIRouter
+        import pyramid.config
+        from pyramid.interfaces import IApplicationCreated
+        from pyramid.router import Router
+
+        config = self._makeOne()
+        subscriber = self._registerEventListener(config, IApplicationCreated)
+        executor = object()
+        app = config.make_asgi_app(executor=executor)
+        self.assertEqual(app.__class__, ASGIRouter)
+        self.assertEqual(app.router.__class__, Router)
+        self.assertEqual(app.registry, config.registry)
+        self.assertEqual(app.executor, executor)
+        self.assertEqual(pyramid.config.global_registries.last, app.registry)
+        self.assertEqual(len(subscriber), 1)
+        pyramid.config.global_registries.empty()
+
     def test_include_with_dotted_name(self):
         from tests import test_config
 
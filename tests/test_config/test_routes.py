@@ -35,6 +35,17 @@ class RoutesConfiguratorMixinTests(unittest.TestCase):
         mapper = config.get_routes_mapper()
         self.assertEqual(mapper.routelist, [])
 
+    def test_get_routes_mapper_uses_route_matcher_setting(self):
+        config = self._makeOne(settings={'pyramid.route_matcher': 'tree'})
+        mapper = config.get_routes_mapper()
+        self.assertEqual(mapper.matcher, 'tree')
+
+    def test_get_routes_mapper_bad_route_matcher_setting(self):
+        from pyramid.exceptions import ConfigurationError
+
+        config = self._makeOne(settings={'pyramid.route_matcher': 'wat'})
+        self.assertRaises(ConfigurationError, config.get_routes_mapper)
+
     def test_get_routes_mapper_already_registered(self):
         from pyramid.interfaces import IRoutesMapper
 
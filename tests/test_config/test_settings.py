@@ -630,6 +630,50 @@ class TestSettings(unittest.TestCase):
             ['example.com', 'foo.example.com', 'asdf.example.com'],
         )
 
+    def test_route_matcher(self):
+        result = self._makeOne({})
+        self.assertEqual(result['route_matcher'], 'linear')
+        self.assertEqual(result['pyramid.route_matcher'], 'linear')
+        result = self._makeOne({'route_matcher': 'tree'})
+        self.assertEqual(result['route_matcher'], 'tree')
+        self.assertEqual(result['pyramid.route_matcher'], 'tree')
+        result = self._makeOne({}, {'PYRAMID_ROUTE_MATCHER': 'tree'})
+        self.assertEqual(result['route_matcher'], 'tree')
+        self.assertEqual(result['pyramid.route_matcher'], 'tree')
+
+    def test_profile_tweens(self):
+        result = self._makeOne({})
+        self.assertEqual(result['profile_tweens'], False)
+        self.assertEqual(result['pyramid.profile_tweens'], False)
+        result = self._makeOne({'profile_tweens': 'true'})
+        self.assertEqual(result['profile_tweens'], True)
+        self.assertEqual(result['pyramid.profile_tweens'], True)
+        result = self._makeOne({}, {'PYRAMID_PROFILE_TWEENS': '1'})
+        self.assertEqual(result['profile_tweens'], True)
+        self.assertEqual(result['pyramid.profile_tweens'], True)
+
+    def test_warm_caches(self):
+        result = self._makeOne({})
+        self.assertEqual(result['warm_caches'], False)
+        self.assertEqual(result['pyramid.warm_caches'], False)
+        result = self._makeOne({'pyramid.warm_caches': 'true'})
+        self.assertEqual(result['warm_caches'], True)
+        self.assertEqual(result['pyramid.warm_caches'], True)
+        result = self._makeOne({}, {'PYRAMID_WARM_CACHES': '1'})
+        self.assertEqual(result['warm_caches'], True)
+        self.assertEqual(result['pyramid.warm_caches'], True)
+
+    def test_memoize_predicates(self):
+        result = self._makeOne({})
+        self.assertEqual(result['memoize_predicates'], False)
+        self.assertEqual(result['pyramid.memoize_predicates'], False)
+        result = self._makeOne({'memoize_predicates': 'true'})
+        self.assertEqual(result['memoize_predicates'], True)
+        self.assertEqual(result['pyramid.memoize_predicates'], True)
+        result = self._makeOne({}, {'PYRAMID_MEMOIZE_PREDICATES': '1'})
+        self.assertEqual(result['memoize_predicates'], True)
+        self.assertEqual(result['pyramid.memoize_predicates'], True)
+
     def test_originals_kept(self):
         result = self._makeOne({'a': 'i am so a'})
         self.assertEqual(result['a'], 'i am so a')
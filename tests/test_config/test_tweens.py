@@ -250,6 +250,119 @@ class TestTweens(unittest.TestCase):
         tweens.add_implicit('name1', factory1)
         self.assertEqual(tweens(None, None), '123')
 
+    def test___call___passthrough_factory(self):
+        tweens = self._makeOne()
+
+        def factory(handler, registry):
+            return handler
+
+        def handler(request):
+            """ """
+
+        tweens.add_implicit('name', factory)
+        self.assertTrue(tweens(handler, None) is handler)
+
+    def test___call___coroutine_tween(self):
+        from pyramid.testing import DummyRequest
+
+        tweens = self._makeOne()
+
+        def factory(handler, registry):
+            async def tween(request):
+                response = await handler(request)
+                return response + ' async'
+
+            return tween
+
+        def handler(request):
+            return 'OK'
+
+        tweens.add_implicit('name', factory)
+        tween = tweens(handler, None)
+        self.assertEqual(tween(DummyRequest()), 'OK async')
+
+    def test___call___sync_tween_over_coroutine_tween(self):
+        from pyramid.testing import DummyRequest
+
+        tweens = self._makeOne()
+
+        def factory1(handler, registry):
+            async def tween(request):
+                return await handler(request) + ' async'
+
+            return tween
+
+        def factory2(handler, registry):
+            def tween(request):
+                return handler(request) + ' sync'
+
+            return tween
+
+        tweens.add_implicit('name1', factory1)
+        tweens.add_implicit('name2', factory2)
+        tween = tweens(lambda request: 'OK', None)
+        self.assertEqual(tween(DummyRequest()), 'OK async sync')
+
+    def test___call___profile_tweens(self):
+        from pyramid.registry import Registry
+        from pyramid.testing import DummyRequest
+
+        registry = Registry()
+        registry.settings = {'profile_tweens': True}
+        tweens = self._makeOne()
+
+        def factory(handler, registry):
+            def tween(request):
+                return handler(request)
+
+            return tween
+
+        tweens.add_implicit('name', factory)
+        handler = tweens(lambda request: 'OK', registry)
+        self.assertEqual(handler(DummyRequest()), 'OK')
+        histograms = tweens.profile.histograms
+        self.assertEqual(sorted(histograms), ['MAIN', 'name'])
+        self.assertEqual(histograms['name'].count, 1)
+        self.assertEqual(histograms['MAIN'].count, 1)
+
+    def test___call___profile_tweens_disabled(self):
+        from pyramid.registry import Registry
+
+        registry = Registry()
+        registry.settings = {'profile_tweens': False}
+        tweens = self._makeOne()
+
+        def handler(request):
+            """ """
+
+        self.assertIs(tweens(handler, registry), handler)
+        self.assertEqual(tweens.profile, None)
+
+    def test___call___profiled_coroutine_tween(self):
+        import asyncio
+
+        from pyramid.asgi import coroutine_handler
+        from pyramid.registry import Registry
+        from pyramid.testing import DummyRequest
+
+        tweens = self._makeOne()
+
+        def factory(handler, registry):
+            async def tween(request):
+                return await handler(request) + ' async'
+
+            return tween
+
+        registry = Registry()
+        registry.settings = {'profile_tweens': True}
+        tweens.add_implicit('name', factory)
+        tween = tweens(lambda request: 'OK', registry)
+        self.assertEqual(tween(DummyRequest()), 'OK async')
+        coroutine = coroutine_handler(tween)
+        self.assertEqual(asyncio.run(coroutine(DummyRequest())), 'OK async')
+        self.assertEqual(tweens.profile.histograms['name'].count, 2)
+        self.assertEqual(tweens.profile.histograms['MAIN'].count, 2)
+
     def test_implicit_ordering_1(self):
         tweens = self._makeOne()
         tweens.add_implicit('name1', 'factory1')
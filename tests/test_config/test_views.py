@@ -3461,6 +3461,127 @@ class TestMultiView(unittest.TestCase):
         response = mv(context, request)
         self.assertEqual(response, expected_response)
 
+    def _makePredicated(self, response, *predicates):
+        from pyramid.config.views import predicated_view
+
+        calls = []
+
+        def view(context, request):
+            calls.append(True)
+            return response
+
+        info = DummyViewDeriverInfo(list(predicates))
+        wrapped = predicated_view(view, info)
+        wrapped.calls = calls
+        return wrapped
+
+    def test___call__predicates_evaluated_once(self):
+        mv = self._makeOne()
+        context = DummyContext()
+        request = DummyRequest()
+        get = CountingPredicate('request_method = GET', False)
+        xhr = CountingPredicate('xhr = True', True)
+        view1 = self._makePredicated('one', xhr, get)
+        view2 = self._makePredicated(
+            'two', CountingPredicate('request_method = GET', False)
+        )
+        view3 = self._makePredicated(
+            'three', CountingPredicate('xhr = True', True)
+        )
+        mv.views = [(1, view1, None), (2, view2, None), (3, view3, None)]
+        self.assertEqual(mv(context, request), 'three')
+        self.assertEqual(xhr.calls, 1)
+        self.assertEqual(get.calls, 1)
+        self.assertEqual(view3.__predicates__[0].calls, 0)
+        self.assertEqual(view3.calls, [True])
+        self.assertEqual(view1.calls, [])
+
+    def test___call__predicates_memoized(self):
+        from pyramid.registry import PredicateMemoStats
+        from pyramid.util import PredicateMemo
+
+        mv = self._makeOne()
+        request = DummyRequest()
+        request._predicate_memo = PredicateMemo(PredicateMemoStats())
+        xhr = CountingPredicate('xhr = True', True)
+        xhr.request_only = True
+        request._predicate_memo(xhr, None, request)
+        predicate = CountingPredicate('xhr = True', False)
+        predicate.request_only = True
+        view = self._makePredicated('one', predicate)
+        mv.views = [(1, view, None)]
+        self.assertEqual(mv(DummyContext(), request), 'one')
+        self.assertEqual((xhr.calls, predicate.calls), (1, 0))
+        self.assertEqual(request._predicate_memo.stats.saved, 1)
+
+    def test___call__predicates_reject(self):
+        from pyramid.exceptions import PredicateMismatch
+
+        mv = self._makeOne()
+        view = self._makePredicated('one', CountingPredicate('a', False))
+        mv.views = [(1, view, None)]
+        self.assertRaises(
+            PredicateMismatch, mv, DummyContext(), DummyRequest()
+        )
+        with self.assertRaises(PredicateMismatch) as cm:
+            view(DummyContext(), DummyRequest())
+        self.assertIn('(a)', str(cm.exception))
+
+    def test___call__table_reset_by_add(self):
+        from pyramid.exceptions import PredicateMismatch
+
+        mv = self._makeOne()
+        view1 = self._makePredicated('one', CountingPredicate('a', False))
+        view2 = self._makePredicated('two', CountingPredicate('a', True))
+        mv.add(view1, 100, phash='phash')
+        self.assertRaises(
+            PredicateMismatch, mv, DummyContext(), DummyRequest()
+        )
+        mv.add(view2, 100, phash='phash')
+        self.assertEqual(mv(DummyContext(), DummyRequest()), 'two')
+
+    def test___call__configured_views(self):
+        from zope.interface import Interface
+
+        from pyramid.config import Configurator
+        from pyramid.interfaces import IViewClassifier
+        from pyramid.request import Request
+
+        config = Configurator()
+        config.add_view(
+            lambda r: 'get', request_method='GET', renderer='string'
+        )
+        config.add_view(lambda r: 'post', request_method='POST', xhr=True)
+        config.commit()
+        mv = config.registry.adapters.lookup(
+            (IViewClassifier, IRequest, Interface), IMultiView, name=''
+        )
+        for order, view, phash in mv.views:
+            self.assertIsNotNone(mv._table(view))
+        request = Request.blank('/')
+        request.registry = config.registry
+        response = mv(None, request)
+        self.assertEqual(response.body, b'get')
+
+    def test_match_predicates_evaluated_once(self):
+        mv = self._makeOne()
+        pred = CountingPredicate('a', False)
+        view1 = self._makePredicated('one', pred)
+        view2 = self._makePredicated('two', CountingPredicate('a', False))
+
+        def view3(context, request):
+            """ """
+
+        mv.views = [(1, view1, None), (2, view2, None), (3, view3, None)]
+        self.assertIs(mv.match(DummyContext(), DummyRequest()), view3)
+        self.assertEqual(pred.calls, 1)
+
+    def test_match_table_view(self):
+        mv = self._makeOne()
+        view = self._makePredicated('one', CountingPredicate('a', True))
+        mv.views = [(1, view, None)]
+        self.assertIs(mv.match(DummyContext(), DummyRequest()), view)
+
     def test__call_permissive__not_found(self):
         from pyramid.httpexceptions import HTTPNotFound
 
@@ -4430,6 +4551,28 @@ class DummyPredicate:
     phash = text
 
 
+class DummyViewDeriverInfo:
+    def __init__(self, predicates):
+        self.predicates = predicates
+
+
+class CountingPredicate:
+    def __init__(self, phash, result):
+        self.hash = phash
+        self.result = result
+        self.calls = 0
+
+    def text(self):
+        return self.hash
+
+    def phash(self):
+        return self.hash
+
+    def __call__(self, context, request):
+        self.calls += 1
+        return self.result
+
+
 class DummyIntrospector:
     def __init__(self, getval=None):
         self.related = []
@@ -536,6 +536,14 @@ class TestNotted(unittest.TestCase):
         self.assertEqual(inst.phash(), '')
         self.assertEqual(inst(None, None), True)
 
+    def test_request_only(self):
+        from pyramid.predicates import RequestMethodPredicate
+
+        inst = self._makeOne(DummyPredicate('val'))
+        self.assertFalse(inst.request_only)
+        inst = self._makeOne(RequestMethodPredicate('GET', None))
+        self.assertTrue(inst.request_only)
+
 
 class predicate:
     def __repr__(self):
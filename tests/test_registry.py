@@ -22,8 +22,21 @@ class TestRegistry(unittest.TestCase):
     def test_clear_view_cache_lookup(self):
         registry = self._makeOne()
         registry._view_lookup_cache[1] = 2
+        registry._view_lookup_misses.put(3, True, 10)
+        generation = registry.view_lookup_generation
         registry._clear_view_lookup_cache()
+        self.assertEqual(registry.view_lookup_generation, generation + 1)
         self.assertEqual(registry._view_lookup_cache, {})
+        self.assertEqual(len(registry._view_lookup_misses), 0)
+
+    def test_view_lookup_stats(self):
+        registry = self._makeOne()
+        stats = registry.view_lookup_stats
+        self.assertEqual(stats.hits, 0)
+        self.assertEqual(stats.misses, 0)
+        self.assertEqual(stats.negative_hits, 0)
+        self.assertEqual(stats.negative_stores, 0)
+        self.assertEqual(stats.negative_evictions, 0)
 
     def test_package_name(self):
         package_name = 'testing'
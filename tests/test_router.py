@@ -813,6 +813,135 @@ class TestRouter(unittest.TestCase):
         )
         self.assertTrue("predicates: 'predicate'" in logger.messages[0])
 
+    def test_call_route_dispatch_plan_reused(self):
+        from pyramid.interfaces import IViewClassifier
+
+        req_iface = self._registerRouteRequest('foo')
+        root = object()
+
+        def factory(request):
+            return root
+
+        self._connectRoute('foo', 'archives/:action/:article', factory)
+        context = DummyContext()
+        self._registerTraverserFactory(context)
+        response = DummyResponse()
+        response.app_iter = ['Hello world']
+        view = DummyView(response)
+        self._registerView(view, '', IViewClassifier, None, None)
+        router = self._makeOne()
+        environ = self._makeEnviron(PATH_INFO='/archives/action1/article1')
+        router(environ, DummyStartResponse())
+        self.assertEqual(view.request.request_iface, req_iface)
+        # the route request interface is looked up once per route
+        new_req_iface = self._registerRouteRequest('foo')
+        router(environ, DummyStartResponse())
+        self.assertEqual(view.request.request_iface, req_iface)
+        # until the view lookup cache is cleared
+        self.registry._clear_view_lookup_cache()
+        router(environ, DummyStartResponse())
+        self.assertEqual(view.request.request_iface, new_req_iface)
+
+    def test_call_traverser_cleared_with_view_lookup_cache(self):
+        from pyramid.interfaces import IViewClassifier
+
+        context = DummyContext()
+        self._registerTraverserFactory(context, view_name='a')
+        response = DummyResponse()
+        response.app_iter = ['Hello world']
+        view = DummyView(response)
+        self._registerView(view, 'a', IViewClassifier, None, None)
+        self._registerView(view, 'b', IViewClassifier, None, None)
+        router = self._makeOne()
+        router(self._makeEnviron(), DummyStartResponse())
+        self.assertEqual(view.request.view_name, 'a')
+        self._registerTraverserFactory(context, view_name='b')
+        router(self._makeEnviron(), DummyStartResponse())
+        self.assertEqual(view.request.view_name, 'a')
+        self.registry._clear_view_lookup_cache()
+        router(self._makeEnviron(), DummyStartResponse())
+        self.assertEqual(view.request.view_name, 'b')
+
+    def test_call_route_without_traverse_skips_traverser(self):
+        from pyramid import router as router_module
+        from pyramid.interfaces import IViewClassifier
+
+        req_iface = self._registerRouteRequest('foo')
+        root = {'action1': DummyContext()}
+
+        def factory(request):
+            return root
+
+        self._connectRoute('foo', ':action', factory)
+        response = DummyResponse()
+        response.app_iter = ['Hello world']
+        view = DummyView(response)
+        self._registerView(view, '', IViewClassifier, req_iface, None)
+        router = self._makeOne()
+        self._mockFinishRequest(router)
+        traverser = router_module.ResourceTreeTraverser
+        router_module.ResourceTreeTraverser = None
+        try:
+            environ = self._makeEnviron(PATH_INFO='/action1')
+            result = router(environ, DummyStartResponse())
+        finally:
+            router_module.ResourceTreeTraverser = traverser
+        self.assertEqual(result, ['Hello world'])
+        request = view.request
+        self.assertEqual(request.context, root)
+        self.assertEqual(request.root, root)
+        self.assertEqual(request.view_name, '')
+        self.assertEqual(request.subpath, ())
+        self.assertEqual(request.traversed, ())
+        self.assertEqual(request.virtual_root, root)
+        self.assertEqual(request.virtual_root_path, ())
+
+    def test_call_route_with_traverse_uses_traverser(self):
+        from pyramid.interfaces import IViewClassifier
+
+        req_iface = self._registerRouteRequest('foo')
+        context = DummyContext()
+        root = {'action1': context}
+
+        def factory(request):
+            return root
+
+        self._connectRoute('foo', '*traverse', factory)
+        response = DummyResponse()
+        response.app_iter = ['Hello world']
+        view = DummyView(response)
+        self._registerView(view, '', IViewClassifier, req_iface, None)
+        router = self._makeOne()
+        self._mockFinishRequest(router)
+        environ = self._makeEnviron(PATH_INFO='/action1')
+        router(environ, DummyStartResponse())
+        self.assertEqual(view.request.context, context)
+        self.assertEqual(view.request.traversed, ('action1',))
+
+    def test_call_route_without_traverse_virtual_root(self):
+        from pyramid.interfaces import IViewClassifier
+
+        req_iface = self._registerRouteRequest('foo')
+        context = DummyContext()
+        root = {'vroot': context}
+
+        def factory(request):
+            return root
+
+        self._connectRoute('foo', ':action', factory)
+        response = DummyResponse()
+        response.app_iter = ['Hello world']
+        view = DummyView(response)
+        self._registerView(view, '', IViewClassifier, req_iface, None)
+        router = self._makeOne()
+        self._mockFinishRequest(router)
+        environ = self._makeEnviron(
+            PATH_INFO='/action1', HTTP_X_VHM_ROOT='/vroot'
+        )
+        router(environ, DummyStartResponse())
+        self.assertEqual(view.request.context, context)
+        self.assertEqual(view.request.virtual_root, context)
+
     def test_call_route_match_miss_debug_routematch(self):
         from pyramid.httpexceptions import HTTPNotFound
 
@@ -1684,6 +1813,153 @@ class TestRouter(unittest.TestCase):
         self.assertEqual(result[0].path_info, '/test_path')
         self.assertEqual(result[1], None)
 
+    def test_request_timings_disabled(self):
+        from pyramid.interfaces import IViewClassifier
+        from pyramid.response import Response
+
+        requests = []
+
+        def view(context, request):
+            requests.append(request)
+            return Response('OK')
+
+        self._registerTraverserFactory(DummyContext())
+        self._registerView(view, '', IViewClassifier, None, None)
+        router = self._makeOne()
+        router(self._makeEnviron(), DummyStartResponse())
+        self.assertEqual(requests[0].timings, None)
+
+    def test_request_timings(self):
+        from pyramid.interfaces import IRequestTimingSink, IViewClassifier
+        from pyramid.response import Response
+
+        sunk = []
+
+        def sink(request, timings):
+            sunk.append((request, timings))
+
+        def view(context, request):
+            return Response('OK')
+
+        self.registry.registerUtility(sink, IRequestTimingSink)
+        self._registerTraverserFactory(DummyContext())
+        self._registerView(view, '', IViewClassifier, None, None)
+        router = self._makeOne()
+        router(self._makeEnviron(), DummyStartResponse())
+        self.assertEqual(len(sunk), 1)
+        request, timings = sunk[0]
+        self.assertIs(request.timings, timings)
+        self.assertEqual(
+            [phase for phase, start, end in timings.spans],
+            [
+                'ingress',
+                'new_request',
+                'route_match',
+                'root_factory',
+                'traversal',
+                'view_lookup',
+                'view',
+                'egress',
+                'response_callbacks',
+                'finished_callbacks',
+            ],
+        )
+        self.assertEqual(timings.spans[0][1], timings.start)
+        self.assertEqual(timings.spans[-1][2], timings.last)
+
+    def test_request_timings_exception(self):
+        from pyramid.interfaces import IRequestTimingSink
+
+        sunk = []
+
+        def sink(request, timings):
+            sunk.append(timings)
+
+        self.registry.registerUtility(sink, IRequestTimingSink)
+        router = self._makeOne()
+        environ = self._makeEnviron()
+        self.assertRaises(Exception, router, environ, DummyStartResponse())
+        self.assertEqual(len(sunk), 1)
+        self.assertEqual(sunk[0].spans[-1][0], 'finished_callbacks')
+
+    def test_request_timings_view_derivers(self):
+        from pyramid.config import Configurator
+        from pyramid.request import Request
+        from pyramid.response import Response
+
+        sunk = []
+
+        def view(request):
+            return Response('OK')
+
+        config = Configurator()
+        config.set_request_timing_sink(
+            lambda request, timings: sunk.append(timings)
+        )
+        config.add_view(view, http_cache=60)
+        config.commit()
+        app = self._getTargetClass()(config.registry)
+        response = Request.blank('/').get_response(app)
+        self.assertEqual(response.body, b'OK')
+        phases = [phase for phase, seconds in sunk[0].durations()]
+        self.assertEqual(
+            phases[phases.index('view') :],
+            [
+                'view',
+                'attr_wrapped_view',
+                'predicated_view',
+                'secured_view',
+                'csrf_view',
+                'owrapped_view',
+                'http_cached_view',
+                'decorated_view',
+                'rendered_view',
+                'mapped_view',
+                'egress',
+                'response_callbacks',
+                'finished_callbacks',
+            ],
+        )
+
+    def test_memoize_predicates(self):
+        from pyramid.config import Configurator
+        from pyramid.request import Request
+        from pyramid.response import Response
+
+        def view(request):
+            return Response('OK')
+
+        config = Configurator(settings={'memoize_predicates': True})
+        config.add_route('foo', '/foo', header='X-Foo')
+        config.add_view(view, route_name='foo', header='X-Foo')
+        config.commit()
+        app = self._getTargetClass()(config.registry)
+        stats = config.registry.predicate_memo_stats
+        request = Request.blank('/foo', headers={'X-Foo': '1'})
+        self.assertEqual(request.get_response(app).body, b'OK')
+        self.assertEqual((stats.evaluations, stats.saved), (1, 1))
+        request = Request.blank('/foo')
+        self.assertEqual(request.get_response(app).status_int, 404)
+        self.assertEqual((stats.evaluations, stats.saved), (2, 1))
+
+    def test_memoize_predicates_disabled(self):
+        from pyramid.config import Configurator
+        from pyramid.request import Request
+        from pyramid.response import Response
+
+        def view(request):
+            return Response('OK')
+
+        config = Configurator()
+        config.add_route('foo', '/foo', header='X-Foo')
+        config.add_view(view, route_name='foo', header='X-Foo')
+        config.commit()
+        app = self._getTargetClass()(config.registry)
+        stats = config.registry.predicate_memo_stats
+        request = Request.blank('/foo', headers={'X-Foo': '1'})
+        self.assertEqual(request.get_response(app).body, b'OK')
+        self.assertEqual((stats.evaluations, stats.saved), (0, 0))
+
 
 class DummyPredicate:
     def __call__(self, info, request):
@@ -53,6 +53,54 @@ class TestPTweensCommand(unittest.TestCase):
             'used)',
         )
 
+    def test_command_profile(self):
+        from pyramid.config import Configurator
+
+        config = Configurator()
+        config.commit()
+        command = self._makeOne()
+        command.bootstrap = dummy.DummyBootstrap(registry=config.registry)
+        command.args.profile = 3
+        command.args.path = '/missing'
+        L = []
+        command.out = L.append
+        result = command.run()
+        self.assertEqual(result, 0)
+        index = L.index('Tween Profile (3 requests to /missing)')
+        rows = [line.split() for line in L[index + 4 :]]
+        self.assertEqual(
+            [(row[0], row[1]) for row in rows],
+            [
+                ('pyramid.tweens.excview_tween_factory', '3'),
+                ('MAIN', '3'),
+            ],
+        )
+        tweens = command._get_tweens(config.registry)
+        self.assertEqual(tweens.profile, None)
+
+    def test_profile_chain_exception(self):
+        from pyramid.config import Configurator
+
+        config = Configurator()
+        config.add_tween('tests.test_scripts.test_ptweens.raising_tween')
+        config.commit()
+        command = self._makeOne()
+        tweens = command._get_tweens(config.registry)
+        profile = command.profile_chain(config.registry, tweens, 2, '/')
+        histogram = profile.histograms[
+            'tests.test_scripts.test_ptweens.raising_tween'
+        ]
+        self.assertEqual(histogram.count, 2)
+
+    def test_show_profile_tween_not_called(self):
+        from pyramid.timing import TweenProfile
+
+        command = self._makeOne()
+        L = []
+        command.out = L.append
+        command.show_profile([('name', 'factory')], TweenProfile())
+        self.assertEqual(L[2].split(), ['name', '0', '-', '-', '-'])
+
     def test__get_tweens(self):
         command = self._makeOne()
         registry = dummy.DummyRegistry()
@@ -68,3 +116,10 @@ class Test_main(unittest.TestCase):
     def test_it(self):
         result = self._callFUT(['ptweens'])
         self.assertEqual(result, 2)
+
+
+def raising_tween(handler, registry):
+    def tween(request):
+        raise ValueError
+
+    return tween
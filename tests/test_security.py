@@ -487,6 +487,56 @@ class TestHasPermission(unittest.TestCase):
         self.assertRaises(AttributeError, request.has_permission, 'view')
 
 
+class TestFilterPermitted(unittest.TestCase):
+    def setUp(self):
+        testing.setUp()
+
+    def tearDown(self):
+        testing.tearDown()
+
+    def _makeOne(self):
+        from pyramid.registry import Registry
+        from pyramid.security import SecurityAPIMixin
+
+        mixin = SecurityAPIMixin()
+        mixin.registry = Registry()
+        return mixin
+
+    def test_no_security_policy(self):
+        request = self._makeOne()
+        resources = iter(['a', 'b'])
+        self.assertEqual(
+            request.filter_permitted(resources, 'view'), ['a', 'b']
+        )
+
+    def test_with_security_policy(self):
+        request = self._makeOne()
+        policy = _registerSecurityPolicy(request.registry, None)
+        policy.permits = lambda request, context, permission: (
+            context == permission
+        )
+        self.assertEqual(
+            request.filter_permitted(['view', 'edit', 'view'], 'view'),
+            ['view', 'view'],
+        )
+
+    def test_with_filtering_security_policy(self):
+        request = self._makeOne()
+        policy = _registerSecurityPolicy(request.registry, None)
+        calls = []
+
+        def filter_permitted(req, resources, permission):
+            calls.append((req, resources, permission))
+            return ['filtered']
+
+        policy.filter_permitted = filter_permitted
+        resources = ['a', 'b']
+        self.assertEqual(
+            request.filter_permitted(resources, 'view'), ['filtered']
+        )
+        self.assertEqual(calls, [(request, resources, 'view')])
+
+
 class TestLegacySecurityPolicy(unittest.TestCase):
     def setUp(self):
         testing.setUp()
@@ -541,6 +591,101 @@ class TestLegacySecurityPolicy(unittest.TestCase):
 
         self.assertTrue(policy.permits(request, request.context, 'permission'))
 
+    def test_memoized_per_request(self):
+        from pyramid.security import LegacySecurityPolicy
+
+        request = _makeRequest()
+        policy = LegacySecurityPolicy()
+        authn = _registerAuthenticationPolicy(request.registry, ['p1'])
+        authz = _registerAuthorizationPolicy(request.registry, True)
+        calls = []
+        authn.effective_principals = lambda request: calls.append(1) or ['p1']
+        authn.authenticated_userid = lambda request: calls.append(2) or 'p1'
+        authz.permits = lambda context, principals, permission: principals
+        for _ in range(3):
+            self.assertEqual(
+                policy.permits(request, request.context, 'view'), ['p1']
+            )
+            self.assertEqual(policy.authenticated_userid(request), 'p1')
+        self.assertEqual(policy.effective_principals(request), ['p1'])
+        self.assertEqual(calls, [1, 2])
+        self.assertEqual(policy.saved_calls, 5)
+        policy.remember(request, 'p2')
+        policy.authenticated_userid(request)
+        policy.forget(request)
+        policy.permits(request, request.context, 'view')
+        self.assertEqual(calls, [1, 2, 2, 1])
+        other = _makeRequest()
+        other.registry = request.registry
+        policy.authenticated_userid(other)
+        self.assertEqual(calls, [1, 2, 2, 1, 2])
+        request._process_finished_callbacks()
+        policy.authenticated_userid(request)
+        self.assertEqual(calls, [1, 2, 2, 1, 2, 2])
+
+    def test_memoized_principals_copied(self):
+        from pyramid.security import LegacySecurityPolicy
+
+        request = _makeRequest()
+        policy = LegacySecurityPolicy()
+        _registerAuthenticationPolicy(request.registry, ['p1'])
+        authz = _registerAuthorizationPolicy(request.registry, True)
+        authz.permits = lambda context, principals, permission: principals
+        principals = policy.effective_principals(request)
+        principals.append('admin')
+        self.assertEqual(policy.effective_principals(request), ['p1'])
+        principals = policy.permits(request, request.context, 'view')
+        principals.append('admin')
+        self.assertEqual(
+            policy.permits(request, request.context, 'view'), ['p1']
+        )
+        self.assertEqual(policy.saved_calls, 3)
+
+    def test_request_effective_principals(self):
+        from pyramid.security import LegacySecurityPolicy
+
+        request = _makeRequest()
+        policy = _registerLegacySecurityPolicy(request.registry)
+        self.assertIsInstance(policy, LegacySecurityPolicy)
+        _registerAuthenticationPolicy(request.registry, ['p1'])
+        self.assertEqual(request.effective_principals, ['p1'])
+        self.assertEqual(request.effective_principals, ['p1'])
+        self.assertEqual(policy.saved_calls, 1)
+
+    def test_filter_permitted(self):
+        from pyramid.security import LegacySecurityPolicy
+
+        request = _makeRequest()
+        policy = LegacySecurityPolicy()
+        _registerAuthenticationPolicy(request.registry, ['p1', 'p2'])
+        authz = _registerAuthorizationPolicy(request.registry, True)
+        authz.permits = lambda context, principals, permission: (
+            context in principals
+        )
+        self.assertEqual(
+            policy.filter_permitted(request, ['p1', 'p3', 'p2'], 'view'),
+            ['p1', 'p2'],
+        )
+
+    def test_filter_permitted_filtering_authorization_policy(self):
+        from pyramid.security import LegacySecurityPolicy
+
+        request = _makeRequest()
+        policy = LegacySecurityPolicy()
+        _registerAuthenticationPolicy(request.registry, ['p1', 'p2'])
+        authz = _registerAuthorizationPolicy(request.registry, True)
+        calls = []
+
+        def filter_permitted(resources, principals, permission):
+            calls.append((resources, principals, permission))
+            return ['filtered']
+
+        authz.filter_permitted = filter_permitted
+        self.assertEqual(
+            policy.filter_permitted(request, ['a'], 'view'), ['filtered']
+        )
+        self.assertEqual(calls, [(['a'], ['p1', 'p2'], 'view')])
+
 
 _TEST_HEADER = 'X-Pyramid-Test'
 
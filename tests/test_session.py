@@ -50,6 +50,142 @@ class SharedCookieSessionTests:
         session = self._makeOne(request)
         self.assertEqual(dict(session), {})
 
+    def test_ctor_loads_lazily(self):
+        import time
+
+        request = testing.DummyRequest()
+        cookieval = self._serialize((time.time(), 0, {'state': 1}))
+        request.cookies['session'] = cookieval
+        session = self._makeOne(request)
+        self.assertFalse(session._loaded)
+        self.assertEqual(session['state'], 1)
+        self.assertTrue(session._loaded)
+
+    def test_attributes_load_lazily(self):
+        request = testing.DummyRequest()
+        cookieval = self._serialize((10, 5, {'state': 1}))
+        request.cookies['session'] = cookieval
+        session = self._makeOne(request, timeout=None)
+        self.assertEqual(session.created, 5)
+        self.assertTrue(session._loaded)
+        self.assertEqual(session.renewed, 10)
+        self.assertEqual(session.accessed, 10)
+        self.assertFalse(session.new)
+        self.assertRaises(AttributeError, getattr, session, 'missing')
+
+    def test_set_before_load(self):
+        import time
+
+        request = testing.DummyRequest()
+        cookieval = self._serialize((time.time(), 0, {'state': 1}))
+        request.cookies['session'] = cookieval
+        session = self._makeOne(request)
+        session['other'] = 2
+        self.assertEqual(dict(session), {'state': 1, 'other': 2})
+
+    def test_ior_before_load(self):
+        import time
+
+        request = testing.DummyRequest()
+        cookieval = self._serialize((time.time(), 0, {'state': 1}))
+        request.cookies['session'] = cookieval
+        session = self._makeOne(request)
+        session |= {'other': 2}
+        self.assertTrue(session._dirty)
+        self.assertEqual(dict(session), {'state': 1, 'other': 2})
+
+    def test_or_before_load(self):
+        import time
+
+        request = testing.DummyRequest()
+        cookieval = self._serialize((time.time(), 0, {'state': 1}))
+        request.cookies['session'] = cookieval
+        session = self._makeOne(request)
+        result = session | {'other': 2}
+        self.assertEqual(result, {'state': 1, 'other': 2})
+        self.assertIs(result.__class__, dict)
+        self.assertRaises(TypeError, lambda: session | 1)
+
+    def test_ror_before_load(self):
+        import time
+
+        request = testing.DummyRequest()
+        cookieval = self._serialize((time.time(), 0, {'state': 1}))
+        request.cookies['session'] = cookieval
+        session = self._makeOne(request)
+        result = {'other': 2, 'state': 0} | session
+        self.assertEqual(result, {'other': 2, 'state': 1})
+        self.assertIs(result.__class__, dict)
+        self.assertRaises(TypeError, lambda: 1 | session)
+
+    def test_reversed_before_load(self):
+        import time
+
+        request = testing.DummyRequest()
+        cookieval = self._serialize((time.time(), 0, {'a': 1, 'b': 2}))
+        request.cookies['session'] = cookieval
+        session = self._makeOne(request)
+        self.assertEqual(list(reversed(session)), ['b', 'a'])
+
+    def test_json_before_load(self):
+        import json
+        import time
+
+        request = testing.DummyRequest()
+        cookieval = self._serialize((time.time(), 0, {'state': 1}))
+        request.cookies['session'] = cookieval
+        session = self._makeOne(request)
+        self.assertEqual(json.dumps(dict(session)), '{"state": 1}')
+        self.assertEqual(json.dumps(session), '{"state": 1}')
+
+    def test_load_fails(self):
+        import time
+
+        request = testing.DummyRequest()
+        cookieval = self._serialize((time.time(), 0, {'state': 1}))
+        request.cookies['session'] = cookieval
+        session = self._makeOne(request)
+
+        def _load_value(request):
+            raise RuntimeError
+
+        session._load_value = _load_value
+        self.assertRaises(RuntimeError, session.get, 'state')
+        self.assertFalse(session._loaded)
+        del session._load_value
+        self.assertEqual(session.get('state'), 1)
+
+    def test_unwrapped_dict_methods_load(self):
+        import time
+
+        for method in (repr, lambda session: session.copy()):
+            request = testing.DummyRequest()
+            cookieval = self._serialize((time.time(), 0, {'state': 1}))
+            request.cookies['session'] = cookieval
+            session = self._makeOne(request)
+            method(session)
+            self.assertTrue(session._loaded)
+        self.assertEqual(session, {'state': 1})
+        self.assertFalse(session != {'state': 1})
+
+    def test_changed_before_load(self):
+        import time
+        import webob
+
+        request = testing.DummyRequest()
+        cookieval = self._serialize((time.time(), 0, {'state': 1}))
+        request.cookies['session'] = cookieval
+        session = self._makeOne(request)
+        session.changed()
+        self.assertFalse(session._loaded)
+        response = webob.Response()
+        session._set_cookie(response)
+        self.assertTrue(session._loaded)
+        cookieval = response.headerlist[-1][1].split(';')[0].split('=', 1)[1]
+        request = testing.DummyRequest()
+        request.cookies['session'] = cookieval
+        self.assertEqual(dict(self._makeOne(request)), {'state': 1})
+
     def test_timeout(self):
         import time
 
@@ -413,6 +549,24 @@ class TestSignedCookieSession(SharedCookieSessionTests, unittest.TestCase):
             ValueError, self._makeOne, request, max_age='invalid value'
         )
 
+    def test_signature_verified_lazily(self):
+        import time
+        import webob
+
+        serializer = DummyCountingSerializer()
+        request = testing.DummyRequest()
+        cookieval = self._serialize((time.time(), 0, {'state': 1}))
+        request.cookies['session'] = cookieval
+        session = self._makeOne(request, serializer=serializer)
+        request.session = session
+        self.assertEqual(serializer.loaded, 0)
+        self.assertEqual(session['state'], 1)
+        self.assertEqual(session.get('state'), 1)
+        self.assertEqual(serializer.loaded, 1)
+        session._set_cookie(webob.Response())
+        self.assertEqual(serializer.loaded, 1)
+        self.assertEqual(serializer.dumped, 1)
+
     def test_custom_salt(self):
         import time
 
@@ -508,6 +662,362 @@ class TestSignedCookieSession(SharedCookieSessionTests, unittest.TestCase):
         self.assertTrue('Set-Cookie' in dict(response.headerlist))
 
 
+class TestServerSideSession(SharedCookieSessionTests, unittest.TestCase):
+    def setUp(self):
+        from pyramid.session import MemorySessionStore
+
+        self.store = MemorySessionStore()
+
+    def _makeOne(self, request, **kw):
+        from pyramid.session import ServerSideSessionFactory
+
+        kw.setdefault('secret', 'secret')
+        kw.setdefault('store', self.store)
+        return ServerSideSessionFactory(**kw)(request)
+
+    def _serialize(self, value, session_id='abc123'):
+        self.store.save(session_id, json.dumps(value).encode('utf-8'), None)
+        return self._signId(session_id)
+
+    def _signId(self, session_id, salt='pyramid.session.id.'):
+        from webob.cookies import SignedSerializer
+
+        return SignedSerializer('secret', salt).dumps(session_id)
+
+    def _setCookie(self, session):
+        import webob
+
+        response = webob.Response()
+        self.assertEqual(session._set_cookie(response), True)
+        name, value = response.headerlist[-1]
+        self.assertEqual(name, 'Set-Cookie')
+        return value.split(';')[0].split('=', 1)[1]
+
+    def test_reissue_not_triggered(self):
+        import time
+
+        request = testing.DummyRequest()
+        cookieval = self._serialize((time.time(), 0, {'state': 1}))
+        request.cookies['session'] = cookieval
+        session = self._makeOne(request, reissue_time=1)
+        self.assertEqual(session['state'], 1)
+        self.assertFalse(session._dirty)
+
+    def test_reissue_never(self):
+        request = testing.DummyRequest()
+        cookieval = self._serialize((0, 0, {'state': 1}))
+        request.cookies['session'] = cookieval
+        session = self._makeOne(request, reissue_time=None, timeout=None)
+        self.assertEqual(session['state'], 1)
+        self.assertFalse(session._dirty)
+
+    def test_reissue_invalid(self):
+        request = testing.DummyRequest()
+        self.assertRaises(
+            ValueError, self._makeOne, request, reissue_time='invalid value'
+        )
+
+    def test__set_cookie_cookieval_too_long(self):
+        request = testing.DummyRequest()
+        session = self._makeOne(request)
+        session['abc'] = 'x' * 100000
+        cookieval = self._setCookie(session)
+        self.assertLess(len(cookieval), 200)
+        request = testing.DummyRequest()
+        request.cookies['session'] = cookieval
+        session = self._makeOne(request)
+        self.assertEqual(session['abc'], 'x' * 100000)
+
+    def test_state_saved_in_store(self):
+        request = testing.DummyRequest()
+        session = self._makeOne(request, timeout=60)
+        session['state'] = 1
+        cookieval = self._setCookie(session)
+        session_id = session._session_id
+        expires, data = self.store._sessions[session_id]
+        self.assertAlmostEqual(expires, session.accessed + 60, delta=1)
+        self.assertEqual(json.loads(data)[2], {'state': 1})
+        request = testing.DummyRequest()
+        request.cookies['session'] = cookieval
+        session = self._makeOne(request)
+        self.assertEqual(dict(session), {'state': 1})
+        self.assertFalse(session.new)
+        self.assertEqual(session._session_id, session_id)
+
+    def test_default_store(self):
+        from pyramid.session import (
+            MemorySessionStore,
+            ServerSideSessionFactory,
+        )
+
+        factory = ServerSideSessionFactory('secret')
+        self.assertIsInstance(factory._store, MemorySessionStore)
+        self.assertIsNot(
+            ServerSideSessionFactory('secret')._store, factory._store
+        )
+
+    def test_ctor_with_unknown_session_id(self):
+        request = testing.DummyRequest()
+        request.cookies['session'] = self._signId('abc123')
+        session = self._makeOne(request)
+        self.assertEqual(dict(session), {})
+        self.assertTrue(session.new)
+        self.assertNotEqual(session._session_id, 'abc123')
+
+    def test_ctor_with_bad_state(self):
+        request = testing.DummyRequest()
+        self.store.save('abc123', b'{', None)
+        request.cookies['session'] = self._signId('abc123')
+        session = self._makeOne(request)
+        self.assertEqual(dict(session), {})
+        self.assertNotEqual(session._session_id, 'abc123')
+
+    def test_ctor_with_salt_mismatch(self):
+        import time
+
+        request = testing.DummyRequest()
+        self._serialize((time.time(), 0, {'state': 1}))
+        request.cookies['session'] = self._signId('abc123', salt='f.')
+        session = self._makeOne(request)
+        self.assertEqual(dict(session), {})
+
+    def test_ctor_with_signed_non_string(self):
+        request = testing.DummyRequest()
+        request.cookies['session'] = self._signId(1)
+        session = self._makeOne(request)
+        self.assertEqual(dict(session), {})
+
+    def test_new_session_ids(self):
+        first = self._makeOne(testing.DummyRequest())
+        second = self._makeOne(testing.DummyRequest())
+        self.assertEqual(len(first._session_id), 64)
+        self.assertNotEqual(first._session_id, second._session_id)
+
+    def test_invalidate_forgets_state(self):
+        import time
+
+        request = testing.DummyRequest()
+        cookieval = self._serialize((time.time(), 0, {'state': 1}))
+        request.cookies['session'] = cookieval
+        session = self._makeOne(request)
+        self.assertEqual(session['state'], 1)
+        session.invalidate()
+        self.assertEqual(self.store.load('abc123'), None)
+        self.assertNotEqual(session._session_id, 'abc123')
+        session['other'] = 2
+        self._setCookie(session)
+        self.assertEqual(
+            json.loads(self.store.load(session._session_id))[2], {'other': 2}
+        )
+
+
+class SharedSessionStoreTests:
+    def test_instance_conforms(self):
+        from zope.interface.verify import verifyObject
+
+        from pyramid.interfaces import ISessionStore
+
+        verifyObject(ISessionStore, self._makeOne())
+
+    def test_load_missing(self):
+        store = self._makeOne()
+        self.assertEqual(store.load('abc'), None)
+
+    def test_save_load(self):
+        store = self._makeOne()
+        store.save('abc', b'data', 60)
+        store.save('def', b'other', None)
+        self.assertEqual(store.load('abc'), b'data')
+        self.assertEqual(store.load('def'), b'other')
+        store.save('abc', b'new\ndata', 60)
+        self.assertEqual(store.load('abc'), b'new\ndata')
+
+    def test_expired(self):
+        store = self._makeOne()
+        store.save('abc', b'data', -1)
+        self.assertEqual(store.load('abc'), None)
+        store.save('abc', b'data', 60)
+        self.assertEqual(store.load('abc'), b'data')
+
+    def test_delete(self):
+        store = self._makeOne()
+        store.save('abc', b'data', 60)
+        store.delete('abc')
+        self.assertEqual(store.load('abc'), None)
+        store.delete('abc')
+
+    def test_purge(self):
+        store = self._makeOne()
+        store.save('abc', b'data', -1)
+        store.save('def', b'data', None)
+        store.save('fed', b'data', 60)
+        store.purge()
+        self.assertEqual(self._keys(store), ['def', 'fed'])
+
+    def test_purge_interval(self):
+        store = self._makeOne()
+        store.purge_interval = 2
+        store.save('abc', b'data', -1)
+        self.assertEqual(self._keys(store), ['abc'])
+        store.save('def', b'data', 60)
+        self.assertEqual(self._keys(store), ['def'])
+        store.purge_interval = 0
+        store.save('abc', b'data', -1)
+        store.save('fed', b'data', -1)
+        self.assertEqual(self._keys(store), ['abc', 'def', 'fed'])
+
+
+class TestMemorySessionStore(SharedSessionStoreTests, unittest.TestCase):
+    def _makeOne(self, **kw):
+        from pyramid.session import MemorySessionStore
+
+        return MemorySessionStore(**kw)
+
+    def _keys(self, store):
+        return sorted(store._sessions)
+
+    def test_max_entries(self):
+        store = self._makeOne(max_entries=2)
+        store.save('abc', b'data', None)
+        store.save('def', b'data', None)
+        self.assertEqual(store.load('abc'), b'data')
+        store.save('fed', b'data', None)
+        self.assertEqual(list(store._sessions), ['abc', 'fed'])
+
+
+class TestSQLiteSessionStore(SharedSessionStoreTests, unittest.TestCase):
+    def _makeOne(self, path=':memory:', **kw):
+        from pyramid.session import SQLiteSessionStore
+
+        store = SQLiteSessionStore(path, **kw)
+        self.addCleanup(store.close)
+        return store
+
+    def _keys(self, store):
+        rows = store._connection.execute(
+            'SELECT id FROM "%s" ORDER BY id' % store.table
+        )
+        return [row[0] for row in rows]
+
+    def test_shared_database(self):
+        import os
+        import shutil
+        import tempfile
+
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        path = os.path.join(directory, 'sessions.db')
+        store = self._makeOne(path, table='sessions')
+        store.save('abc', b'data', 60)
+        other = self._makeOne(path, table='sessions')
+        self.assertEqual(other.load('abc'), b'data')
+
+    def test_purge_max_entries(self):
+        store = self._makeOne(max_entries=2)
+        store.save('abc', b'data', None)
+        store.save('def', b'data', None)
+        store.save('fed', b'data', 60)
+        store.save('abc', b'data', None)
+        store.purge()
+        self.assertEqual(self._keys(store), ['abc', 'fed'])
+
+
+class TestFileSessionStore(SharedSessionStoreTests, unittest.TestCase):
+    def setUp(self):
+        import os
+        import tempfile
+
+        self.directory = os.path.join(tempfile.mkdtemp(), 'sessions')
+
+    def tearDown(self):
+        import os
+        import shutil
+
+        shutil.rmtree(os.path.dirname(self.directory))
+
+    def _makeOne(self, **kw):
+        from pyramid.session import FileSessionStore
+
+        return FileSessionStore(self.directory, **kw)
+
+    def _setSaved(self, session_id, saved):
+        import os
+
+        path = os.path.join(self.directory, session_id)
+        os.utime(path, (saved, saved))
+
+    def _keys(self, store):
+        import os
+
+        return sorted(os.listdir(self.directory))
+
+    def test_invalid_session_id(self):
+        store = self._makeOne()
+        self.assertRaises(ValueError, store.load, '../abc')
+        self.assertRaises(ValueError, store.save, 'ABC', b'data', None)
+        self.assertRaises(ValueError, store.delete, '')
+
+    def test_corrupt_file(self):
+        import os
+
+        store = self._makeOne()
+        with open(os.path.join(self.directory, 'abc'), 'wb') as f:
+            f.write(b'data')
+        self.assertEqual(store.load('abc'), None)
+
+    def test_corrupt_expiry(self):
+        import os
+
+        store = self._makeOne()
+        with open(os.path.join(self.directory, 'abc'), 'wb') as f:
+            f.write(b'never\ndata')
+        self.assertEqual(store.load('abc'), None)
+
+    def test_save_fails(self):
+        store = self._makeOne()
+        self.assertRaises(TypeError, store.save, 'abc', 'text', None)
+        self.assertEqual(self._keys(store), [])
+
+    def test_purge_ignores_other_files(self):
+        import os
+
+        store = self._makeOne()
+        with open(os.path.join(self.directory, '.tmp'), 'wb') as f:
+            f.write(b'0\ndata')
+        store.purge()
+        self.assertEqual(self._keys(store), ['.tmp'])
+
+    def test_purge_max_entries(self):
+        store = self._makeOne(max_entries=2)
+        store.save('abc', b'data', None)
+        store.save('def', b'data', None)
+        store.save('fed', b'data', 60)
+        store.save('bad', b'data', -1)
+        self._setSaved('abc', 3000)
+        self._setSaved('def', 1000)
+        self._setSaved('fed', 2000)
+        store.purge()
+        self.assertEqual(self._keys(store), ['abc', 'fed'])
+
+    def test_purge_max_entries_deleted_meanwhile(self):
+        store = self._makeOne(max_entries=1)
+        store.save('abc', b'data', None)
+        store.save('def', b'data', None)
+        store.save('fed', b'data', None)
+        self._setSaved('def', 1000)
+        load = store.load
+
+        def racing_load(session_id):
+            data = load(session_id)
+            if session_id == 'abc':
+                store.delete('abc')
+            return data
+
+        store.load = racing_load
+        store.purge()
+        self.assertEqual(self._keys(store), ['fed'])
+
+
 class Test_manage_accessed(unittest.TestCase):
     def _makeOne(self, wrapped):
         from pyramid.session import manage_accessed
@@ -565,6 +1075,30 @@ class Test_manage_changed(unittest.TestCase):
         self.assertTrue(session._dirty)
 
 
+class Test_manage_loaded(unittest.TestCase):
+    def _makeOne(self, wrapped):
+        from pyramid.session import manage_loaded
+
+        return manage_loaded(wrapped)
+
+    def test_it(self):
+        loads = []
+
+        class Session(dict):
+            _loaded = False
+
+            def _load(self):
+                self._loaded = True
+                loads.append(True)
+
+        session = Session()
+        wrapper = self._makeOne(dict.get)
+        self.assertEqual(wrapper(session, 'a', 1), 1)
+        self.assertEqual(wrapper(session, 'a', 2), 2)
+        self.assertEqual(loads, [True])
+        self.assertEqual(wrapper.__doc__, dict.get.__doc__)
+
+
 class TestPickleSerializer(unittest.TestCase):
     """
     .. deprecated:: 2.0
@@ -616,6 +1150,20 @@ class DummySerializer:
         return json.loads(base64.b64decode(value).decode('utf-8'))
 
 
+class DummyCountingSerializer:
+    def __init__(self):
+        self.loaded = 0
+        self.dumped = 0
+
+    def dumps(self, value):
+        self.dumped += 1
+        return json.dumps(value).encode('utf-8')
+
+    def loads(self, value):
+        self.loaded += 1
+        return json.loads(value.decode('utf-8'))
+
+
 class DummySessionFactory(dict):
     _dirty = False
     _cookie_name = 'session'
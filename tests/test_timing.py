@@ -0,0 +1,272 @@
+import asyncio
+import unittest
+
+from pyramid import testing
+
+
+class TestRequestTimings(unittest.TestCase):
+    def _makeOne(self):
+        from pyramid.timing import RequestTimings
+
+        return RequestTimings()
+
+    def test_mark(self):
+        timings = self._makeOne()
+        timings.mark('one')
+        timings.mark('two')
+        (one, start1, end1), (two, start2, end2) = timings.spans
+        self.assertEqual((one, two), ('one', 'two'))
+        self.assertEqual(start1, timings.start)
+        self.assertEqual(end1, start2)
+        self.assertEqual(end2, timings.last)
+        self.assertGreaterEqual(end2, end1)
+        self.assertEqual(timings.total, end2 - start1)
+
+    def test_durations(self):
+        timings = self._makeOne()
+        timings.start = 0
+        timings.spans = [
+            ('ingress', 0, 1),
+            ('inner', 3, 4),
+            ('outer', 2, 6),
+            ('other', 6.5, 7),
+            ('view', 1, 8),
+            ('egress', 8, 10),
+        ]
+        timings.last = 10
+        self.assertEqual(
+            timings.durations(),
+            [
+                ('ingress', 1),
+                ('view', 2.5),
+                ('outer', 3),
+                ('inner', 1),
+                ('other', 0.5),
+                ('egress', 2),
+            ],
+        )
+
+    def test_durations_empty(self):
+        timings = self._makeOne()
+        self.assertEqual(timings.durations(), [])
+        self.assertEqual(timings.total, 0)
+
+
+class TestTimingsLogger(unittest.TestCase):
+    def _makeOne(self, logger):
+        from pyramid.timing import TimingsLogger
+
+        return TimingsLogger(logger)
+
+    def _makeTimings(self):
+        from pyramid.timing import RequestTimings
+
+        timings = RequestTimings()
+        timings.start = 0
+        timings.spans = [('one', 0, 0.001), ('two', 0.001, 0.003)]
+        timings.last = 0.003
+        return timings
+
+    def test_it(self):
+        logger = DummyLogger()
+        sink = self._makeOne(logger)
+        request = testing.DummyRequest(path='/path')
+        sink(request, self._makeTimings())
+        self.assertEqual(
+            logger.messages,
+            ['GET /path 3.000ms (one=1.000ms, two=2.000ms)'],
+        )
+
+    def test_disabled(self):
+        logger = DummyLogger()
+        logger.enabled = False
+        sink = self._makeOne(logger)
+        sink(testing.DummyRequest(), self._makeTimings())
+        self.assertEqual(logger.messages, [])
+
+    def test_logger_name(self):
+        import logging
+
+        sink = self._makeOne('pyramid.tests.timing')
+        self.assertIs(sink.logger, logging.getLogger('pyramid.tests.timing'))
+
+
+class TestLatencyHistogram(unittest.TestCase):
+    def _makeOne(self):
+        from pyramid.timing import LatencyHistogram
+
+        return LatencyHistogram()
+
+    def test_empty(self):
+        histogram = self._makeOne()
+        self.assertEqual(histogram.count, 0)
+        self.assertEqual(histogram.mean, None)
+        self.assertEqual(histogram.percentile(50), None)
+
+    def test_add(self):
+        histogram = self._makeOne()
+        for seconds in (0.0000005, 0.000003, 0.000003, 0.0001):
+            histogram.add(seconds)
+        self.assertEqual(histogram.counts[:3], [1, 0, 2])
+        self.assertEqual(sum(histogram.counts), 4)
+        self.assertEqual(histogram.count, 4)
+        self.assertEqual(histogram.min, 0.0000005)
+        self.assertEqual(histogram.max, 0.0001)
+        self.assertAlmostEqual(histogram.mean, 0.0001065 / 4)
+
+    def test_percentile(self):
+        histogram = self._makeOne()
+        for _ in range(99):
+            histogram.add(0.000003)
+        histogram.add(0.0001)
+        self.assertEqual(histogram.percentile(0), 0.000004)
+        self.assertEqual(histogram.percentile(50), 0.000004)
+        self.assertEqual(histogram.percentile(99), 0.000004)
+        self.assertEqual(histogram.percentile(100), 0.0001)
+
+
+class TestTweenProfile(unittest.TestCase):
+    def _makeOne(self):
+        from pyramid.timing import TweenProfile
+
+        return TweenProfile()
+
+    def test_record(self):
+        profile = self._makeOne()
+        profile.record('name', 0.001)
+        profile.record('name', 0.002)
+        self.assertEqual(profile.histograms['name'].count, 2)
+
+    def test_profiled_excludes_callees(self):
+        import time
+
+        profile = self._makeOne()
+
+        def main(request):
+            time.sleep(0.02)
+            return 'OK'
+
+        def tween(request):
+            return handler(request)
+
+        handler = profile.profiled('main', main)
+        outer = profile.profiled('tween', tween)
+        request = testing.DummyRequest()
+        self.assertEqual(outer(request), 'OK')
+        self.assertEqual(outer.__name__, 'tween')
+        self.assertGreaterEqual(profile.histograms['main'].total, 0.02)
+        self.assertLess(profile.histograms['tween'].total, 0.01)
+        self.assertEqual(request._tween_profile_cell, None)
+
+    def test_profiled_raises(self):
+        profile = self._makeOne()
+
+        def main(request):
+            raise ValueError
+
+        handler = profile.profiled('main', main)
+        self.assertRaises(ValueError, handler, testing.DummyRequest())
+        self.assertEqual(profile.histograms['main'].count, 1)
+
+    def test_profiled_coroutine(self):
+        import asyncio
+
+        profile = self._makeOne()
+
+        def main(request):
+            return 'OK'
+
+        async def tween(request):
+            await asyncio.sleep(0.02)
+            return handler(request)
+
+        handler = profile.profiled('main', main)
+        outer = profile.profiled('tween', tween)
+        request = testing.DummyRequest()
+        self.assertEqual(asyncio.run(outer(request)), 'OK')
+        self.assertEqual(outer.__name__, 'tween')
+        self.assertGreaterEqual(profile.histograms['tween'].total, 0.02)
+        self.assertEqual(profile.histograms['main'].count, 1)
+        self.assertEqual(request._tween_profile_cell, None)
+
+
+class Test_timed_view(unittest.TestCase):
+    def _callFUT(self, view, name):
+        from pyramid.timing import timed_view
+
+        return timed_view(view, name)
+
+    def _makeRequest(self):
+        from pyramid.timing import RequestTimings
+
+        request = testing.DummyRequest()
+        request.timings = RequestTimings()
+        return request
+
+    def test_untimed_request(self):
+        view = self._callFUT(lambda context, request: 'OK', 'deriver')
+        self.assertEqual(view(None, testing.DummyRequest()), 'OK')
+
+    def test_timed_request(self):
+        view = self._callFUT(lambda context, request: 'OK', 'deriver')
+        request = self._makeRequest()
+        self.assertEqual(view(None, request), 'OK')
+        self.assertEqual(
+            [span[0] for span in request.timings.spans], ['deriver']
+        )
+
+    def test_timed_request_raises(self):
+        def raises(context, request):
+            raise ValueError
+
+        view = self._callFUT(raises, 'deriver')
+        request = self._makeRequest()
+        self.assertRaises(ValueError, view, None, request)
+        self.assertEqual(
+            [span[0] for span in request.timings.spans], ['deriver']
+        )
+
+    def test_coroutine(self):
+        from pyramid.asgi import is_coroutine_callable
+
+        async def inner(context, request):
+            return 'OK'
+
+        view = self._callFUT(inner, 'deriver')
+        self.assertTrue(is_coroutine_callable(view))
+        request = self._makeRequest()
+        self.assertEqual(asyncio.run(view(None, request)), 'OK')
+        self.assertEqual(
+            [span[0] for span in request.timings.spans], ['deriver']
+        )
+        untimed = testing.DummyRequest()
+        self.assertEqual(asyncio.run(view(None, untimed)), 'OK')
+
+    def test_returns_awaitable(self):
+        async def inner(context, request):
+            await asyncio.sleep(0.02)
+            return 'OK'
+
+        view = self._callFUT(
+            lambda context, request: inner(context, request), 'deriver'
+        )
+        request = self._makeRequest()
+        awaitable = view(None, request)
+        self.assertEqual(request.timings.spans, [])
+        self.assertEqual(asyncio.run(awaitable), 'OK')
+        ((name, start, end),) = request.timings.spans
+        self.assertEqual(name, 'deriver')
+        self.assertGreaterEqual(end - start, 0.02)
+
+
+class DummyLogger:
+    enabled = True
+
+    def __init__(self):
+        self.messages = []
+
+    def isEnabledFor(self, level):
+        return self.enabled
+
+    def debug(self, msg, *args):
+        self.messages.append(msg % args)
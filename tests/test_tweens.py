@@ -99,6 +99,62 @@ class Test_excview_tween_factory(unittest.TestCase):
         self.assertIsNone(request.exception)
         self.assertIsNone(request.exc_info)
 
+    def test_coroutine_passthrough_no_exception(self):
+        import asyncio
+
+        from pyramid.asgi import coroutine_handler
+
+        dummy_response = DummyResponse()
+
+        async def handler(request):
+            return dummy_response
+
+        tween = coroutine_handler(self._makeOne(handler))
+        request = DummyRequest()
+        result = asyncio.run(tween(request))
+        self.assertTrue(result is dummy_response)
+        self.assertIsNone(request.exception)
+
+    def test_coroutine_catches_with_predicate(self):
+        import asyncio
+
+        from pyramid.asgi import coroutine_handler
+        from pyramid.request import Request
+        from pyramid.response import Response
+        from pyramid.threadlocal import get_current_request
+
+        def excview(request):
+            self.assertIs(get_current_request(), request)
+            return Response('foo')
+
+        self.config.add_view(excview, context=ValueError, request_method='GET')
+
+        async def handler(request):
+            raise ValueError
+
+        tween = coroutine_handler(self._makeOne(handler))
+        request = Request.blank('/')
+        request.registry = self.config.registry
+        result = asyncio.run(tween(request))
+        self.assertTrue(b'foo' in result.body)
+        self.assertIsInstance(request.exception, ValueError)
+        self.assertEqual(request.exception, request.exc_info[1])
+
+    def test_coroutine_reraises_on_no_match(self):
+        import asyncio
+
+        from pyramid.asgi import coroutine_handler
+        from pyramid.request import Request
+
+        def handler(request):
+            raise ValueError
+
+        tween = coroutine_handler(self._makeOne(handler))
+        request = Request.blank('/')
+        request.registry = self.config.registry
+        self.assertRaises(ValueError, asyncio.run, tween(request))
+        self.assertIsNone(request.exception)
+
 
 class DummyRequest:
     exception = None
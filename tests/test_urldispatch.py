@@ -305,6 +305,135 @@ class RoutesMapperTests(unittest.TestCase):
         mapper.routes['abc'] = route
         self.assertEqual(mapper.generate('abc', {}), 123)
 
+    def test_ctor_unknown_matcher(self):
+        klass = self._getTargetClass()
+        self.assertRaises(ValueError, klass, matcher='wat')
+
+    def test___call__after_connect_sees_new_route(self):
+        mapper = self._makeOne()
+        mapper.connect('foo', '/foo')
+        request = self._getRequest(path_info='/bar')
+        self.assertEqual(mapper(request)['route'], None)
+        mapper.connect('bar', '/bar')
+        self.assertEqual(mapper(request)['route'], mapper.routes['bar'])
+
+    def test___call__first_match_wins(self):
+        mapper = self._makeOne()
+        mapper.connect('dynamic', '/foo/{id}')
+        mapper.connect('literal', '/foo/bar')
+        request = self._getRequest(path_info='/foo/bar')
+        result = mapper(request)
+        self.assertEqual(result['route'], mapper.routes['dynamic'])
+        self.assertEqual(result['match'], {'id': 'bar'})
+
+    def test___call__star_and_custom_regex(self):
+        mapper = self._makeOne()
+        mapper.connect('num', '/foo/{id:\\d+}')
+        mapper.connect('mixed', '/foo/{id}.html')
+        mapper.connect('star', '/foo/*rest')
+        request = self._getRequest(path_info='/foo/12')
+        self.assertEqual(mapper(request)['match'], {'id': '12'})
+        request = self._getRequest(path_info='/foo/a.html')
+        self.assertEqual(mapper(request)['match'], {'id': 'a'})
+        request = self._getRequest(path_info='/foo/a/b')
+        self.assertEqual(mapper(request)['match'], {'rest': ('a', 'b')})
+        request = self._getRequest(path_info='/foo/')
+        self.assertEqual(mapper(request)['match'], {'rest': ()})
+        request = self._getRequest(path_info='/foo')
+        self.assertEqual(mapper(request)['route'], None)
+
+    def test___call__literal_route_cached(self):
+        mapper = self._makeOne()
+        mapper.connect('foo', '/foo/{x}')
+        mapper.connect('health', '/health')
+        request = self._getRequest(path_info='/health')
+        result = mapper(request)
+        self.assertEqual(result['route'], mapper.routes['health'])
+        self.assertEqual(mapper._literal_cache, {'/health': result['route']})
+
+        def match(path, request):  # pragma: no cover
+            raise AssertionError('should not be called')
+
+        mapper._match = match
+        result2 = mapper(request)
+        self.assertEqual(result2['route'], mapper.routes['health'])
+        self.assertEqual(result2['match'], {})
+        self.assertIsNot(result2['match'], result['match'])
+
+    def test___call__literal_route_not_cached_behind_matching_route(self):
+        mapper = self._makeOne()
+        preds = [lambda info, request: request.accept]
+        mapper.connect('foo', '/{x}', predicates=preds)
+        mapper.connect('health', '/health')
+        request = self._getRequest(path_info='/health', accept=False)
+        self.assertEqual(mapper(request)['route'], mapper.routes['health'])
+        self.assertEqual(mapper._literal_cache, {'/health': None})
+        request = self._getRequest(path_info='/health', accept=True)
+        self.assertEqual(mapper(request)['route'], mapper.routes['foo'])
+
+    def test___call__literal_route_with_predicates_not_cached(self):
+        mapper = self._makeOne()
+        mapper.connect('health', '/health', predicates=[lambda *arg: True])
+        request = self._getRequest(path_info='/health')
+        self.assertEqual(mapper(request)['route'], mapper.routes['health'])
+        self.assertEqual(mapper._literal_cache, {})
+
+    def test___call__literal_cache_is_bounded(self):
+        mapper = self._makeOne()
+        mapper.literal_cache_size = 1
+        mapper.connect('foo', '/foo')
+        mapper.connect('bar', '/bar')
+        mapper(self._getRequest(path_info='/foo'))
+        mapper(self._getRequest(path_info='/bar'))
+        result = mapper(self._getRequest(path_info='/bar'))
+        self.assertEqual(result['route'], mapper.routes['bar'])
+        self.assertEqual(list(mapper._literal_cache), ['/foo'])
+
+    def test___call__literal_cache_reset_by_connect(self):
+        mapper = self._makeOne()
+        mapper.connect('foo', '/foo')
+        mapper(self._getRequest(path_info='/foo'))
+        mapper.connect('foo', '/bar')
+        result = mapper(self._getRequest(path_info='/foo'))
+        self.assertEqual(result['route'], None)
+
+
+class RoutesMapperTreeTests(RoutesMapperTests):
+    def _makeOne(self):
+        klass = self._getTargetClass()
+        return klass(matcher='tree')
+
+    def test___call__regex_spanning_slashes(self):
+        mapper = self._makeOne()
+        mapper.connect('foo', '/foo/{path:.*}/edit')
+        mapper.connect('bar', '/foo/{id}/edit')
+        request = self._getRequest(path_info='/foo/a/b/edit')
+        result = mapper(request)
+        self.assertEqual(result['route'], mapper.routes['foo'])
+        self.assertEqual(result['match'], {'path': 'a/b'})
+
+    def test___call__empty_segment_does_not_match_marker(self):
+        mapper = self._makeOne()
+        mapper.connect('foo', '/foo/{id}')
+        request = self._getRequest(path_info='/foo/')
+        self.assertEqual(mapper(request)['route'], None)
+
+    def test___call__predicates_fall_through_in_order(self):
+        mapper = self._makeOne()
+        mapper.connect('a', '/{x}/bar', predicates=[lambda *arg: False])
+        mapper.connect('b', '/foo/{y}')
+        mapper.connect('c', '/foo/bar')
+        request = self._getRequest(path_info='/foo/bar')
+        result = mapper(request)
+        self.assertEqual(result['route'], mapper.routes['b'])
+        self.assertEqual(result['match'], {'y': 'bar'})
+
+    def test___call__trailing_newline_uses_patterns(self):
+        mapper = self._makeOne()
+        mapper.connect('foo', '/foo')
+        request = self._getRequest(path_info='/foo\n')
+        self.assertEqual(mapper(request)['route'], mapper.routes['foo'])
+
 
 class TestCompileRoute(unittest.TestCase):
     def _callFUT(self, pattern):
@@ -486,6 +615,231 @@ class TestCompileRoute(unittest.TestCase):
         # should be a native string
         self.assertEqual(type(result), str)
 
+    def test_generate_with_sequence_remainder(self):
+        _, generator = self._callFUT('/abc/{def}/*remainder')
+        result = generator({'def': 'x', 'remainder': ('a b', b'c/d', 1)})
+        self.assertEqual(result, '/abc/x/a%20b/c/d/1')
+
+    def test_generate_ignores_extra_values(self):
+        _, generator = self._callFUT('/abc/{def}')
+        result = generator({'def': 'x y', 'extra': object()})
+        self.assertEqual(result, '/abc/x%20y')
+
+    def test_generate_missing_value(self):
+        _, generator = self._callFUT('/abc/{def}/*remainder')
+        self.assertRaises(KeyError, generator, {'remainder': 'x'})
+        self.assertRaises(KeyError, generator, {'def': 'x'})
+
+    def test_generate_without_markers(self):
+        _, generator = self._callFUT('/a b/c')
+        self.assertEqual(generator({'extra': 1}), '/a%20b/c')
+
+
+class RoutesMapperRegexTests(RoutesMapperTests):
+    def _makeOne(self):
+        klass = self._getTargetClass()
+        return klass(matcher='regex')
+
+    def test___call__predicates_resume_after_rejected_route(self):
+        mapper = self._makeOne()
+        mapper.connect('a', '/foo/{x}', predicates=[lambda *arg: False])
+        mapper.connect('b', '/bar')
+        mapper.connect('c', '/foo/{y}')
+        request = self._getRequest(path_info='/foo/bar')
+        result = mapper(request)
+        self.assertEqual(result['route'], mapper.routes['c'])
+        self.assertEqual(result['match'], {'y': 'bar'})
+
+    def test___call__marker_regex_with_groups(self):
+        mapper = self._makeOne()
+        mapper.connect('a', '/{x:(a|b)}/{y:(?P=x)}')
+        mapper.connect('b', '/{x}/{y}')
+        request = self._getRequest(path_info='/a/a')
+        result = mapper(request)
+        self.assertEqual(result['route'], mapper.routes['a'])
+        self.assertEqual(result['match'], {'x': 'a', 'y': 'a'})
+        request = self._getRequest(path_info='/a/b')
+        result = mapper(request)
+        self.assertEqual(result['route'], mapper.routes['b'])
+        self.assertEqual(result['match'], {'x': 'a', 'y': 'b'})
+
+    def test___call__marker_regex_invalid_on_its_own(self):
+        mapper = self._makeOne()
+        mapper.connect('a', '/{x}/{y:(?P=x)}')
+        mapper.connect('b', '/{x}/{y}')
+        request = self._getRequest(path_info='/a/a')
+        result = mapper(request)
+        self.assertEqual(result['route'], mapper.routes['a'])
+        self.assertEqual(result['match'], {'x': 'a', 'y': 'a'})
+        # the route is matched separately from the alternation
+        self.assertEqual(mapper._match.chunks[0], (None, [mapper.routes['a']]))
+        request = self._getRequest(path_info='/a/b')
+        result = mapper(request)
+        self.assertEqual(result['route'], mapper.routes['b'])
+        self.assertEqual(result['match'], {'x': 'a', 'y': 'b'})
+
+    def test___call__marker_regex_with_flags(self):
+        mapper = self._makeOne()
+        mapper.connect('a', '/foo/{x:(?s:.+)}')
+        mapper.connect('b', '/bar/{x:(?i:abc)}')
+        request = self._getRequest(path_info='/bar/ABC')
+        result = mapper(request)
+        self.assertEqual(result['route'], mapper.routes['b'])
+        self.assertEqual(result['match'], {'x': 'ABC'})
+
+
+class RoutesMapperIndexTests(RoutesMapperTests):
+    def _makeOne(self):
+        klass = self._getTargetClass()
+        return klass(matcher='index')
+
+    def _makeMethodPred(self, val):
+        from pyramid.predicates import RequestMethodPredicate
+
+        return RequestMethodPredicate(val, None)
+
+    def test___call__skips_routes_for_other_methods(self):
+        mapper = self._makeOne()
+        calls = []
+
+        def pred(info, request):
+            calls.append(info['route'].name)
+            return True
+
+        mapper.connect(
+            'post', '/foo', predicates=[pred, self._makeMethodPred('POST')]
+        )
+        mapper.connect(
+            'get', '/foo', predicates=[pred, self._makeMethodPred('GET')]
+        )
+        mapper.connect('any', '/foo', predicates=[pred])
+        request = self._getRequest(path_info='/foo', method='HEAD')
+        result = mapper(request)
+        self.assertEqual(result['route'], mapper.routes['get'])
+        request = self._getRequest(path_info='/foo', method='PATCH')
+        result = mapper(request)
+        self.assertEqual(result['route'], mapper.routes['any'])
+        self.assertEqual(calls, ['get', 'any'])
+
+    def test___call__skips_routes_for_other_prefixes(self):
+        mapper = self._makeOne()
+        mapper.connect('foo', '/foo/{x}')
+        mapper.connect('star', '/*rest')
+        mapper.connect('bar', '/bar/{x}')
+        mapper.routes['foo'].match = None
+        request = self._getRequest(path_info='/bar/baz')
+        result = mapper(request)
+        self.assertEqual(result['route'], mapper.routes['star'])
+        self.assertEqual(result['match'], {'rest': ('bar', 'baz')})
+
+    def test___call__wildcard_prefix_keeps_order(self):
+        mapper = self._makeOne()
+        mapper.connect('x', '/{x}/bar', predicates=[lambda *arg: False])
+        mapper.connect('foo', '/foo/{y}')
+        mapper.connect('z', '/{z}/bar')
+        request = self._getRequest(path_info='/foo/bar')
+        result = mapper(request)
+        self.assertEqual(result['route'], mapper.routes['foo'])
+        request = self._getRequest(path_info='/baz/bar')
+        result = mapper(request)
+        self.assertEqual(result['route'], mapper.routes['z'])
+
+    def test___call__intersects_method_predicates(self):
+        mapper = self._makeOne()
+        calls = []
+
+        def pred(info, request):
+            calls.append(info['route'].name)
+            return True
+
+        mapper.connect(
+            'post',
+            '/foo',
+            predicates=[
+                pred,
+                self._makeMethodPred(('GET', 'POST')),
+                self._makeMethodPred(('POST', 'PUT')),
+            ],
+        )
+        mapper.connect('any', '/foo', predicates=[pred])
+        request = self._getRequest(path_info='/foo', method='PUT')
+        result = mapper(request)
+        self.assertEqual(result['route'], mapper.routes['any'])
+        request = self._getRequest(path_info='/foo', method='POST')
+        result = mapper(request)
+        self.assertEqual(result['route'], mapper.routes['post'])
+        self.assertEqual(calls, ['any', 'post'])
+        entries = mapper._match.entries
+        self.assertEqual(entries[0][2], {'POST'})
+
+    def test___call__unusual_paths_scan_all_routes(self):
+        linear = self._getTargetClass()()
+        mapper = self._makeOne()
+        for routes in (linear, mapper):
+            routes.connect('foo', '/foo')
+            routes.connect('bar', '/bar/{x}')
+            routes.connect('star', '*rest')
+        for path in ('/foo\n', '/bar/a\nb', 'foo', 'bar/baz'):
+            request = self._getRequest(path_info=path)
+            result = mapper(request)
+            expected = linear(request)
+            self.assertEqual(
+                getattr(result['route'], 'name', None),
+                getattr(expected['route'], 'name', None),
+            )
+            self.assertEqual(result['match'], expected['match'])
+        request = self._getRequest(path_info='/foo\n')
+        self.assertEqual(mapper(request)['route'], mapper.routes['foo'])
+        request = self._getRequest(path_info='/bar/a\nb')
+        self.assertEqual(mapper(request)['match'], {'x': 'a\nb'})
+
+
+class TestRouteSegments(unittest.TestCase):
+    def _callFUT(self, pattern):
+        from pyramid.urldispatch import _parse_route, _route_segments
+
+        return _route_segments(*_parse_route(pattern))
+
+    def test_root(self):
+        self.assertEqual(
+            self._callFUT('/'), [('literal', ''), ('literal', '')]
+        )
+
+    def test_literal_and_markers(self):
+        self.assertEqual(
+            self._callFUT('/foo/{bar}/:baz/'),
+            [
+                ('literal', ''),
+                ('literal', 'foo'),
+                ('var', 'bar'),
+                ('literal', ':baz'),
+                ('literal', ''),
+            ],
+        )
+        self.assertEqual(
+            self._callFUT('/foo/:bar'),
+            [('literal', ''), ('literal', 'foo'), ('var', 'bar')],
+        )
+
+    def test_star(self):
+        self.assertEqual(
+            self._callFUT('/foo/*traverse'),
+            [('literal', ''), ('literal', 'foo'), ('star', 'traverse')],
+        )
+        self.assertEqual(
+            self._callFUT('/foo*traverse'),
+            [('literal', ''), ('regex', None)],
+        )
+
+    def test_regex_ends_segments(self):
+        self.assertEqual(
+            self._callFUT('/{foo:a/b}/bar'), [('literal', ''), ('regex', None)]
+        )
+        self.assertEqual(
+            self._callFUT('/foo/{bar}.html/baz'),
+            [('literal', ''), ('literal', 'foo'), ('regex', None)],
+        )
+
 
 class TestCompileRouteFunctional(unittest.TestCase):
     def matches(self, pattern, path, expected):
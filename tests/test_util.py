@@ -423,6 +423,58 @@ class Test_WeakOrderedSet(unittest.TestCase):
         self.assertEqual(wos.last, None)
 
 
+class TestLRUCache(unittest.TestCase):
+    def _makeOne(self):
+        from pyramid.util import LRUCache
+
+        return LRUCache()
+
+    def test_get_missing(self):
+        cache = self._makeOne()
+        self.assertEqual(cache.get('a'), None)
+        self.assertEqual(cache.get('a', 1), 1)
+
+    def test_put_get(self):
+        cache = self._makeOne()
+        self.assertEqual(cache.put('a', 1, 2), 0)
+        self.assertEqual(cache.put('b', 2, 2), 0)
+        self.assertEqual(cache.get('a'), 1)
+        self.assertEqual(list(cache), ['b', 'a'])
+        self.assertEqual(len(cache), 2)
+
+    def test_put_evicts_least_recently_used(self):
+        cache = self._makeOne()
+        cache.put('a', 1, 2)
+        cache.put('b', 2, 2)
+        cache.get('a')
+        self.assertEqual(cache.put('c', 3, 2), 1)
+        self.assertEqual(list(cache), ['a', 'c'])
+        self.assertEqual(cache.put('a', 4, 1), 1)
+        self.assertEqual(list(cache), ['a'])
+        self.assertEqual(cache.get('a'), 4)
+
+    def test_put_disabled(self):
+        cache = self._makeOne()
+        self.assertEqual(cache.put('a', 1, 0), 1)
+        self.assertEqual(len(cache), 0)
+
+    def test_get_while_locked(self):
+        cache = self._makeOne()
+        cache.put('a', 1, 2)
+        cache.put('b', 2, 2)
+        with cache._lock:
+            # another thread is changing the cache; the lookup doesn't wait
+            self.assertEqual(cache.get('a'), 1)
+        self.assertEqual(list(cache), ['a', 'b'])
+
+    def test_pop(self):
+        cache = self._makeOne()
+        cache.put('a', 1, 2)
+        self.assertEqual(cache.pop('a'), 1)
+        self.assertEqual(cache.pop('a'), None)
+        self.assertEqual(len(cache), 0)
+
+
 class Test_strings_differ(unittest.TestCase):
     def _callFUT(self, *args, **kw):
         from pyramid.util import strings_differ
@@ -1231,6 +1283,162 @@ class TestUnboundMethods(unittest.TestCase):
         self.assertFalse(self._callFUT(func))
 
 
+class Test_acceptable_offers(unittest.TestCase):
+    def setUp(self):
+        from pyramid.util import _acceptable_offers
+
+        _acceptable_offers.cache_clear()
+
+    def _callFUT(self, request, offers, header='accept'):
+        from pyramid.util import acceptable_offers
+
+        return acceptable_offers(request, offers, header)
+
+    def test_webob_request(self):
+        from pyramid.request import Request
+        from pyramid.util import _acceptable_offers
+
+        offers = ('text/plain', 'text/html')
+        request = Request.blank('/', headers={'Accept': 'text/html'})
+        self.assertEqual(self._callFUT(request, offers), (('text/html', 1.0),))
+        request = Request.blank('/', headers={'Accept': 'text/html'})
+        self.assertEqual(self._callFUT(request, offers), (('text/html', 1.0),))
+        self.assertEqual(_acceptable_offers.cache_info().hits, 1)
+
+    def test_webob_request_no_header(self):
+        from pyramid.request import Request
+
+        request = Request.blank('/')
+        self.assertEqual(
+            self._callFUT(request, ('text/plain',)), (('text/plain', 1.0),)
+        )
+
+    def test_accept_encoding(self):
+        from pyramid.request import Request
+
+        request = Request.blank('/', headers={'Accept-Encoding': 'gzip'})
+        self.assertEqual(
+            self._callFUT(request, ('br', 'gzip'), 'accept_encoding'),
+            (('gzip', 1.0),),
+        )
+
+    def test_overridden_header(self):
+        from webob.acceptparse import create_accept_header
+
+        from pyramid.request import Request
+
+        class MyRequest(Request):
+            accept = create_accept_header('text/plain')
+
+        request = MyRequest.blank('/', headers={'Accept': 'text/html'})
+        self.assertEqual(
+            self._callFUT(request, ('text/plain', 'text/html')),
+            (('text/plain', 1.0),),
+        )
+
+    def test_dummy_request(self):
+        from pyramid.testing import DummyRequest
+
+        request = DummyRequest(accept='text/html')
+        self.assertEqual(
+            self._callFUT(request, ('text/plain', 'text/html')),
+            (('text/html', 1.0),),
+        )
+
+
+class Test_predicate_key(unittest.TestCase):
+    def _callFUT(self, predicate):
+        from pyramid.util import predicate_key
+
+        return predicate_key(predicate)
+
+    def test_phash(self):
+        predicate = DummyPredicate('a')
+        self.assertEqual(self._callFUT(predicate), (DummyPredicate, 'a'))
+
+    def test_phash_list(self):
+        predicate = DummyPredicate(['a', 'b'])
+        self.assertEqual(
+            self._callFUT(predicate), (DummyPredicate, ('a', 'b'))
+        )
+
+    def test_empty_phash(self):
+        predicate = DummyPredicate('')
+        self.assertIs(self._callFUT(predicate), predicate)
+
+    def test_no_phash(self):
+        def predicate(context, request):
+            """ """
+
+        self.assertIs(self._callFUT(predicate), predicate)
+
+
+class TestPredicateMemo(unittest.TestCase):
+    def _makeOne(self):
+        from pyramid.registry import PredicateMemoStats
+        from pyramid.util import PredicateMemo
+
+        return PredicateMemo(PredicateMemoStats())
+
+    def test_request_only(self):
+        memo = self._makeOne()
+        first = DummyPredicate('a', request_only=True)
+        second = DummyPredicate('a', result=False, request_only=True)
+        self.assertTrue(memo(first, None, None))
+        self.assertTrue(memo(second, None, None))
+        self.assertTrue(memo(first, None, None))
+        self.assertEqual((first.calls, second.calls), (1, 0))
+        self.assertEqual(memo.stats.evaluations, 1)
+        self.assertEqual(memo.stats.saved, 2)
+
+    def test_other_phash(self):
+        memo = self._makeOne()
+        first = DummyPredicate('a', request_only=True)
+        second = DummyPredicate('b', result=False, request_only=True)
+        self.assertTrue(memo(first, None, None))
+        self.assertFalse(memo(second, None, None))
+        self.assertEqual(memo.stats.evaluations, 2)
+
+    def test_not_request_only(self):
+        memo = self._makeOne()
+        predicate = DummyPredicate('a')
+        self.assertTrue(memo(predicate, None, None))
+        self.assertTrue(memo(predicate, None, None))
+        self.assertEqual(predicate.calls, 2)
+        self.assertEqual(memo.stats.evaluations, 0)
+        self.assertEqual(memo.stats.saved, 0)
+
+
+class Test_check_predicates(unittest.TestCase):
+    def _callFUT(self, predicates, context, request):
+        from pyramid.util import check_predicates
+
+        return check_predicates(predicates, context, request)
+
+    def test_without_memo(self):
+        from pyramid.testing import DummyRequest
+
+        predicate = DummyPredicate('a', request_only=True)
+        request = DummyRequest()
+        self.assertTrue(self._callFUT([predicate], None, request))
+        self.assertTrue(self._callFUT([predicate], None, request))
+        self.assertEqual(predicate.calls, 2)
+        self.assertTrue(self._callFUT([], None, None))
+
+    def test_with_memo(self):
+        from pyramid.registry import PredicateMemoStats
+        from pyramid.testing import DummyRequest
+        from pyramid.util import PredicateMemo
+
+        first = DummyPredicate('a', request_only=True)
+        second = DummyPredicate('b', result=False, request_only=True)
+        request = DummyRequest()
+        request._predicate_memo = PredicateMemo(PredicateMemoStats())
+        self.assertFalse(self._callFUT([first, second], None, request))
+        self.assertFalse(self._callFUT([first, second], None, request))
+        self.assertEqual((first.calls, second.calls), (1, 1))
+
+
 class TestReraise(unittest.TestCase):
     def _callFUT(self, *args):
         from pyramid.util import reraise
@@ -1280,3 +1488,18 @@ class TestReraise(unittest.TestCase):
         self.assertIsNot(val2, val)
         self.assertIsInstance(val2, Exception)
         self.assertIs(get_next(tb2), tb)
+
+
+class DummyPredicate:
+    def __init__(self, phash, result=True, request_only=False):
+        self.hash = phash
+        self.result = result
+        self.request_only = request_only
+        self.calls = 0
+
+    def phash(self):
+        return self.hash
+
+    def __call__(self, context, request):
+        self.calls += 1
+        return self.result
@@ -315,6 +315,21 @@ class RenderViewToResponseTests(BaseTest, unittest.TestCase):
         )
         self.assertEqual(response.status, '200 OK')
 
+    def test_call_view_registered_returns_awaitable(self):
+        request = self._makeRequest()
+        context = self._makeContext()
+        response = DummyResponse()
+
+        async def coroutine():
+            return response
+
+        def view(context, request):
+            return coroutine()
+
+        self._registerView(request.registry, view, 'registered')
+        result = self._callFUT(context, request, name='registered')
+        self.assertIs(result, response)
+
     def test_call_view_registered_insecure_no_call_permissive(self):
         context = self._makeContext()
         request = self._makeRequest()
@@ -966,6 +981,250 @@ class Test_view_defaults(unittest.TestCase):
         self.assertEqual(Bar.__view_defaults__, {})
 
 
+class Test_find_views(BaseTest, unittest.TestCase):
+    def _callFUT(self, registry, view_name, **kw):
+        from pyramid.view import _find_views
+
+        return _find_views(registry, IRequest, IContext, view_name, **kw)
+
+    def test_hit(self):
+        registry = self.config.registry
+        view = make_view('OK')
+        self._registerView(registry, view, 'name')
+        self.assertEqual(self._callFUT(registry, 'name'), [view])
+        self.assertEqual(self._callFUT(registry, 'name'), [view])
+        stats = registry.view_lookup_stats
+        self.assertEqual(stats.misses, 1)
+        self.assertEqual(stats.hits, 1)
+        self.assertEqual(stats.negative_stores, 0)
+
+    def test_miss_cached(self):
+        registry = self.config.registry
+        stats = registry.view_lookup_stats
+        self.assertEqual(self._callFUT(registry, 'missing'), [])
+        self.assertEqual(stats.negative_stores, 1)
+        self.assertEqual(stats.negative_hits, 0)
+        self.assertEqual(self._callFUT(registry, 'missing'), [])
+        self.assertEqual(stats.negative_stores, 1)
+        self.assertEqual(stats.negative_hits, 1)
+
+    def test_miss_cleared_with_view_lookup_cache(self):
+        registry = self.config.registry
+        self.assertEqual(self._callFUT(registry, 'name'), [])
+        view = make_view('OK')
+        self._registerView(registry, view, 'name')
+        registry._clear_view_lookup_cache()
+        self.assertEqual(self._callFUT(registry, 'name'), [view])
+
+    def test_miss_keyed_by_classifier(self):
+        from pyramid.interfaces import IExceptionViewClassifier, IView
+
+        registry = self.config.registry
+        view = make_view('OK')
+        registry.registerAdapter(
+            view, (IExceptionViewClassifier, IRequest, IContext), IView, ''
+        )
+        self.assertEqual(self._callFUT(registry, ''), [])
+        self.assertEqual(
+            self._callFUT(
+                registry, '', view_classifier=IExceptionViewClassifier
+            ),
+            [view],
+        )
+
+    def test_miss_cache_bounded(self):
+        registry = self.config.registry
+        registry.view_lookup_miss_cache_size = 2
+        stats = registry.view_lookup_stats
+        self._callFUT(registry, 'one')
+        self._callFUT(registry, 'two')
+        self._callFUT(registry, 'one')
+        self._callFUT(registry, 'three')
+        self.assertEqual(stats.negative_evictions, 1)
+        self.assertEqual(len(registry._view_lookup_misses), 2)
+        # 'two' was the least recently used miss
+        self._callFUT(registry, 'one')
+        self._callFUT(registry, 'two')
+        self.assertEqual(stats.negative_hits, 2)
+        self.assertEqual(stats.negative_stores, 4)
+
+    def test_miss_cache_locked(self):
+        registry = self.config.registry
+        registry.view_lookup_miss_cache_size = 2
+        self._callFUT(registry, 'one')
+        self._callFUT(registry, 'two')
+        with registry._view_lookup_misses._lock:
+            # another thread is updating the cache; the hit doesn't wait
+            self.assertEqual(self._callFUT(registry, 'one'), [])
+        self._callFUT(registry, 'three')
+        self.assertEqual(
+            [key[3] for key in registry._view_lookup_misses], ['two', 'three']
+        )
+        self.assertEqual(registry.view_lookup_stats.negative_hits, 1)
+
+
+class Test_warm_view_lookup_cache(unittest.TestCase):
+    def setUp(self):
+        from pyramid.config import Configurator
+
+        self.config = Configurator()
+
+    def _callFUT(self, registry):
+        from pyramid.view import _warm_view_lookup_cache
+
+        return _warm_view_lookup_cache(registry)
+
+    def _cached(self):
+        from webob.exc import WSGIHTTPException
+        from zope.interface import implementedBy
+
+        # leave out the default exception response view
+        default = implementedBy(WSGIHTTPException)
+        registry = self.config.registry
+        return {
+            key for key in registry._view_lookup_cache if key[1] is not default
+        }
+
+    def test_context_class(self):
+        from zope.interface import implementedBy
+
+        self.config.add_view(make_view('OK'), context=DummyContext, name='a')
+        self.config.commit()
+        self._callFUT(self.config.registry)
+        self.assertEqual(
+            self._cached(), {(IRequest, implementedBy(DummyContext), 'a')}
+        )
+
+    def test_route(self):
+        from zope.interface import implementedBy
+
+        from pyramid.interfaces import IRouteRequest
+
+        self.config.add_route('foo', '/foo')
+        self.config.add_view(
+            make_view('OK'), context=DummyContext, route_name='foo'
+        )
+        self.config.commit()
+        registry = self.config.registry
+        request_iface = registry.getUtility(IRouteRequest, name='foo')
+        self._callFUT(registry)
+        self.assertEqual(
+            self._cached(), {(request_iface, implementedBy(DummyContext), '')}
+        )
+
+    def test_missing_route(self):
+        from pyramid.interfaces import IRouteRequest
+
+        self.config.add_route('foo', '/foo')
+        self.config.add_view(
+            make_view('OK'), context=DummyContext, route_name='foo'
+        )
+        self.config.commit()
+        registry = self.config.registry
+        registry.unregisterUtility(provided=IRouteRequest, name='foo')
+        self._callFUT(registry)
+        self.assertEqual(self._cached(), set())
+
+    def test_exception_view(self):
+        from zope.interface import implementedBy
+
+        from pyramid.interfaces import IExceptionViewClassifier
+
+        self.config.add_view(make_view('OK'), context=ExceptionResponse)
+        self.config.add_view(
+            make_view('OK'), context=ValueError, exception_only=True
+        )
+        self.config.commit()
+        registry = self.config.registry
+        stats = registry.view_lookup_stats
+        self._callFUT(registry)
+        self.assertEqual(
+            self._cached(),
+            {
+                (IRequest, implementedBy(ExceptionResponse), ''),
+                (IRequest, implementedBy(ValueError), ''),
+            },
+        )
+        # the exception view lookups are answered from the cache
+        from pyramid.view import _find_views
+
+        misses = stats.misses
+        _find_views(
+            registry,
+            IRequest,
+            implementedBy(ValueError),
+            '',
+            view_classifier=IExceptionViewClassifier,
+        )
+        self.assertEqual(stats.misses, misses)
+
+    def test_context_from_root_factory(self):
+        from zope.interface import implementedBy
+
+        from pyramid.traversal import DefaultRootFactory
+
+        self.config.add_view(make_view('OK'), context=IContext)
+        self.config.add_view(make_view('OK'), name='a')
+        self.config.commit()
+        self._callFUT(self.config.registry)
+        self.assertEqual(
+            self._cached(),
+            {(IRequest, implementedBy(DefaultRootFactory), 'a')},
+        )
+
+    def test_context_from_route_factory(self):
+        from zope.interface import implementedBy, implementer
+
+        from pyramid.interfaces import IRouteRequest
+
+        @implementer(IContext)
+        class Root:
+            def __init__(self, request):
+                """ """
+
+        self.config.add_route('foo', '/foo', factory=Root)
+        self.config.add_route('bar', '/bar', factory=lambda request: None)
+        self.config.add_view(
+            make_view('OK'), context=IContext, route_name='foo'
+        )
+        self.config.add_view(make_view('OK'), route_name='bar')
+        self.config.commit()
+        registry = self.config.registry
+        request_iface = registry.getUtility(IRouteRequest, name='foo')
+        self._callFUT(registry)
+        self.assertEqual(
+            self._cached(), {(request_iface, implementedBy(Root), '')}
+        )
+
+    def test_exception_view_route_requests(self):
+        from zope.interface import implementedBy
+
+        from pyramid.interfaces import IRouteRequest
+
+        self.config.add_route('foo', '/foo')
+        self.config.add_view(
+            make_view('OK'), context=ValueError, exception_only=True
+        )
+        self.config.commit()
+        registry = self.config.registry
+        request_iface = registry.getUtility(IRouteRequest, name='foo')
+        self._callFUT(registry)
+        self.assertEqual(
+            self._cached(),
+            {
+                (IRequest, implementedBy(ValueError), ''),
+                (request_iface.combined, implementedBy(ValueError), ''),
+            },
+        )
+
+    def test_no_introspector(self):
+        from pyramid.registry import Registry
+
+        registry = Registry()
+        self._callFUT(registry)
+        self.assertEqual(registry._view_lookup_cache, {})
+
+
 class TestViewMethodsMixin(unittest.TestCase):
     def setUp(self):
         self.config = testing.setUp()
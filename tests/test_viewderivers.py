@@ -1,3 +1,4 @@
+import asyncio
 import unittest
 from zope.interface import implementer
 
@@ -188,6 +189,208 @@ class TestDeriveView(unittest.TestCase):
         self.assertFalse(result is view)
         self.assertEqual(result(None, None), response)
 
+    def test_coroutine_function(self):
+        response = DummyResponse()
+
+        async def view(request):
+            return response
+
+        result = self.config.derive_view(view)
+        self.assertFalse(result is view)
+        self.assertEqual(result.__module__, view.__module__)
+        self.assertEqual(
+            asyncio.run(result(None, self._makeRequest())), response
+        )
+
+    def test_coroutine_function_context_and_request(self):
+        response = DummyResponse()
+
+        async def view(context, request):
+            return context
+
+        result = self.config.derive_view(view)
+        self.assertEqual(
+            asyncio.run(result(response, self._makeRequest())), response
+        )
+
+    def test_coroutine_class_with_attr(self):
+        response = DummyResponse()
+
+        class View:
+            def __init__(self, request):
+                self.request = request
+
+            async def index(self):
+                return response
+
+        result = self.config.derive_view(View, attr='index')
+        self.assertEqual(
+            asyncio.run(result(None, self._makeRequest())), response
+        )
+
+    def test_coroutine_function_with_renderer(self):
+        response = DummyResponse()
+
+        class moo:
+            def render_view(inself, req, resp, view_inst, ctx):
+                self.assertEqual(resp, 'OK')
+                self.assertEqual(view_inst, view)
+                return response
+
+            def clone(self):
+                return self
+
+        async def view(request):
+            return 'OK'
+
+        result = self.config.derive_view(view, renderer=moo())
+        request = self._makeRequest()
+        self.assertEqual(asyncio.run(result(None, request)), response)
+
+    def test_coroutine_secured_view(self):
+        from pyramid.httpexceptions import HTTPForbidden
+
+        response = DummyResponse()
+
+        async def view(request):
+            return response
+
+        self.config.registry.settings = {}
+        policy = self._registerSecurityPolicy(False)
+        result = self.config._derive_view(view, permission='view')
+        request = self._makeRequest()
+        self.assertRaises(HTTPForbidden, asyncio.run, result(None, request))
+        policy.permitted = True
+        self.assertEqual(asyncio.run(result(None, request)), response)
+        self.assertEqual(
+            asyncio.run(result.__call_permissive__(None, request)), response
+        )
+        self.assertTrue(result.__permitted__(None, request))
+
+    def test_coroutine_checks_run_in_thread(self):
+        import threading
+
+        from pyramid.response import Response
+
+        threads = []
+
+        class moo:
+            def render_view(inself, req, resp, view_inst, ctx):
+                threads.append(threading.current_thread())
+                return Response(resp)
+
+            def clone(self):
+                return self
+
+        async def view(request):
+            threads.append(threading.current_thread())
+            return 'OK'
+
+        def permits(request, context, permission):
+            threads.append(threading.current_thread())
+            return True
+
+        self.config.registry.settings = {}
+        policy = self._registerSecurityPolicy(True)
+        policy.permits = permits
+        result = self.config._derive_view(
+            view, permission='view', renderer=moo()
+        )
+        response = asyncio.run(result(None, self._makeRequest()))
+        self.assertEqual(response.body, b'OK')
+        check_thread, view_thread, render_thread = threads
+        self.assertIs(view_thread, threading.current_thread())
+        self.assertIsNot(check_thread, view_thread)
+        self.assertIsNot(render_thread, view_thread)
+
+    def test_coroutine_with_debug_authorization(self):
+        response = DummyResponse()
+
+        async def view(request):
+            return response
+
+        self.config.registry.settings = dict(debug_authorization=True)
+        logger = self._registerLogger()
+        result = self.config._derive_view(view, permission='view')
+        request = self._makeRequest()
+        request.view_name = 'view_name'
+        request.url = 'url'
+        self.assertEqual(asyncio.run(result(None, request)), response)
+        self.assertEqual(len(logger.messages), 1)
+
+    def test_coroutine_http_cached_view(self):
+        from pyramid.response import Response
+
+        response = Response('OK')
+
+        async def view(request):
+            return response
+
+        result = self.config._derive_view(view, http_cache=3600)
+        self.assertEqual(
+            asyncio.run(result(None, self._makeRequest())), response
+        )
+        self.assertEqual(response.cache_control.max_age, 3600)
+
+    def test_coroutine_csrf_view(self):
+        from pyramid.exceptions import BadCSRFToken
+
+        response = DummyResponse()
+
+        async def view(request):
+            return response
+
+        request = self._makeRequest()
+        request.scheme = "http"
+        request.method = 'POST'
+        request.session = DummySession({'csrf_token': 'foo'})
+        request.headers = {'X-CSRF-Token': 'bar'}
+        result = self.config._derive_view(view, require_csrf=True)
+        self.assertRaises(BadCSRFToken, asyncio.run, result(None, request))
+        request.headers = {'X-CSRF-Token': 'foo'}
+        self.assertEqual(asyncio.run(result(None, request)), response)
+
+    def test_coroutine_with_wrapper_viewname(self):
+        from pyramid.interfaces import IView, IViewClassifier
+        from pyramid.response import Response
+        from pyramid.threadlocal import get_current_request
+
+        async def inner_view(request):
+            return Response('OK')
+
+        def outer_view(context, request):
+            self.assertIs(get_current_request(), request)
+            return Response(b'outer ' + request.wrapped_body)
+
+        self.config.registry.registerAdapter(
+            outer_view, (IViewClassifier, None, None), IView, 'owrap'
+        )
+        result = self.config._derive_view(
+            inner_view, viewname='inner', wrapper_viewname='owrap'
+        )
+        response = asyncio.run(result(None, self._makeRequest()))
+        self.assertEqual(response.body, b'outer OK')
+
+    def test_coroutine_with_decorator(self):
+        response = DummyResponse()
+        decorated = []
+
+        def decorator(view):
+            def decorated_view(context, request):
+                decorated.append(True)
+                return view(context, request)
+
+            return decorated_view
+
+        async def view(request):
+            return response
+
+        result = self.config._derive_view(view, decorator=decorator)
+        self.assertEqual(
+            asyncio.run(result(None, self._makeRequest())), response
+        )
+        self.assertEqual(decorated, [True])
+
     def test_requestonly_function_with_renderer(self):
         response = DummyResponse()
 
@@ -1696,6 +1899,143 @@ class TestDeriveView(unittest.TestCase):
         response = request.get_response(app)
         self.assertTrue(b'hello' in response.body)
 
+    def _deriveChain(self, calls):
+        from pyramid.interfaces import IView, IViewClassifier
+        from pyramid.response import Response
+
+        def view(context, request):
+            calls.append('view')
+            return Response('OK')
+
+        def outer_view(context, request):
+            calls.append('outer')
+            return Response(b'outer ' + request.wrapped_body)
+
+        def predicate(context, request):
+            calls.append('predicate')
+            return True
+
+        self.config.registry.registerAdapter(
+            outer_view, (IViewClassifier, None, None), IView, 'owrap'
+        )
+        self.config.registry.settings = dict(debug_authorization=True)
+        self._registerLogger()
+        self._registerSecurityPolicy(True)
+        return self.config._derive_view(
+            view,
+            permission='view',
+            predicates=[predicate],
+            phash='phash',
+            http_cache=60,
+            wrapper_viewname='owrap',
+        )
+
+    def _makeChainRequest(self):
+        request = self._makeRequest()
+        request.view_name = 'view_name'
+        request.url = 'url'
+        return request
+
+    def test_fused_derivers(self):
+        calls = []
+        result = self._deriveChain(calls)
+        self.assertFalse(hasattr(result, '__fusable__'))
+        self.assertEqual(result.__phash__, 'phash')
+        self.assertEqual(result.__name__, 'view')
+        self.assertEqual(result.__original_view__.__name__, 'view')
+        request = self._makeChainRequest()
+        response = result(None, request)
+        self.assertEqual(response.body, b'outer OK')
+        self.assertEqual(request.wrapped_response.cache_control.max_age, 60)
+        self.assertEqual(calls, ['predicate', 'view', 'outer'])
+        self.assertTrue(request.authdebug_message.endswith('True'))
+        self.assertTrue(result.__predicated__(None, request))
+        self.assertFalse(hasattr(result.__predicated_view__, '__fusable__'))
+        self.assertFalse(hasattr(result.__call_permissive__, '__fusable__'))
+        response = result.__call_permissive__(None, request)
+        self.assertEqual(response.body, b'outer OK')
+
+    def test_derivers_not_fused_when_timed(self):
+        from pyramid.interfaces import IRequestTimingSink
+
+        self.config.registry.registerUtility(
+            lambda request, timings: None, IRequestTimingSink
+        )
+        calls = []
+        result = self._deriveChain(calls)
+        request = self._makeChainRequest()
+        response = result(None, request)
+        self.assertEqual(response.body, b'outer OK')
+        self.assertEqual(calls, ['predicate', 'view', 'outer'])
+        self.assertTrue(request.authdebug_message.endswith('True'))
+
+
+class Test_fused_view(unittest.TestCase):
+    def _callFUT(self, view):
+        from pyramid.viewderivers import fused_view
+
+        return fused_view(view)
+
+    def _makeStep(self, view, calls, name, check=False, finish=False):
+        from pyramid.viewderivers import fusable_view
+
+        def _check(context, request):
+            calls.append(name)
+
+        def _finish(context, request, response):
+            return response + (name,)
+
+        def wrapper(context, request):
+            _check(context, request)
+            return view(context, request)
+
+        return fusable_view(
+            wrapper,
+            view,
+            check=_check if check else None,
+            finish=_finish if finish else None,
+        )
+
+    def _view(self, context, request):
+        return ('view',)
+
+    def test_checks_only(self):
+        calls = []
+        view = self._makeStep(self._view, calls, 'inner', check=True)
+        view = self._makeStep(view, calls, 'outer', check=True)
+        result = self._callFUT(view)
+        self.assertEqual(result(None, None), ('view',))
+        self.assertEqual(calls, ['outer', 'inner'])
+        self.assertIs(result.__wraps__, view)
+
+    def test_finishers_only(self):
+        view = self._makeStep(self._view, [], 'inner', finish=True)
+        view = self._makeStep(view, [], 'outer', finish=True)
+        result = self._callFUT(view)
+        self.assertEqual(result(None, None), ('view', 'inner', 'outer'))
+
+    def test_single_wrapper(self):
+        view = self._makeStep(self._view, [], 'inner', check=True)
+        self.assertIs(self._callFUT(view), view)
+
+    def test_copied_step_not_fused(self):
+        import functools
+
+        calls = []
+        inner = self._makeStep(self._view, calls, 'inner', check=True)
+
+        @functools.wraps(inner)
+        def copied(context, request):
+            calls.append('copied')
+            return inner(context, request)
+
+        view = self._makeStep(copied, calls, 'outer', check=True)
+        self.assertIs(self._callFUT(view), view)
+        view = self._makeStep(view, calls, 'outermost', check=True)
+        result = self._callFUT(view)
+        self.assertEqual(result(None, None), ('view',))
+        self.assertEqual(calls, ['outermost', 'outer', 'copied', 'inner'])
+
 
 class TestDerivationOrder(unittest.TestCase):
     def setUp(self):
@@ -1837,6 +2177,72 @@ class TestAddDeriver(unittest.TestCase):
         result = self.config._derive_view(view)  # noqa: F841
         self.assertTrue(response.deriv)
 
+    def test_deriver_receives_synchronous_view(self):
+        from pyramid.asgi import is_coroutine_callable
+
+        response = DummyResponse()
+        derived = []
+
+        def deriv(view, info):
+            derived.append(is_coroutine_callable(view))
+            return view
+
+        async def view(request):
+            return response
+
+        self.config.add_view_deriver(deriv, 'test_deriv')
+        result = self.config._derive_view(view)
+        self.assertEqual(derived, [False])
+        request = DummyRequest()
+        request.registry = self.config.registry
+        self.assertEqual(result(None, request), response)
+
+    def test_deriver_receives_synchronous_secured_view(self):
+        from pyramid.interfaces import ISecurityPolicy
+        from pyramid.viewderivers import INGRESS
+
+        response = DummyResponse()
+
+        def deriv(view, info):
+            return view
+
+        async def view(request):
+            return response
+
+        self.config.registry.registerUtility(
+            DummySecurityPolicy(False), ISecurityPolicy
+        )
+        self.config.add_view_deriver(
+            deriv, 'test_deriv', under=INGRESS, over='secured_view'
+        )
+        result = self.config._derive_view(view, permission='view')
+        request = DummyRequest()
+        request.registry = self.config.registry
+        self.assertEqual(result.__call_permissive__(None, request), response)
+
+    def test_deriver_supporting_coroutines(self):
+        from pyramid.asgi import is_coroutine_callable
+
+        response = DummyResponse()
+        derived = []
+
+        def deriv(view, info):
+            derived.append(is_coroutine_callable(view))
+            return view
+
+        deriv.supports_coroutines = True
+
+        async def view(request):
+            return response
+
+        self.config.add_view_deriver(deriv, 'test_deriv')
+        result = self.config._derive_view(view)
+        self.assertEqual(derived, [True])
+        self.assertTrue(is_coroutine_callable(result))
+        request = DummyRequest()
+        request.registry = self.config.registry
+        self.assertEqual(asyncio.run(result(None, request)), response)
+
     def test_override_deriver(self):
         flags = {}
 